@@ -18,6 +18,14 @@ from app.models.step import Step  # noqa: F401
 from app.models.favorite import FavoriteRecipe  # noqa: F401
 from app.models.cooking_history import CookingHistory  # noqa: F401
 from app.models.image import Image  # noqa: F401
+from app.models.recipe_document import RecipeDocument  # noqa: F401
+from app.models.featured_sync import FeaturedSyncConfig, FeaturedSyncJob  # noqa: F401
+from app.models.cooking_stats import (  # noqa: F401
+    CookingActivityStat,
+    CookingCategoryStat,
+    CookingDailyStat,
+    CookingWeeklyStat,
+)
 
 settings = get_settings()
 config = context.config
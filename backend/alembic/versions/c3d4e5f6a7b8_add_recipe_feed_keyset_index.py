@@ -0,0 +1,31 @@
+"""add_recipe_feed_keyset_index
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, None] = 'b2c3d4e5f6a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Seek index for the client feed: ORDER BY created_at DESC, id DESC over active recipes
+    op.create_index(
+        'ix_recipes_active_created_at_id', 'recipes',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recipes_active_created_at_id', table_name='recipes')
@@ -0,0 +1,39 @@
+"""add_favorites_history_keyset_indexes
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d0e1f2a3b4'
+down_revision: Union[str, None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Seek indexes for the per-user listings; they also serve the user_id-only lookups
+    op.create_index(
+        'ix_favorite_recipes_user_created_at_recipe', 'favorite_recipes',
+        ['user_id', sa.text('created_at DESC'), sa.text('recipe_id DESC')],
+    )
+    op.drop_index('ix_favorite_recipes_user', table_name='favorite_recipes')
+    op.create_index(
+        'ix_cooking_history_user_cooked_at_id', 'cooking_history',
+        ['user_id', sa.text('cooked_at DESC'), sa.text('id DESC')],
+    )
+    op.drop_index('ix_cooking_history_user', table_name='cooking_history')
+
+
+def downgrade() -> None:
+    op.create_index('ix_cooking_history_user', 'cooking_history', ['user_id'])
+    op.drop_index('ix_cooking_history_user_cooked_at_id', table_name='cooking_history')
+    op.create_index('ix_favorite_recipes_user', 'favorite_recipes', ['user_id'])
+    op.drop_index('ix_favorite_recipes_user_created_at_recipe', table_name='favorite_recipes')
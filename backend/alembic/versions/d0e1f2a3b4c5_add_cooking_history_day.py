@@ -0,0 +1,55 @@
+"""add_cooking_history_day
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0e1f2a3b4c5'
+down_revision: Union[str, None] = 'c9d0e1f2a3b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('timezone', sa.String(length=64), server_default='Europe/Moscow', nullable=False),
+    )
+    op.add_column(
+        'cooking_history',
+        sa.Column('timezone', sa.String(length=64), server_default='Europe/Moscow', nullable=False),
+    )
+    op.add_column(
+        'cooking_history',
+        sa.Column(
+            'cooked_on', sa.Date(),
+            sa.Computed('(cooked_at AT TIME ZONE timezone)::date', persisted=True),
+            nullable=True,
+        ),
+    )
+    # Same-day duplicates slipped past the old check-then-insert; keep each day's first record
+    op.execute("""
+        DELETE FROM cooking_history AS later
+        USING cooking_history AS earlier
+        WHERE later.user_id = earlier.user_id
+          AND later.cooked_on = earlier.cooked_on
+          AND (later.cooked_at, later.id) > (earlier.cooked_at, earlier.id)
+    """)
+    op.create_unique_constraint(
+        'uq_cooking_history_user_day', 'cooking_history', ['user_id', 'cooked_on'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_cooking_history_user_day', 'cooking_history', type_='unique')
+    op.drop_column('cooking_history', 'cooked_on')
+    op.drop_column('cooking_history', 'timezone')
+    op.drop_column('users', 'timezone')
@@ -0,0 +1,35 @@
+"""add_recipe_sample_key
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Volatile default: every existing row gets its own random() value
+    op.add_column(
+        'recipes',
+        sa.Column('sample_key', sa.Float(), server_default=sa.func.random(), nullable=False),
+    )
+    op.create_index(
+        'ix_recipes_active_sample_key_id', 'recipes', ['sample_key', 'id'],
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recipes_active_sample_key_id', table_name='recipes')
+    op.drop_column('recipes', 'sample_key')
@@ -0,0 +1,62 @@
+"""add_cooking_stats_rollups
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f2a3b4c5d6'
+down_revision: Union[str, None] = 'd0e1f2a3b4c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cooking_daily_stats',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('dishes', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'day'),
+    )
+    op.create_table(
+        'cooking_weekly_stats',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('week_start', sa.Date(), nullable=False),
+        sa.Column('dishes', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'week_start'),
+    )
+    op.create_table(
+        'cooking_category_stats',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('category_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('dishes', sa.Integer(), nullable=False),
+        sa.Column('last_cooked_on', sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'category_id'),
+    )
+    op.create_table(
+        'cooking_activity_stats',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('dishes', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day'),
+    )
+    # Existing history is rolled up by scripts/backfill_cooking_stats.py, run after deploying
+
+
+def downgrade() -> None:
+    op.drop_table('cooking_activity_stats')
+    op.drop_table('cooking_category_stats')
+    op.drop_table('cooking_weekly_stats')
+    op.drop_table('cooking_daily_stats')
@@ -0,0 +1,42 @@
+"""add_trigram_search_indexes
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column) — GIN trigram indexes backing ILIKE '%term%' search
+TRGM_INDEXES = [
+    ('ix_recipes_title_trgm', 'recipes', 'title'),
+    ('ix_ingredients_title_trgm', 'ingredients', 'title'),
+    ('ix_categories_title_trgm', 'categories', 'title'),
+    ('ix_steps_title_trgm', 'steps', 'title'),
+    ('ix_users_username_trgm', 'users', 'username'),
+    ('ix_users_first_name_trgm', 'users', 'first_name'),
+    ('ix_users_last_name_trgm', 'users', 'last_name'),
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRGM_INDEXES:
+        op.create_index(
+            name, table, [column],
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _column in reversed(TRGM_INDEXES):
+        op.drop_index(name, table_name=table)
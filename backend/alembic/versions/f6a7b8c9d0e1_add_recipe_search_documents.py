@@ -0,0 +1,77 @@
+"""add_recipe_search_documents
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of app.utils.translit.TRANSLIT_MAP: multi-letter / empty mappings
+# are applied with replace(), the 1:1 letters with a single translate().
+TRANSLIT_REPLACE = [
+    ('ё', 'yo'), ('ж', 'zh'), ('х', 'kh'), ('ц', 'ts'), ('ч', 'ch'), ('ш', 'sh'),
+    ('щ', 'shch'), ('ъ', ''), ('ь', ''), ('ю', 'yu'), ('я', 'ya'),
+]
+TRANSLIT_FROM = 'абвгдезийклмнопрстуфыэ'
+TRANSLIT_TO = 'abvgdeziyklmnoprstufye'
+
+
+def _transliterate(expr: str) -> str:
+    result = f'lower({expr})'
+    for src, dst in TRANSLIT_REPLACE:
+        result = f"replace({result}, '{src}', '{dst}')"
+    return f"translate({result}, '{TRANSLIT_FROM}', '{TRANSLIT_TO}')"
+
+
+def upgrade() -> None:
+    op.add_column('recipes', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        server_default=sa.text("''::tsvector"), nullable=False,
+    ))
+    op.add_column('recipes', sa.Column('search_translit', sa.Text(), server_default='', nullable=False))
+
+    op.execute(f"""
+        UPDATE recipes AS r SET
+            search_vector =
+                setweight(to_tsvector('russian', r.title), 'A')
+                || setweight(to_tsvector('russian', d.ingredients), 'B')
+                || setweight(to_tsvector('russian', d.categories), 'B')
+                || setweight(to_tsvector('russian', r.description), 'C'),
+            search_translit = {_transliterate("concat_ws(' ', r.title, d.ingredients, d.categories)")}
+        FROM (
+            SELECT rr.id,
+                   (SELECT coalesce(string_agg(i.title, ' '), '')
+                      FROM recipe_ingredients ri JOIN ingredients i ON i.id = ri.ingredient_id
+                     WHERE ri.recipe_id = rr.id) AS ingredients,
+                   (SELECT coalesce(string_agg(c.title, ' '), '')
+                      FROM recipe_categories rc JOIN categories c ON c.id = rc.category_id
+                     WHERE rc.recipe_id = rr.id) AS categories
+            FROM recipes rr
+        ) AS d
+        WHERE d.id = r.id
+    """)
+
+    op.create_index('ix_recipes_search_vector', 'recipes', ['search_vector'], postgresql_using='gin')
+    op.create_index(
+        'ix_recipes_search_translit_trgm', 'recipes', ['search_translit'],
+        postgresql_using='gin', postgresql_ops={'search_translit': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recipes_search_translit_trgm', table_name='recipes')
+    op.drop_index('ix_recipes_search_vector', table_name='recipes')
+    op.drop_column('recipes', 'search_translit')
+    op.drop_column('recipes', 'search_vector')
@@ -12,7 +12,6 @@ from app.core.dependencies import (
     get_pagination,
 )
 from app.models.category import Category
-from app.models.user import User
 from app.schemas.category import (
     CategoryAdminResponse,
     CategoryClientResponse,
@@ -23,6 +22,7 @@ from app.schemas.category import (
 )
 from app.schemas.pagination import PaginatedResponse
 from app.services.category import CategoryService
+from app.services.user_cache import UserPrincipal
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
@@ -30,7 +30,7 @@ router = APIRouter(prefix="/categories", tags=["categories"])
 @router.get("", response_model=list[CategoryClientResponse], status_code=200)
 async def list_categories(
     query: str | None = Query(None),
-    _user: User = Depends(get_current_user),
+    _user: UserPrincipal = Depends(get_current_user),
     service: CategoryService = Depends(get_category_service),
 ) -> list[CategoryClientResponse]:
     return await service.list_client(query=query)
@@ -42,7 +42,7 @@ async def list_categories_admin(
     search: str | None = Query(None),
     slug: str | None = Query(None),
     is_active: bool | None = Query(None),
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: CategoryService = Depends(get_category_service),
 ) -> PaginatedResponse[Category]:
     return await service.list(pagination, search=search, slug=slug, is_active=is_active)
@@ -51,7 +51,7 @@ async def list_categories_admin(
 @router.get("/{category_id}/admin", response_model=CategoryAdminResponse, status_code=200)
 async def get_category_admin(
     category_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: CategoryService = Depends(get_category_service),
 ) -> Category:
     return await service.get_by_id(category_id)
@@ -60,7 +60,7 @@ async def get_category_admin(
 @router.post("/admin", response_model=CategoryAdminResponse, status_code=201)
 async def create_category_admin(
     data: CategoryCreate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: CategoryService = Depends(get_category_service),
 ) -> Category:
     return await service.create(data)
@@ -70,7 +70,7 @@ async def create_category_admin(
 async def update_category_admin(
     category_id: UUID,
     data: CategoryUpdate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: CategoryService = Depends(get_category_service),
 ) -> Category:
     return await service.update(category_id, data)
@@ -79,7 +79,7 @@ async def update_category_admin(
 @router.delete("/{category_id}/admin", response_model=CategoryDeleteResponse, status_code=200)
 async def delete_category_admin(
     category_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: CategoryService = Depends(get_category_service),
 ) -> CategoryDeleteResponse:
     await service.delete(category_id)
@@ -1,18 +1,43 @@
-"""Cooking history API router — recent cooking history endpoint."""
+"""Cooking history API router — paginated and recent cooking history endpoints."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
-from app.core.dependencies import get_cooking_history_service, get_current_user
-from app.models.user import User
-from app.schemas.cooking_history import CookingHistoryRecentResponse, CookingHistoryRecipeInfo
+from app.core.constants import COOKING_STATS_MAX_DAYS
+from app.core.dependencies import (
+    PaginationParams,
+    get_cooking_history_service,
+    get_cooking_stats_service,
+    get_current_admin,
+    get_current_user,
+    get_cursor_pagination,
+)
+from app.schemas.cooking_history import (
+    CookingActivityResponse,
+    CookingHistoryCardResponse,
+    CookingHistoryRecentResponse,
+    CookingHistoryRecipeInfo,
+    CookingStatsResponse,
+)
+from app.schemas.pagination import PaginatedResponse
 from app.services.cooking_history import CookingHistoryService
+from app.services.cooking_stats import CookingStatsService
+from app.services.user_cache import UserPrincipal
 
 router = APIRouter(prefix="/cooking-history", tags=["cooking-history"])
 
 
+@router.get("", response_model=PaginatedResponse[CookingHistoryCardResponse], status_code=200)
+async def list_history(
+    pagination: PaginationParams = Depends(get_cursor_pagination),
+    current_user: UserPrincipal = Depends(get_current_user),
+    service: CookingHistoryService = Depends(get_cooking_history_service),
+) -> PaginatedResponse[CookingHistoryCardResponse]:
+    return await service.list_cards(current_user.id, pagination)
+
+
 @router.get("/recent", response_model=list[CookingHistoryRecentResponse], status_code=200)
 async def get_recent_history(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     service: CookingHistoryService = Depends(get_cooking_history_service),
 ) -> list[CookingHistoryRecentResponse]:
     records = await service.list_recent(current_user.id)
@@ -21,10 +46,28 @@ async def get_recent_history(
             id=record.id,
             cooked_at=record.cooked_at,
             recipe=CookingHistoryRecipeInfo(
-                id=record.recipe.id,
-                title=record.recipe.title,
-                photo_url=record.recipe.photo_url,
+                id=record.recipe_id,
+                title=record.recipe_title,
+                photo_url=record.recipe_photo_url,
             ),
         )
         for record in records
     ]
+
+
+@router.get("/stats", response_model=CookingStatsResponse, status_code=200)
+async def get_stats(
+    days: int = Query(30, ge=1, le=COOKING_STATS_MAX_DAYS, description="Days in the stats window"),
+    current_user: UserPrincipal = Depends(get_current_user),
+    service: CookingStatsService = Depends(get_cooking_stats_service),
+) -> CookingStatsResponse:
+    return await service.user_stats(current_user.id, days)
+
+
+@router.get("/admin/stats", response_model=CookingActivityResponse, status_code=200)
+async def get_activity_admin(
+    days: int = Query(30, ge=1, le=COOKING_STATS_MAX_DAYS, description="Days in the chart"),
+    _admin: UserPrincipal = Depends(get_current_admin),
+    service: CookingStatsService = Depends(get_cooking_stats_service),
+) -> CookingActivityResponse:
+    return await service.activity(days)
@@ -12,7 +12,6 @@ from app.core.dependencies import (
     get_pagination,
 )
 from app.models.ingredient import Ingredient
-from app.models.user import User
 from app.schemas.ingredient import (
     IngredientAdminResponse,
     IngredientCreate,
@@ -22,6 +21,7 @@ from app.schemas.ingredient import (
 )
 from app.schemas.pagination import PaginatedResponse
 from app.services.ingredient import IngredientService
+from app.services.user_cache import UserPrincipal
 
 router = APIRouter(prefix="/ingredients", tags=["ingredients"])
 
@@ -31,7 +31,7 @@ async def list_ingredients(
     pagination: PaginationParams = Depends(get_pagination),
     search: str | None = Query(None),
     slug: str | None = Query(None),
-    _user: User = Depends(get_current_user),
+    _user: UserPrincipal = Depends(get_current_user),
     service: IngredientService = Depends(get_ingredient_service),
 ) -> PaginatedResponse[Ingredient]:
     return await service.list(pagination, search=search, slug=slug, is_active=True)
@@ -43,7 +43,7 @@ async def list_ingredients_admin(
     search: str | None = Query(None),
     slug: str | None = Query(None),
     is_active: bool | None = Query(None),
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: IngredientService = Depends(get_ingredient_service),
 ) -> PaginatedResponse[Ingredient]:
     return await service.list(pagination, search=search, slug=slug, is_active=is_active)
@@ -52,7 +52,7 @@ async def list_ingredients_admin(
 @router.get("/{ingredient_id}/admin", response_model=IngredientAdminResponse, status_code=200)
 async def get_ingredient_admin(
     ingredient_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: IngredientService = Depends(get_ingredient_service),
 ) -> Ingredient:
     return await service.get_by_id(ingredient_id)
@@ -61,7 +61,7 @@ async def get_ingredient_admin(
 @router.post("/admin", response_model=IngredientAdminResponse, status_code=201)
 async def create_ingredient_admin(
     data: IngredientCreate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: IngredientService = Depends(get_ingredient_service),
 ) -> Ingredient:
     return await service.create(data)
@@ -71,7 +71,7 @@ async def create_ingredient_admin(
 async def update_ingredient_admin(
     ingredient_id: UUID,
     data: IngredientUpdate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: IngredientService = Depends(get_ingredient_service),
 ) -> Ingredient:
     return await service.update(ingredient_id, data)
@@ -80,7 +80,7 @@ async def update_ingredient_admin(
 @router.delete("/{ingredient_id}/admin", response_model=IngredientDeleteResponse, status_code=200)
 async def delete_ingredient_admin(
     ingredient_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: IngredientService = Depends(get_ingredient_service),
 ) -> IngredientDeleteResponse:
     await service.delete(ingredient_id)
@@ -90,7 +90,7 @@ async def delete_ingredient_admin(
 @router.get("/{ingredient_id}", response_model=IngredientResponse, status_code=200)
 async def get_ingredient(
     ingredient_id: UUID,
-    _user: User = Depends(get_current_user),
+    _user: UserPrincipal = Depends(get_current_user),
     service: IngredientService = Depends(get_ingredient_service),
 ) -> Ingredient:
     return await service.get_by_id(ingredient_id)
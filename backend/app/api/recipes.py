@@ -4,25 +4,31 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 
+from app.core.constants import RECIPE_BATCH_MAX_IDS
 from app.core.dependencies import (
     PaginationParams,
     get_cooking_history_service,
     get_current_admin,
     get_current_user,
+    get_cursor_pagination,
     get_favorite_service,
+    get_featured_sync_service,
     get_pagination,
     get_recipe_service,
 )
 from app.models.recipe import Recipe
-from app.models.user import User
 from app.schemas.cooking_history import CookingHistoryCreate
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.recipe import (
+    FavoriteBulkRequest,
+    FavoriteBulkResponse,
+    FavoriteCardResponse,
     FavoriteToggleResponse,
-    FeaturedSyncResponse,
+    FeaturedSyncJobResponse,
     FeaturedToggleResponse,
     HistoryToggleResponse,
     RecipeAdminListResponse,
+    RecipeBatchResponse,
     RecipeClientListResponse,
     RecipeCreate,
     RecipeDeleteResponse,
@@ -32,28 +38,40 @@ from app.schemas.recipe import (
 )
 from app.services.cooking_history import CookingHistoryService
 from app.services.favorite import FavoriteService
+from app.services.featured_sync import FeaturedSyncService
 from app.services.recipe import RecipeService
+from app.services.user_cache import UserPrincipal
 
 router = APIRouter(prefix="/recipes", tags=["recipes"])
 
 
 @router.get("", response_model=PaginatedResponse[RecipeClientListResponse], status_code=200)
 async def list_recipes(
-    pagination: PaginationParams = Depends(get_pagination),
+    pagination: PaginationParams = Depends(get_cursor_pagination),
     category_id: UUID | None = Query(None),
     search: str | None = Query(None),
+    search_mode: str = Query(
+        "substring", pattern="^(substring|fulltext)$",
+        description="fulltext: stemmed Russian search over title, description, "
+        "ingredients and categories (Latin queries match the transliteration), ranked",
+    ),
     slug: str | None = Query(None),
     is_in_history: bool | None = Query(None),
     is_favorited: bool | None = Query(None),
     random: bool = Query(False),
-    current_user: User = Depends(get_current_user),
+    seed: int | None = Query(None, description="Shuffle seed for random=true; same seed, same order"),
+    exclude_cooked_days: int | None = Query(
+        None, ge=1, le=365, description="Hide recipes the user cooked within this many days",
+    ),
+    current_user: UserPrincipal = Depends(get_current_user),
     service: RecipeService = Depends(get_recipe_service),
 ) -> PaginatedResponse[RecipeClientListResponse]:
     return await service.list_client(
         pagination, current_user.id,
         category_id=category_id, search=search, slug=slug,
         is_in_history=is_in_history, is_favorited=is_favorited,
-        random=random,
+        random=random, seed=seed, exclude_cooked_days=exclude_cooked_days,
+        search_mode=search_mode,
     )
 
 
@@ -66,7 +84,7 @@ async def list_recipes_admin(
     is_featured: bool | None = Query(None),
     category_id: UUID | None = Query(None),
     sort_by: str | None = Query(None),
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: RecipeService = Depends(get_recipe_service),
 ) -> PaginatedResponse[Recipe]:
     return await service.list(
@@ -78,7 +96,7 @@ async def list_recipes_admin(
 @router.get("/{recipe_id}/admin", response_model=RecipeResponse, status_code=200)
 async def get_recipe_admin(
     recipe_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: RecipeService = Depends(get_recipe_service),
 ) -> Recipe:
     return await service.get_by_id(recipe_id)
@@ -87,7 +105,7 @@ async def get_recipe_admin(
 @router.post("/admin", response_model=RecipeResponse, status_code=201)
 async def create_recipe_admin(
     data: RecipeCreate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: RecipeService = Depends(get_recipe_service),
 ) -> Recipe:
     recipe = await service.create(data)
@@ -98,7 +116,7 @@ async def create_recipe_admin(
 async def update_recipe_admin(
     recipe_id: UUID,
     data: RecipeUpdate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: RecipeService = Depends(get_recipe_service),
 ) -> Recipe:
     await service.update(recipe_id, data)
@@ -108,45 +126,86 @@ async def update_recipe_admin(
 @router.patch("/{recipe_id}/admin/featured", response_model=FeaturedToggleResponse, status_code=200)
 async def toggle_featured(
     recipe_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: RecipeService = Depends(get_recipe_service),
 ) -> FeaturedToggleResponse:
     recipe = await service.toggle_featured(recipe_id)
     return FeaturedToggleResponse(id=recipe.id, is_featured=recipe.is_featured)
 
 
-@router.post("/admin/sync-featured", response_model=FeaturedSyncResponse, status_code=200)
+@router.post("/admin/sync-featured", response_model=FeaturedSyncJobResponse, status_code=202)
 async def sync_featured(
-    _admin: User = Depends(get_current_admin),
-    service: RecipeService = Depends(get_recipe_service),
-) -> FeaturedSyncResponse:
-    added = await service.sync_featured_to_users()
-    return FeaturedSyncResponse(added=added)
+    _admin: UserPrincipal = Depends(get_current_admin),
+    service: FeaturedSyncService = Depends(get_featured_sync_service),
+) -> FeaturedSyncJobResponse:
+    return await service.start()
+
+
+@router.get("/admin/sync-featured/status", response_model=FeaturedSyncJobResponse, status_code=200)
+async def sync_featured_status(
+    _admin: UserPrincipal = Depends(get_current_admin),
+    service: FeaturedSyncService = Depends(get_featured_sync_service),
+) -> FeaturedSyncJobResponse:
+    return await service.status()
 
 
 @router.delete("/{recipe_id}/admin", response_model=RecipeDeleteResponse, status_code=200)
 async def delete_recipe_admin(
     recipe_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: RecipeService = Depends(get_recipe_service),
 ) -> RecipeDeleteResponse:
     await service.delete(recipe_id)
     return RecipeDeleteResponse(id=recipe_id, is_deleted=True)
 
 
+@router.get("/batch", response_model=RecipeBatchResponse, status_code=200)
+async def get_recipes_batch(
+    ids: list[UUID] = Query(
+        ..., min_length=1, max_length=RECIPE_BATCH_MAX_IDS,
+        description="Recipe IDs (repeat the parameter); results follow this order",
+    ),
+    current_user: UserPrincipal = Depends(get_current_user),
+    service: RecipeService = Depends(get_recipe_service),
+) -> RecipeBatchResponse:
+    return await service.get_client_batch(ids, current_user.id)
+
+
+@router.get("/favorites", response_model=PaginatedResponse[FavoriteCardResponse], status_code=200)
+async def list_favorites(
+    pagination: PaginationParams = Depends(get_cursor_pagination),
+    current_user: UserPrincipal = Depends(get_current_user),
+    service: FavoriteService = Depends(get_favorite_service),
+) -> PaginatedResponse[FavoriteCardResponse]:
+    return await service.list_cards(current_user.id, pagination)
+
+
 @router.get("/{recipe_id}", response_model=RecipeDetailResponse, status_code=200)
 async def get_recipe(
     recipe_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     service: RecipeService = Depends(get_recipe_service),
 ) -> RecipeDetailResponse:
     return await service.get_client(recipe_id, current_user.id)
 
 
+@router.post("/favorites/bulk", response_model=FavoriteBulkResponse, status_code=200)
+async def bulk_favorites(
+    data: FavoriteBulkRequest,
+    current_user: UserPrincipal = Depends(get_current_user),
+    service: FavoriteService = Depends(get_favorite_service),
+) -> FavoriteBulkResponse:
+    if data.action == "add":
+        changed = await service.add_many(current_user.id, data.recipe_ids)
+    else:
+        changed = await service.remove_many(current_user.id, data.recipe_ids)
+    return FavoriteBulkResponse(action=data.action, changed=changed)
+
+
 @router.post("/{recipe_id}/favorite", response_model=FavoriteToggleResponse, status_code=200)
 async def add_favorite(
     recipe_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     service: FavoriteService = Depends(get_favorite_service),
 ) -> FavoriteToggleResponse:
     await service.add(current_user.id, recipe_id)
@@ -156,7 +215,7 @@ async def add_favorite(
 @router.delete("/{recipe_id}/favorite", response_model=FavoriteToggleResponse, status_code=200)
 async def remove_favorite(
     recipe_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     service: FavoriteService = Depends(get_favorite_service),
 ) -> FavoriteToggleResponse:
     await service.remove(current_user.id, recipe_id)
@@ -166,7 +225,7 @@ async def remove_favorite(
 @router.post("/{recipe_id}/history", response_model=HistoryToggleResponse, status_code=200)
 async def record_history(
     recipe_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     service: CookingHistoryService = Depends(get_cooking_history_service),
 ) -> HistoryToggleResponse:
     await service.record(current_user.id, CookingHistoryCreate(recipe_id=recipe_id))
@@ -11,10 +11,10 @@ from app.core.dependencies import (
     get_step_service,
 )
 from app.models.step import Step
-from app.models.user import User
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.step import StepAdminResponse, StepCreate, StepDeleteResponse, StepUpdate
 from app.services.step import StepService
+from app.services.user_cache import UserPrincipal
 
 router = APIRouter(prefix="/steps", tags=["steps"])
 
@@ -26,7 +26,7 @@ async def list_steps_admin(
     slug: str | None = Query(None),
     is_active: bool | None = Query(None),
     recipe_id: UUID | None = Query(None, description="Filter by recipe ID"),
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: StepService = Depends(get_step_service),
 ) -> PaginatedResponse[Step]:
     return await service.list_admin(
@@ -37,7 +37,7 @@ async def list_steps_admin(
 @router.get("/{step_id}/admin", response_model=StepAdminResponse, status_code=200)
 async def get_step_admin(
     step_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: StepService = Depends(get_step_service),
 ) -> Step:
     return await service.get_by_id(step_id)
@@ -46,7 +46,7 @@ async def get_step_admin(
 @router.post("/admin", response_model=StepAdminResponse, status_code=201)
 async def create_step_admin(
     data: StepCreate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: StepService = Depends(get_step_service),
 ) -> Step:
     return await service.create(data)
@@ -56,7 +56,7 @@ async def create_step_admin(
 async def update_step_admin(
     step_id: UUID,
     data: StepUpdate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: StepService = Depends(get_step_service),
 ) -> Step:
     return await service.update(step_id, data)
@@ -65,7 +65,7 @@ async def update_step_admin(
 @router.delete("/{step_id}/admin", response_model=StepDeleteResponse, status_code=200)
 async def delete_step_admin(
     step_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: StepService = Depends(get_step_service),
 ) -> StepDeleteResponse:
     await service.delete(step_id)
@@ -21,19 +21,20 @@ from app.schemas.user import (
     UserUpdate,
 )
 from app.services.user import UserService
+from app.services.user_cache import UserPrincipal
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/me", response_model=UserResponse, status_code=200)
-async def get_me(current_user: User = Depends(get_current_user)) -> User:
+async def get_me(current_user: UserPrincipal = Depends(get_current_user)) -> UserPrincipal:
     return current_user
 
 
 @router.patch("/me", response_model=UserResponse, status_code=200)
 async def update_me(
     data: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     service: UserService = Depends(get_user_service),
 ) -> User:
     return await service.update(current_user.id, data)
@@ -43,7 +44,7 @@ async def update_me(
 async def list_users_admin(
     pagination: PaginationParams = Depends(get_pagination),
     search: str | None = Query(None),
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: UserService = Depends(get_user_service),
 ) -> PaginatedResponse[User]:
     return await service.list(pagination, search=search)
@@ -52,7 +53,7 @@ async def list_users_admin(
 @router.get("/{user_id}/admin", response_model=UserAdminResponse, status_code=200)
 async def get_user_admin(
     user_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: UserService = Depends(get_user_service),
 ) -> User:
     return await service.get_by_id(user_id)
@@ -61,7 +62,7 @@ async def get_user_admin(
 @router.post("/{user_id}/admin", response_model=UserAdminResponse, status_code=201)
 async def create_user_admin(
     data: UserCreate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: UserService = Depends(get_user_service),
 ) -> User:
     return await service.create(data)
@@ -71,7 +72,7 @@ async def create_user_admin(
 async def update_user_admin(
     user_id: UUID,
     data: UserUpdate,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: UserService = Depends(get_user_service),
 ) -> User:
     return await service.update(user_id, data)
@@ -80,7 +81,7 @@ async def update_user_admin(
 @router.delete("/{user_id}/admin", response_model=UserDeleteResponse, status_code=200)
 async def delete_user_admin(
     user_id: UUID,
-    _admin: User = Depends(get_current_admin),
+    _admin: UserPrincipal = Depends(get_current_admin),
     service: UserService = Depends(get_user_service),
 ) -> UserDeleteResponse:
     await service.delete(user_id)
@@ -37,6 +37,40 @@ class Settings(BaseSettings):
 
     telegram_bot_token: str = ""
 
+    password_hash_workers: int = Field(
+        default=2, ge=1, description="Threads per worker process running bcrypt",
+    )
+    password_hash_queue: int = Field(
+        default=8, ge=0,
+        description="bcrypt calls allowed to wait for a thread before logins get 429",
+    )
+
+    rate_limit_enabled: bool = True
+    rate_limit_auth_per_minute: int = Field(
+        default=10, ge=1, description="Logins and token refreshes per client IP",
+    )
+    rate_limit_upload_per_minute: int = Field(
+        default=20, ge=1, description="File uploads per user (per IP without a valid token)",
+    )
+    rate_limit_toggle_per_minute: int = Field(
+        default=120, ge=1, description="Favorite and cooking history toggles per user",
+    )
+    forwarded_allow_ips: str = Field(
+        default="127.0.0.1",
+        description=(
+            "Comma-separated proxy IPs or networks, or *, whose X-Forwarded-For and "
+            "X-Forwarded-Proto name the client; per-IP rate limits key on that client"
+        ),
+    )
+
+    virtual_featured_favorites: bool = Field(
+        default=False,
+        description=(
+            "Resolve featured recipes as favorites at read time instead of copying them "
+            "into every user's favorites; switching back to copies requires a featured sync"
+        ),
+    )
+
     cors_origins: str = ""
 
     app_env: str = "development"
@@ -4,3 +4,24 @@ TOKEN_TYPE = "Bearer"
 DEFAULT_UPLOAD_SUBDIR = "general"
 UPLOADS_DIR = "uploads"
 REDIS_BLACKLIST_VALUE = "1"
+REDIS_HEALTH_CHECK_INTERVAL = 30
+REVOCATION_SCAN_COUNT = 1000
+REVOCATION_PRUNE_INTERVAL = 60
+RECIPE_BATCH_MAX_IDS = 50
+FAVORITES_BULK_MAX_IDS = 100
+FEATURED_SYNC_CHUNK_SIZE = 5000
+FEATURED_SYNC_LOCK_TTL = 60
+FEATURED_SYNC_LOCK_RETRY = 5
+USER_CACHE_TTL = 60
+USER_CACHE_MAX_SIZE = 10_000
+VERIFIED_TOKEN_CACHE_SIZE = 10_000
+ADMIN_ROLE = "admin"
+USER_ROLE = "user"
+ADMIN_CACHE_TTL = 10
+DEFAULT_TIMEZONE = "Europe/Moscow"
+COOKING_STATS_MAX_DAYS = 365
+COOKING_STATS_TOP_CATEGORIES = 5
+RATE_LIMIT_KEY_PREFIX = "rl:"
+RATE_LIMIT_LOCAL_MAX_BUCKETS = 10_000
+RATE_LIMIT_REDIS_TIMEOUT = 0.5
+RATE_LIMIT_REDIS_RETRY = 5
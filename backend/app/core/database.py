@@ -1,5 +1,9 @@
 """Async database engine and session factory."""
 
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+import structlog
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -9,6 +13,7 @@ from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import get_settings
 
+logger = structlog.get_logger()
 settings = get_settings()
 
 engine = create_async_engine(
@@ -27,5 +32,39 @@ async_session_factory = async_sessionmaker(
 )
 
 
+_AFTER_COMMIT = "after_commit"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run ``callback`` once the session's transaction has committed; dropped on rollback.
+
+    For cache invalidations: run earlier, a concurrent reader could cache the
+    pre-commit state again right after them.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    """Run and clear the callbacks registered with after_commit; errors are logged."""
+    for callback in session.info.pop(_AFTER_COMMIT, []):
+        try:
+            await callback()
+        except Exception:
+            logger.exception("after_commit_failed")
+
+
+def discard_after_commit(session: AsyncSession) -> None:
+    session.info.pop(_AFTER_COMMIT, None)
+
+
+@asynccontextmanager
+async def transaction_scope() -> AsyncIterator[AsyncSession]:
+    """Session for work outside a request; commits when the block exits cleanly."""
+    async with async_session_factory() as session:
+        async with session.begin():
+            yield session
+        await run_after_commit(session)
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
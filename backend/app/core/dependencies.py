@@ -1,16 +1,24 @@
 """Shared FastAPI dependencies — DI wiring for sessions, auth, services."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager
+from uuid import UUID
 
 from fastapi import Depends, Query
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import async_session_factory
+from app.core.database import (
+    async_session_factory,
+    discard_after_commit,
+    run_after_commit,
+    transaction_scope,
+)
 from app.core.exceptions import ForbiddenException, UnauthorizedException
 from app.core.redis import get_redis as _get_redis
-from app.core.security import decode_token
+from app.core.constants import ADMIN_ROLE
+from app.core.security import decode_claims
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
@@ -24,7 +32,14 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.commit()
         except Exception:
             await session.rollback()
+            discard_after_commit(session)
             raise
+        await run_after_commit(session)
+
+
+def get_session_scope() -> Callable[[], AbstractAsyncContextManager[AsyncSession]]:
+    """Factory of self-committing sessions for work that outlives the request."""
+    return transaction_scope
 
 
 # ── Redis ────────────────────────────────────────────────────────────────────
@@ -35,34 +50,63 @@ async def get_redis_dep() -> Redis:
 
 # ── Auth ─────────────────────────────────────────────────────────────────────
 
-async def get_current_user(
+async def get_access_claims(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> dict:
+    if credentials is None:
+        raise UnauthorizedException("Authorization header missing")
+    return decode_claims(credentials.credentials, expected_type="access")
+
+
+async def get_current_user(
+    claims: dict = Depends(get_access_claims),
     db: AsyncSession = Depends(get_db_session),
-):  # -> User (deferred to avoid circular import)
-    from app.models.user import User
+):  # -> UserPrincipal (deferred to avoid circular import)
+    """Principal of the access token's subject; the database is read only on a cache miss.
+
+    The session is lazy: a cache hit never checks out a connection.
+    """
     from app.repositories.user import UserRepository
+    from app.services.user_cache import UserPrincipal, user_cache
 
-    if credentials is None:
-        raise UnauthorizedException("Authorization header missing")
+    user_id = UUID(claims["sub"])
 
-    user_id = decode_token(credentials.credentials, expected_type="access")
+    principal = user_cache.get(user_id)
+    if principal is not None:
+        return principal
 
-    repo = UserRepository(db)
-    user: User | None = await repo.get_or_none(user_id)
+    version = user_cache.version
+    user = await UserRepository(db).get_or_none(user_id)
     if user is None:
         raise UnauthorizedException("User not found")
-    return user
+    principal = UserPrincipal.from_user(user)
+    user_cache.put(principal, version)
+    return principal
 
 
 async def get_current_admin(
+    claims: dict = Depends(get_access_claims),
     current_user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db_session),
-):  # -> User (deferred to avoid circular import)
+):  # -> UserPrincipal (deferred to avoid circular import)
+    """The current user, if the token was issued by admin login and they are still an admin.
+
+    Membership is checked against the per-worker admin set, so the database is
+    read only when that set is reloaded. Tokens issued before the role claim
+    existed have none and are authorized by that set alone, as they were then;
+    they are gone once those refresh tokens expire.
+    """
     from app.repositories.user import UserRepository
+    from app.services.admin_cache import admin_cache
+
+    if claims.get("role", ADMIN_ROLE) != ADMIN_ROLE:
+        raise ForbiddenException("Admin access required")
 
-    repo = UserRepository(db)
-    admin = await repo.get_admin_by_user_id(current_user.id)
-    if admin is None:
+    admin_ids = admin_cache.get()
+    if admin_ids is None:
+        version = admin_cache.version
+        admin_ids = admin_cache.put(await UserRepository(db).list_admin_user_ids(), version)
+    if current_user.id not in admin_ids:
         raise ForbiddenException("Admin access required")
     return current_user
 
@@ -74,42 +118,99 @@ class PaginationParams:
         self,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> None:
         self.limit = limit
         self.offset = offset
+        self.cursor = cursor
+        self.include_total = include_total
 
 
 def get_pagination(
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     offset: int = Query(0, ge=0, description="Number of items to skip"),
+    include_total: bool = Query(True, description="Count all matches; when false only has_more is set"),
+) -> PaginationParams:
+    return PaginationParams(limit=limit, offset=offset, include_total=include_total)
+
+
+def get_cursor_pagination(
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    offset: int = Query(0, ge=0, description="Number of items to skip (legacy, prefer cursor)"),
+    cursor: str | None = Query(
+        None, description="Opaque next_cursor from the previous page; supersedes offset",
+    ),
+    include_total: bool = Query(True, description="Count all matches; when false only has_more is set"),
 ) -> PaginationParams:
-    return PaginationParams(limit=limit, offset=offset)
+    return PaginationParams(limit=limit, offset=offset, cursor=cursor, include_total=include_total)
 
 
 # ── Service factories (Phase 4 DI) ──────────────────────────────────────────
 
-async def get_user_service(db: AsyncSession = Depends(get_db_session)):
+async def get_cooking_stats_service(db: AsyncSession = Depends(get_db_session)):
+    from app.services.cooking_stats import CookingStatsService
+    from app.repositories.cooking_stats import CookingStatsRepository
+    return CookingStatsService(CookingStatsRepository(db))
+
+
+async def get_user_service(
+    db: AsyncSession = Depends(get_db_session),
+    redis: Redis = Depends(get_redis_dep),
+    stats=Depends(get_cooking_stats_service),
+):
     from app.services.user import UserService
     from app.repositories.user import UserRepository
-    return UserService(UserRepository(db))
+    return UserService(UserRepository(db), redis, stats)
+
+
+async def get_catalog_cache(
+    db: AsyncSession = Depends(get_db_session),
+    redis: Redis = Depends(get_redis_dep),
+):
+    from app.services.catalog_cache import CatalogCache
+    return CatalogCache(redis, db)
 
 
-async def get_category_service(db: AsyncSession = Depends(get_db_session)):
+async def get_category_service(
+    db: AsyncSession = Depends(get_db_session),
+    catalog_cache=Depends(get_catalog_cache),
+):
     from app.services.category import CategoryService
     from app.repositories.category import CategoryRepository
-    return CategoryService(CategoryRepository(db))
+    return CategoryService(CategoryRepository(db), catalog_cache)
 
 
-async def get_ingredient_service(db: AsyncSession = Depends(get_db_session)):
+async def get_ingredient_service(
+    db: AsyncSession = Depends(get_db_session),
+    catalog_cache=Depends(get_catalog_cache),
+):
     from app.services.ingredient import IngredientService
     from app.repositories.ingredient import IngredientRepository
-    return IngredientService(IngredientRepository(db))
+    return IngredientService(IngredientRepository(db), catalog_cache)
+
+
+async def get_membership_service(
+    db: AsyncSession = Depends(get_db_session),
+    redis: Redis = Depends(get_redis_dep),
+):
+    from app.services.membership import MembershipService
+    from app.repositories.cooking_history import CookingHistoryRepository
+    from app.repositories.favorite import FavoriteRepository
+    return MembershipService(
+        redis, db, FavoriteRepository(db), CookingHistoryRepository(db),
+    )
 
 
-async def get_recipe_service(db: AsyncSession = Depends(get_db_session)):
+async def get_recipe_service(
+    db: AsyncSession = Depends(get_db_session),
+    membership=Depends(get_membership_service),
+    catalog_cache=Depends(get_catalog_cache),
+    stats=Depends(get_cooking_stats_service),
+):
     from app.services.recipe import RecipeService
     from app.repositories.recipe import RecipeRepository
-    return RecipeService(RecipeRepository(db))
+    return RecipeService(RecipeRepository(db), membership, catalog_cache, stats)
 
 
 async def get_step_service(db: AsyncSession = Depends(get_db_session)):
@@ -124,16 +225,31 @@ async def get_image_service(db: AsyncSession = Depends(get_db_session)):
     return ImageService(ImageRepository(db))
 
 
-async def get_favorite_service(db: AsyncSession = Depends(get_db_session)):
+async def get_favorite_service(
+    db: AsyncSession = Depends(get_db_session),
+    membership=Depends(get_membership_service),
+):
     from app.services.favorite import FavoriteService
     from app.repositories.favorite import FavoriteRepository
-    return FavoriteService(FavoriteRepository(db))
+    return FavoriteService(FavoriteRepository(db), membership)
 
 
-async def get_cooking_history_service(db: AsyncSession = Depends(get_db_session)):
+async def get_cooking_history_service(
+    db: AsyncSession = Depends(get_db_session),
+    membership=Depends(get_membership_service),
+    stats=Depends(get_cooking_stats_service),
+):
     from app.services.cooking_history import CookingHistoryService
     from app.repositories.cooking_history import CookingHistoryRepository
-    return CookingHistoryService(CookingHistoryRepository(db))
+    return CookingHistoryService(CookingHistoryRepository(db), membership, stats)
+
+
+async def get_featured_sync_service(
+    session_scope=Depends(get_session_scope),
+    redis: Redis = Depends(get_redis_dep),
+):
+    from app.services.featured_sync import FeaturedSyncService
+    return FeaturedSyncService(session_scope, redis)
 
 
 async def get_auth_service(
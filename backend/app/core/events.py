@@ -0,0 +1,117 @@
+"""Cross-worker invalidation events over Redis pub/sub.
+
+In-process caches register a handler per channel at import time; each worker
+runs one listener task that dispatches published messages to those handlers.
+Pub/sub is fire-and-forget: a worker that was disconnected may have missed
+messages, so after every (re)subscribe each channel's ``resync`` callback runs
+and the cache starts over. Caches that must not be trusted while messages may
+be missed also register ``on_disconnect``, called as soon as the connection fails.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = structlog.get_logger()
+
+LISTENER_RETRY_SECONDS = 1.0
+LISTENER_MAX_RETRY_SECONDS = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class _Subscription:
+    handler: Callable[[str], None]
+    resync: Callable[[], None] | None
+    on_disconnect: Callable[[], None] | None
+
+
+_subscriptions: dict[str, list[_Subscription]] = {}
+_listener: asyncio.Task[None] | None = None
+
+
+def subscribe(
+    channel: str,
+    handler: Callable[[str], None],
+    *,
+    resync: Callable[[], None] | None = None,
+    on_disconnect: Callable[[], None] | None = None,
+) -> None:
+    """Call ``handler`` with every message published on ``channel`` by any worker."""
+    _subscriptions.setdefault(channel, []).append(_Subscription(handler, resync, on_disconnect))
+
+
+async def publish(redis: Redis, channel: str, message: str) -> None:
+    """Broadcast ``message`` to the other workers; local state is the caller's to update.
+
+    Redis errors are logged and swallowed: subscribers converge through their own expiry.
+    """
+    try:
+        await redis.publish(channel, message)
+    except RedisError as exc:
+        logger.warning("event_publish_failed", channel=channel, error=str(exc))
+
+
+def dispatch(channel: str, message: str) -> None:
+    for subscription in _subscriptions.get(channel, ()):
+        try:
+            subscription.handler(message)
+        except Exception:
+            logger.exception("event_handler_failed", channel=channel)
+
+
+def _resync() -> None:
+    for subscriptions in _subscriptions.values():
+        for subscription in subscriptions:
+            if subscription.resync is not None:
+                subscription.resync()
+
+
+def _disconnected() -> None:
+    for subscriptions in _subscriptions.values():
+        for subscription in subscriptions:
+            if subscription.on_disconnect is not None:
+                subscription.on_disconnect()
+
+
+async def _listen(redis: Redis) -> None:
+    delay = LISTENER_RETRY_SECONDS
+    while True:
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(*_subscriptions)
+            _resync()
+            delay = LISTENER_RETRY_SECONDS
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    dispatch(message["channel"], message["data"])
+        except RedisError as exc:
+            logger.warning("event_listener_disconnected", error=str(exc), retry_in=delay)
+            _disconnected()
+        finally:
+            await pubsub.aclose()
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, LISTENER_MAX_RETRY_SECONDS)
+
+
+def start_event_listener(redis: Redis) -> None:
+    """Start this worker's listener task; a no-op if it is already running."""
+    global _listener
+    if _listener is None and _subscriptions:
+        _listener = asyncio.create_task(_listen(redis))
+
+
+async def stop_event_listener() -> None:
+    global _listener
+    if _listener is None:
+        return
+    _listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _listener
+    _listener = None
@@ -17,12 +17,14 @@ class AppException(Exception):
         detail: str,
         error_type: str = "about:blank",
         extra: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.status = status
         self.title = title
         self.detail = detail
         self.error_type = error_type
         self.extra = extra or {}
+        self.headers = headers
         super().__init__(detail)
 
 
@@ -68,17 +70,31 @@ class BadRequestException(AppException):
         )
 
 
+class TooManyRequestsException(AppException):
+    def __init__(self, detail: str, retry_after: int) -> None:
+        super().__init__(
+            status=429, title="Too Many Requests", detail=detail,
+            error_type="errors/too_many_requests",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+def problem_response(exc: AppException, instance: str) -> JSONResponse:
+    """RFC 7807 response for ``exc``; also used by middleware that answers before routing."""
+    body: dict[str, Any] = {
+        "type": exc.error_type,
+        "title": exc.title,
+        "status": exc.status,
+        "detail": exc.detail,
+        "instance": instance,
+    }
+    body.update(exc.extra)
+    return JSONResponse(status_code=exc.status, content=body, headers=exc.headers)
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """Register RFC 7807 error handlers on the FastAPI app."""
 
     @app.exception_handler(AppException)
     async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
-        body: dict[str, Any] = {
-            "type": exc.error_type,
-            "title": exc.title,
-            "status": exc.status,
-            "detail": exc.detail,
-            "instance": str(request.url),
-        }
-        body.update(exc.extra)
-        return JSONResponse(status_code=exc.status, content=body)
+        return problem_response(exc, str(request.url))
@@ -0,0 +1,112 @@
+"""Password hashing — bcrypt off the event loop, in a bounded thread pool."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+import bcrypt
+import structlog
+
+from app.core.config import get_settings
+from app.core.exceptions import TooManyRequestsException
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+PASSWORD_QUEUE_RETRY_AFTER = 1
+# Waits longer than this are logged, so a login burst shows up without scraping stats
+PASSWORD_QUEUE_SLOW_WAIT = 0.5
+
+
+@dataclass(slots=True)
+class PasswordPoolStats:
+    """Counters since startup; a wait is the time from submission until a thread starts the job."""
+
+    completed: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["avg_wait"] = self.total_wait / self.completed if self.completed else 0.0
+        return data
+
+
+class PasswordHasher:
+    """Runs bcrypt on ``workers`` threads with at most ``max_queue`` jobs waiting for one.
+
+    Each bcrypt call holds a thread for hundreds of milliseconds. Past the
+    queue limit a call fails at once with 429 instead of queueing a wait the
+    client would give up on anyway.
+    """
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self.max_in_flight = workers + max_queue
+        self.stats = PasswordPoolStats()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._run(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt())
+        return hashed.decode("utf-8")
+
+    async def check(self, password: str, password_hash: str) -> bool:
+        return await self._run(
+            bcrypt.checkpw, password.encode("utf-8"), password_hash.encode("utf-8"),
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.stats.in_flight >= self.max_in_flight:
+            self.stats.rejected += 1
+            logger.warning("password_queue_full", in_flight=self.stats.in_flight)
+            raise TooManyRequestsException(
+                "Too many logins in progress, try again shortly",
+                retry_after=PASSWORD_QUEUE_RETRY_AFTER,
+            )
+
+        submitted_at = time.perf_counter()
+
+        def job() -> tuple[float, T]:
+            return time.perf_counter() - submitted_at, func(*args)
+
+        self.stats.in_flight += 1
+        try:
+            wait, result = await asyncio.get_running_loop().run_in_executor(self._executor, job)
+        finally:
+            self.stats.in_flight -= 1
+
+        self.stats.completed += 1
+        self.stats.total_wait += wait
+        self.stats.max_wait = max(self.stats.max_wait, wait)
+        if wait > PASSWORD_QUEUE_SLOW_WAIT:
+            logger.warning("password_queue_slow", wait_ms=round(wait * 1000))
+        return result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return this worker's shared hasher, creating it on first call."""
+    global _hasher
+    if _hasher is None:
+        settings = get_settings()
+        _hasher = PasswordHasher(settings.password_hash_workers, settings.password_hash_queue)
+    return _hasher
+
+
+def close_password_hasher() -> None:
+    global _hasher
+    if _hasher is not None:
+        _hasher.shutdown()
+        _hasher = None
@@ -0,0 +1,250 @@
+"""Rate limiting — token buckets in Redis per route group and client, as ASGI middleware."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import structlog
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import Settings, get_settings
+from app.core.constants import (
+    RATE_LIMIT_KEY_PREFIX,
+    RATE_LIMIT_LOCAL_MAX_BUCKETS,
+    RATE_LIMIT_REDIS_RETRY,
+    RATE_LIMIT_REDIS_TIMEOUT,
+)
+from app.core.exceptions import (
+    TooManyRequestsException,
+    UnauthorizedException,
+    problem_response,
+)
+from app.core.redis import get_redis
+from app.core.security import decode_token
+
+logger = structlog.get_logger()
+
+# Refill, take one token if there is one, and store the bucket, atomically.
+# TIME keeps every worker on Redis' clock; returns {allowed, tokens left}.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+RATE_LIMIT_HEADERS = [
+    "RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy", "Retry-After",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class RouteGroup:
+    """Requests sharing one bucket per client; ``per_user`` keys by token subject, else by IP."""
+
+    name: str
+    routes: tuple[tuple[str, re.Pattern[str]], ...]
+    setting: str
+    per_user: bool
+
+    def matches(self, method: str, path: str) -> bool:
+        return any(method == m and pattern.fullmatch(path) for m, pattern in self.routes)
+
+    def per_minute(self, settings: Settings) -> int:
+        return getattr(settings, self.setting)
+
+
+_RECIPE = r"/api/v1/recipes/[^/]+"
+
+ROUTE_GROUPS = (
+    RouteGroup(
+        "auth",
+        (
+            ("POST", re.compile(r"/api/v1/auth/login(/(webapp|dev|admin))?")),
+            ("POST", re.compile(r"/api/v1/auth/refresh")),
+        ),
+        "rate_limit_auth_per_minute",
+        per_user=False,
+    ),
+    RouteGroup(
+        "upload",
+        (("POST", re.compile(r"/api/v1/files/upload")),),
+        "rate_limit_upload_per_minute",
+        per_user=True,
+    ),
+    RouteGroup(
+        "toggle",
+        (
+            ("POST", re.compile(rf"{_RECIPE}/favorite")),
+            ("DELETE", re.compile(rf"{_RECIPE}/favorite")),
+            ("POST", re.compile(r"/api/v1/recipes/favorites/bulk")),
+            ("POST", re.compile(rf"{_RECIPE}/history")),
+        ),
+        "rate_limit_toggle_per_minute",
+        per_user=True,
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Decision:
+    allowed: bool
+    limit: int
+    tokens: float
+    rate: float
+
+    def headers(self) -> dict[str, str]:
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(math.floor(self.tokens)),
+            "RateLimit-Reset": str(math.ceil((self.limit - self.tokens) / self.rate)),
+            "RateLimit-Policy": f"{self.limit};w=60",
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil((1 - self.tokens) / self.rate)))
+        return headers
+
+
+class LocalBuckets:
+    """In-process token buckets, used while Redis is unreachable.
+
+    Each worker limits on its own, so a client may get up to one bucket per
+    worker; least recently used buckets are dropped past ``max_size``.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def take(self, key: str, capacity: int, rate: float) -> tuple[bool, float]:
+        now = time.monotonic()
+        tokens, ts = self._buckets.get(key, (float(capacity), now))
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_size:
+            self._buckets.popitem(last=False)
+        return allowed, tokens
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+class RateLimiter:
+    """Takes tokens from Redis buckets, or from local ones for a while after Redis fails."""
+
+    def __init__(self) -> None:
+        self.local = LocalBuckets(RATE_LIMIT_LOCAL_MAX_BUCKETS)
+        self._script: AsyncScript | None = None
+        self._script_redis: Redis | None = None
+        self._redis_retry_at = 0.0
+
+    async def hit(self, key: str, per_minute: int) -> Decision:
+        rate = per_minute / 60
+        if time.monotonic() >= self._redis_retry_at:
+            try:
+                allowed, tokens = await asyncio.wait_for(
+                    self._take_redis(key, per_minute, rate), RATE_LIMIT_REDIS_TIMEOUT,
+                )
+                return Decision(allowed, per_minute, tokens, rate)
+            except (RedisError, TimeoutError) as exc:
+                logger.warning("rate_limit_redis_unavailable", error=repr(exc))
+                self._redis_retry_at = time.monotonic() + RATE_LIMIT_REDIS_RETRY
+        allowed, tokens = self.local.take(key, per_minute, rate)
+        return Decision(allowed, per_minute, tokens, rate)
+
+    async def _take_redis(self, key: str, capacity: int, rate: float) -> tuple[bool, float]:
+        redis = await get_redis()
+        if self._script is None or self._script_redis is not redis:
+            self._script = redis.register_script(TOKEN_BUCKET_LUA)
+            self._script_redis = redis
+        allowed, tokens = await self._script(keys=[key], args=[capacity, rate])
+        return bool(allowed), float(tokens)
+
+    def reset(self) -> None:
+        self.local.clear()
+        self._redis_retry_at = 0.0
+
+
+rate_limiter = RateLimiter()
+
+
+def _client_key(scope: Scope, group: RouteGroup) -> str:
+    if group.per_user:
+        authorization = Headers(scope=scope).get("authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                return f"user:{decode_token(token)}"
+            except UnauthorizedException:
+                pass
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class RateLimitMiddleware:
+    """Answers 429 once a client's bucket for the route group is empty.
+
+    Every limited response carries RateLimit-Limit/-Remaining/-Reset/-Policy;
+    a 429 adds Retry-After. Requests outside ROUTE_GROUPS pass untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        settings = get_settings()
+        if scope["type"] != "http" or not settings.rate_limit_enabled:
+            await self.app(scope, receive, send)
+            return
+        group = next(
+            (g for g in ROUTE_GROUPS if g.matches(scope["method"], scope["path"])), None,
+        )
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = f"{RATE_LIMIT_KEY_PREFIX}{group.name}:{_client_key(scope, group)}"
+        decision = await rate_limiter.hit(key, group.per_minute(settings))
+        headers = decision.headers()
+
+        if not decision.allowed:
+            exc = TooManyRequestsException(
+                "Rate limit exceeded, retry later", retry_after=int(headers["Retry-After"]),
+            )
+            response = problem_response(exc, str(Request(scope).url))
+            response.headers.update(headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -3,6 +3,7 @@
 from redis.asyncio import Redis
 
 from app.core.config import get_settings
+from app.core.constants import REDIS_HEALTH_CHECK_INTERVAL
 
 _redis_client: Redis | None = None
 
@@ -15,6 +16,8 @@ async def get_redis() -> Redis:
         _redis_client = Redis.from_url(
             settings.redis_url,
             decode_responses=True,
+            # PINGs idle connections, so the pub/sub listener notices a silent drop
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
         )
     return _redis_client
 
@@ -2,16 +2,20 @@
 
 import hashlib
 import hmac
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
 from jose import JWTError, jwt
 
 from app.core.config import get_settings
+from app.core.constants import USER_ROLE, VERIFIED_TOKEN_CACHE_SIZE
 from app.core.exceptions import UnauthorizedException
 
 
-def create_access_token(user_id: UUID) -> str:
+def create_access_token(user_id: UUID, *, role: str | None = USER_ROLE) -> str:
+    """Sign an access token; ``role=None`` leaves the role claim out, as tokens had before it."""
     settings = get_settings()
     expire = datetime.now(timezone.utc) + timedelta(
         minutes=settings.jwt_access_token_expire_minutes,
@@ -22,10 +26,12 @@ def create_access_token(user_id: UUID) -> str:
         "type": "access",
         "jti": uuid4().hex,
     }
+    if role is not None:
+        payload["role"] = role
     return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
-def create_refresh_token(user_id: UUID) -> str:
+def create_refresh_token(user_id: UUID, *, role: str | None = USER_ROLE) -> str:
     settings = get_settings()
     expire = datetime.now(timezone.utc) + timedelta(
         days=settings.jwt_refresh_token_expire_days,
@@ -36,20 +42,79 @@ def create_refresh_token(user_id: UUID) -> str:
         "type": "refresh",
         "jti": uuid4().hex,
     }
+    if role is not None:
+        payload["role"] = role
     return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
-def decode_token(token: str, *, expected_type: str = "access") -> UUID:
-    """Decode and validate a JWT token, returning the user UUID."""
-    settings = get_settings()
-    try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
-    except JWTError:
-        raise UnauthorizedException("Invalid or expired token")
+class _VerifiedTokens:
+    """Claims of tokens whose signature already checked out, keyed by the token's SHA-256.
+
+    An entry is dropped once its ``exp`` passes, so an expired token goes back
+    through jwt.decode and is rejected there. Least recently used entries make
+    room past ``max_size``.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+
+    def get(self, digest: bytes) -> dict | None:
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        expires_at, claims = entry
+        if expires_at <= time.time():
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return claims
+
+    def put(self, digest: bytes, claims: dict) -> None:
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        self._entries[digest] = (exp, claims)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        # Sweep expired entries that reached the LRU end without being read again
+        now = time.time()
+        while self._entries and next(iter(self._entries.values()))[0] <= now:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+verified_tokens = _VerifiedTokens(VERIFIED_TOKEN_CACHE_SIZE)
+
+
+def _verify(token: str) -> dict:
+    """Signature-checked claims of ``token``, decoded once per token while it is valid."""
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    claims = verified_tokens.get(digest)
+    if claims is None:
+        settings = get_settings()
+        try:
+            claims = jwt.decode(
+                token,
+                settings.jwt_secret_key,
+                algorithms=[settings.jwt_algorithm],
+            )
+        except JWTError:
+            raise UnauthorizedException("Invalid or expired token")
+        verified_tokens.put(digest, claims)
+    # Callers get their own copy; the cached claims stay as signed
+    return dict(claims)
+
+
+def decode_claims(token: str, *, expected_type: str = "access") -> dict:
+    """Decode and validate a JWT token, returning its claims."""
+    payload = _verify(token)
 
     token_type = payload.get("type")
     if token_type != expected_type:
@@ -60,22 +125,20 @@ def decode_token(token: str, *, expected_type: str = "access") -> UUID:
         raise UnauthorizedException("Token missing subject")
 
     try:
-        return UUID(sub)
+        UUID(sub)
     except ValueError:
         raise UnauthorizedException("Invalid subject in token")
+    return payload
+
+
+def decode_token(token: str, *, expected_type: str = "access") -> UUID:
+    """Decode and validate a JWT token, returning the user UUID."""
+    return UUID(decode_claims(token, expected_type=expected_type)["sub"])
 
 
 def decode_token_payload(token: str) -> dict:
     """Decode token without type check — used for extracting jti/exp on logout."""
-    settings = get_settings()
-    try:
-        return jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
-    except JWTError:
-        raise UnauthorizedException("Invalid or expired token")
+    return _verify(token)
 
 
 def verify_telegram_hash(data: dict[str, str], bot_token: str) -> bool:
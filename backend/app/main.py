@@ -4,14 +4,20 @@ import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from app.core.config import get_settings
+from app.core.database import transaction_scope
+from app.core.events import start_event_listener, stop_event_listener
 from app.core.exceptions import register_exception_handlers
+from app.core.passwords import close_password_hasher, get_password_hasher
+from app.core.rate_limit import RATE_LIMIT_HEADERS, RateLimitMiddleware
 from app.core.redis import close_redis, get_redis
 
 from app.api.auth import router as auth_router
@@ -23,6 +29,7 @@ from app.api.ingredients import router as ingredients_router
 from app.api.recipes import router as recipes_router
 from app.api.steps import router as steps_router
 from app.api.users import router as users_router
+from app.services.featured_sync import FeaturedSyncService, stop_featured_sync
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -34,13 +41,13 @@ async def _seed_admin() -> None:
     if not password:
         return
 
-    import bcrypt
     from sqlalchemy import select
     from app.core.database import async_session_factory
     from app.models.user import Admin, User
+    from app.services.admin_cache import invalidate_admins
 
     username = os.environ.get("DEV_ADMIN_USERNAME", "admin")
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    hashed = await get_password_hasher().hash(password)
 
     async with async_session_factory() as session:
         result = await session.execute(select(Admin).where(Admin.username == username))
@@ -57,15 +64,29 @@ async def _seed_admin() -> None:
             admin = Admin(user_id=user.id, username=username, password_hash=hashed)
             session.add(admin)
             await session.commit()
+            await invalidate_admins(await get_redis())
             logger.info("admin_created", username=username)
 
 
+async def _resume_featured_sync() -> None:
+    """Restart an unfinished featured sync; a failure here must not keep the app down."""
+    try:
+        await FeaturedSyncService(transaction_scope, await get_redis()).resume()
+    except Exception:
+        logger.exception("featured_sync_resume_failed")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("app_starting", env=settings.app_env)
     await _seed_admin()
+    await _resume_featured_sync()
+    start_event_listener(await get_redis())
     yield
+    await stop_event_listener()
+    await stop_featured_sync()
     await close_redis()
+    close_password_hasher()
     logger.info("app_shutting_down")
 
 
@@ -90,13 +111,18 @@ _cors_origins = (
     else ["http://localhost:5173", "http://localhost:5174", "http://127.0.0.1:5173", "http://127.0.0.1:5174"]
 )
 
+# Added before CORS so that CORS wraps it and 429 responses keep their CORS headers
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=RATE_LIMIT_HEADERS,
 )
+# Outermost, so the rate limiter sees the client the trusted proxy forwarded for
+app.add_middleware(ProxyHeadersMiddleware, trusted_hosts=settings.forwarded_allow_ips)
 
 register_exception_handlers(app)
 
@@ -117,12 +143,13 @@ app.mount("/uploads", StaticFiles(directory=str(_uploads_dir)), name="uploads")
 
 
 @app.get("/health", tags=["system"])
-async def health_check() -> dict[str, str]:
-    status = {"app": "ok"}
+async def health_check() -> dict[str, Any]:
+    status: dict[str, Any] = {"app": "ok"}
     try:
         redis = await get_redis()
         await redis.ping()
         status["redis"] = "ok"
     except Exception:
         status["redis"] = "unavailable"
+    status["password_pool"] = get_password_hasher().stats.snapshot()
     return status
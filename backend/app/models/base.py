@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, Integer
+from sqlalchemy import DDL, Boolean, DateTime, Index, Integer, event, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -11,6 +11,31 @@ from sqlalchemy.sql import func
 from app.core.database import Base
 
 
+@event.listens_for(Base.metadata, "before_create")
+def _create_pg_trgm(target, connection, **kw) -> None:
+    # Mirrors migration e5f6a7b8c9d0 for schemas built with create_all
+    available = connection.scalar(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"
+    ))
+    if available:
+        connection.execute(DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
+def _has_pg_trgm(ddl, target, bind, **kw) -> bool:
+    return bind.scalar(text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"))
+
+
+def trgm_index(name: str, column: str) -> Index:
+    """GIN trigram index backing ILIKE '%term%' and similarity search on ``column``.
+
+    create_all skips it on a server without the pg_trgm extension, where the
+    search queries cannot run anyway; migrations always create it.
+    """
+    return Index(
+        name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(callable_=_has_pg_trgm)
+
+
 class UUIDMixin:
     id: Mapped[bytes] = mapped_column(
         PGUUID(as_uuid=True),
@@ -1,13 +1,14 @@
 """CookingHistory ORM model."""
 
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Index
+from sqlalchemy import Computed, Date, DateTime, ForeignKey, Index, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
+from app.core.constants import DEFAULT_TIMEZONE
 from app.core.database import Base
 from app.models.base import UUIDMixin, TimestampMixin
 
@@ -15,7 +16,12 @@ from app.models.base import UUIDMixin, TimestampMixin
 class CookingHistory(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "cooking_history"
     __table_args__ = (
-        Index("ix_cooking_history_user", "user_id"),
+        # At most one dish per user per day; recording relies on it to reject a second one
+        UniqueConstraint("user_id", "cooked_on", name="uq_cooking_history_user_day"),
+        Index(
+            "ix_cooking_history_user_cooked_at_id", "user_id",
+            text("cooked_at DESC"), text("id DESC"),
+        ),
         Index("ix_cooking_history_recipe", "recipe_id"),
         Index("ix_cooking_history_cooked_at", "cooked_at"),
     )
@@ -29,6 +35,13 @@ class CookingHistory(UUIDMixin, TimestampMixin, Base):
     cooked_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False,
     )
+    # The user's timezone when the record was made, so cooked_on never shifts afterwards
+    timezone: Mapped[str] = mapped_column(
+        String(64), default=DEFAULT_TIMEZONE, server_default=DEFAULT_TIMEZONE, nullable=False,
+    )
+    cooked_on: Mapped[date] = mapped_column(
+        Date, Computed("(cooked_at AT TIME ZONE timezone)::date", persisted=True),
+    )
 
     user: Mapped["User"] = relationship(back_populates="cooking_history", lazy="raise")  # type: ignore[name-defined]  # noqa: F821
     recipe: Mapped["Recipe"] = relationship(back_populates="cooking_history", lazy="raise")  # type: ignore[name-defined]  # noqa: F821
@@ -0,0 +1,61 @@
+"""Cooking statistics ORM models — rollups of cooking_history kept up to date on every record.
+
+Days are the records' ``cooked_on`` days, i.e. calendar days in the user's timezone.
+"""
+
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class CookingDailyStat(Base):
+    __tablename__ = "cooking_daily_stats"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    dishes: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class CookingWeeklyStat(Base):
+    __tablename__ = "cooking_weekly_stats"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True,
+    )
+    # Monday of the ISO week
+    week_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    dishes: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class CookingCategoryStat(Base):
+    """Dishes per user per category, by the recipe's current categories.
+
+    Changing a recipe's categories moves its whole history between rows.
+    """
+
+    __tablename__ = "cooking_category_stats"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True,
+    )
+    category_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True,
+    )
+    dishes: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_cooked_on: Mapped[date] = mapped_column(Date, nullable=False)
+
+
+class CookingActivityStat(Base):
+    """Dishes recorded per day across all users, for the admin activity chart."""
+
+    __tablename__ = "cooking_activity_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    dishes: Mapped[int] = mapped_column(Integer, nullable=False)
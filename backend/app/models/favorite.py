@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -14,7 +14,10 @@ class FavoriteRecipe(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "favorite_recipes"
     __table_args__ = (
         UniqueConstraint("user_id", "recipe_id", name="uq_user_recipe_favorite"),
-        Index("ix_favorite_recipes_user", "user_id"),
+        Index(
+            "ix_favorite_recipes_user_created_at_recipe", "user_id",
+            text("created_at DESC"), text("recipe_id DESC"),
+        ),
         Index("ix_favorite_recipes_recipe", "recipe_id"),
     )
 
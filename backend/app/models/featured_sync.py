@@ -1,12 +1,16 @@
-"""FeaturedSyncConfig ORM model — stores last sync timestamp."""
+"""Featured sync ORM models — last sync timestamp and background sync jobs."""
 
+import enum
 from datetime import datetime
+from uuid import UUID
 
-from sqlalchemy import DateTime, Integer
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.models.base import UUIDMixin, TimestampMixin
 
 
 class FeaturedSyncConfig(Base):
@@ -16,3 +20,36 @@ class FeaturedSyncConfig(Base):
     last_sync_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False,
     )
+
+
+class FeaturedSyncStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+ACTIVE_SYNC_STATUSES = (FeaturedSyncStatus.PENDING.value, FeaturedSyncStatus.RUNNING.value)
+
+
+class FeaturedSyncJob(UUIDMixin, TimestampMixin, Base):
+    """One run of the featured sync, walked over users in id order.
+
+    ``cursor_user_id`` is the last user of the last committed chunk; it is
+    advanced in the same transaction as the chunk's inserts, so a resumed job
+    continues exactly where the previous worker stopped.
+    """
+
+    __tablename__ = "featured_sync_jobs"
+
+    status: Mapped[str] = mapped_column(String(16), nullable=False, index=True)
+    featured_since: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    featured_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    chunk_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    chunks_total: Mapped[int] = mapped_column(Integer, nullable=False)
+    chunks_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rows_inserted: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    cursor_user_id: Mapped[UUID | None] = mapped_column(PGUUID(as_uuid=True), nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
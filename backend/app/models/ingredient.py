@@ -7,11 +7,12 @@ from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import UUIDMixin, TimestampMixin
+from app.models.base import UUIDMixin, TimestampMixin, trgm_index
 
 
 class Ingredient(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "ingredients"
+    __table_args__ = (trgm_index("ix_ingredients_title_trgm", "title"),)
 
     title: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     unit_of_measurement: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -3,11 +3,24 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, Index, Integer, Numeric, String, Text
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import UUIDMixin, TimestampMixin
+from app.models.base import UUIDMixin, TimestampMixin, trgm_index
 
 
 class DifficultyEnum(str, enum.Enum):
@@ -21,6 +34,17 @@ class Recipe(UUIDMixin, TimestampMixin, Base):
     __table_args__ = (
         CheckConstraint("difficulty IN ('easy', 'medium', 'hard')", name="ck_recipes_difficulty"),
         Index("ix_recipes_difficulty", "difficulty"),
+        Index(
+            "ix_recipes_active_created_at_id", text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_recipes_active_sample_key_id", "sample_key", "id",
+            postgresql_where=text("is_active"),
+        ),
+        Index("ix_recipes_search_vector", "search_vector", postgresql_using="gin"),
+        trgm_index("ix_recipes_title_trgm", "title"),
+        trgm_index("ix_recipes_search_translit_trgm", "search_translit"),
     )
 
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -37,6 +61,15 @@ class Recipe(UUIDMixin, TimestampMixin, Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
     is_featured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
     featured_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    sample_key: Mapped[float] = mapped_column(Float, server_default=func.random(), nullable=False)
+    # Search documents over title, description, ingredient and category titles;
+    # rebuilt by RecipeRepository.refresh_search_documents, never loaded with the entity
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, server_default=text("''::tsvector"), nullable=False, deferred=True,
+    )
+    search_translit: Mapped[str] = mapped_column(
+        Text, server_default="", nullable=False, deferred=True,
+    )
 
     steps: Mapped[list["Step"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="recipe", lazy="raise", order_by="Step.step_number",
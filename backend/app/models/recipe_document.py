@@ -0,0 +1,29 @@
+"""RecipeDocument ORM model — pre-serialized client detail view of a recipe.
+
+Holds RecipeDetailResponse without the per-user flags; rebuilt in the same
+transaction whenever the recipe, its steps, ingredients or categories change.
+"""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class RecipeDocument(Base):
+    __tablename__ = "recipe_documents"
+
+    recipe_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True,
+    )
+    document: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False,
+    )
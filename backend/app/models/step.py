@@ -7,12 +7,15 @@ from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
-from app.models.base import UUIDMixin, TimestampMixin
+from app.models.base import UUIDMixin, TimestampMixin, trgm_index
 
 
 class Step(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "steps"
-    __table_args__ = (Index("ix_steps_recipe_number", "recipe_id", "step_number"),)
+    __table_args__ = (
+        Index("ix_steps_recipe_number", "recipe_id", "step_number"),
+        trgm_index("ix_steps_title_trgm", "title"),
+    )
 
     recipe_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False,
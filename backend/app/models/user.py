@@ -6,12 +6,18 @@ from sqlalchemy import BigInteger, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.constants import DEFAULT_TIMEZONE
 from app.core.database import Base
-from app.models.base import UUIDMixin, TimestampMixin
+from app.models.base import UUIDMixin, TimestampMixin, trgm_index
 
 
 class User(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "users"
+    __table_args__ = (
+        trgm_index("ix_users_username_trgm", "username"),
+        trgm_index("ix_users_first_name_trgm", "first_name"),
+        trgm_index("ix_users_last_name_trgm", "last_name"),
+    )
 
     tg_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
     tg_username: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -19,6 +25,10 @@ class User(UUIDMixin, TimestampMixin, Base):
     phone_number: Mapped[str | None] = mapped_column(String(20), unique=True, nullable=True)
     first_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     last_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # IANA zone name; decides which calendar day a cooking record falls on
+    timezone: Mapped[str] = mapped_column(
+        String(64), default=DEFAULT_TIMEZONE, server_default=DEFAULT_TIMEZONE, nullable=False,
+    )
 
     admin: Mapped["Admin | None"] = relationship(
         back_populates="user", uselist=False, lazy="raise",
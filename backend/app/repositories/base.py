@@ -1,9 +1,9 @@
 """Generic base repository — reusable CRUD operations."""
 
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Sequence, TypeVar
 from uuid import UUID
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import ColumnElement, Row, Select, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import Base
@@ -14,10 +14,31 @@ from app.schemas.pagination import PaginatedResponse
 ModelT = TypeVar("ModelT", bound=Base)
 
 
+def build_search_filter(columns: Sequence[Any], search: str) -> ColumnElement[bool]:
+    """Case-insensitive substring match on any of ``columns``.
+
+    Leading-wildcard ILIKE is served by the pg_trgm GIN indexes on these columns.
+    """
+    pattern = f"%{search}%"
+    return or_(*(column.ilike(pattern) for column in columns))
+
+
+def build_search_rank(columns: Sequence[Any], search: str) -> ColumnElement[float]:
+    """Best pg_trgm similarity of ``search`` across ``columns``; order by it descending."""
+    scores = [func.similarity(func.coalesce(column, ""), search) for column in columns]
+    return scores[0] if len(scores) == 1 else func.greatest(*scores)
+
+
+def build_count_query(query: Select) -> Select:
+    """``SELECT count(*)`` over the rows ``query`` would return, ignoring its ordering."""
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
 class BaseRepository(Generic[ModelT]):
     """Generic async repository with standard CRUD operations."""
 
     model: type[ModelT]
+    search_columns: tuple[Any, ...] = ()
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
@@ -33,6 +54,12 @@ class BaseRepository(Generic[ModelT]):
             raise NotFoundException(self.model.__tablename__, entity_id)
         return entity
 
+    def build_search_filter(self, search: str) -> ColumnElement[bool]:
+        return build_search_filter(self.search_columns, search)
+
+    def build_search_rank(self, search: str) -> ColumnElement[float]:
+        return build_search_rank(self.search_columns, search)
+
     async def get_or_none(self, entity_id: UUID) -> ModelT | None:
         result = await self.db.execute(
             select(self.model).where(self.model.id == entity_id)  # type: ignore[attr-defined]
@@ -44,27 +71,66 @@ class BaseRepository(Generic[ModelT]):
         pagination: PaginationParams,
         *,
         base_query: Select | None = None,
-        count_query: Select | None = None,
         order_by: Any = None,
     ) -> PaginatedResponse[ModelT]:
-        q = base_query if base_query is not None else select(self.model)
-        cq = count_query if count_query is not None else select(func.count()).select_from(self.model)
+        """One page of ``base_query`` in a single roundtrip.
 
-        total_result = await self.db.execute(cq)
-        total = total_result.scalar_one()
+        The total rides along as ``COUNT(*) OVER()``; with ``include_total=False``
+        it is skipped and one extra row is fetched to tell whether a next page exists.
+        """
+        q = base_query if base_query is not None else select(self.model)
 
-        if order_by is not None:
+        if isinstance(order_by, (list, tuple)):
+            q = q.order_by(*order_by)
+        elif order_by is not None:
             q = q.order_by(order_by)
 
-        q = q.offset(pagination.offset).limit(pagination.limit)
-        result = await self.db.execute(q)
-        items = list(result.scalars().all())
+        if not pagination.include_total:
+            result = await self.db.execute(q.offset(pagination.offset).limit(pagination.limit + 1))
+            items = list(result.scalars().all())
+            return PaginatedResponse(
+                items=items[:pagination.limit], total=None,
+                limit=pagination.limit, offset=pagination.offset,
+                has_more=len(items) > pagination.limit,
+            )
+
+        paged = q.add_columns(func.count().over().label("total"))
+        result = await self.db.execute(paged.offset(pagination.offset).limit(pagination.limit))
+        rows = result.all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif pagination.offset:
+            # Past the last page the window has no rows to report on
+            total = await self.count(build_count_query(q))
+        else:
+            total = 0
 
         return PaginatedResponse(
             items=items, total=total,
             limit=pagination.limit, offset=pagination.offset,
+            has_more=pagination.offset + len(items) < total,
         )
 
+    async def list_seek(
+        self, query: Select, key: Sequence[Any], limit: int, offset: int = 0, *,
+        after: tuple[Any, ...] | None = None, include_total: bool = True,
+    ) -> tuple[Sequence[Row[Any]], int | None]:
+        """Up to ``limit + 1`` rows of ``query`` in descending ``key`` order, and the total.
+
+        The extra row tells the caller whether a next page exists. With ``after``
+        (the key of the last row served) rows are sought past it instead of
+        skipped with OFFSET, so deep pages cost the same as the first one.
+        """
+        total = await self.count(build_count_query(query)) if include_total else None
+        query = query.order_by(*(column.desc() for column in key))
+        if after is not None:
+            query = query.where(tuple_(*key) < tuple_(*after))
+        else:
+            query = query.offset(offset)
+        result = await self.db.execute(query.limit(limit + 1))
+        return result.all(), total
+
     async def count(self, stmt: Select | None = None) -> int:
         q = stmt if stmt is not None else select(func.count()).select_from(self.model)
         result = await self.db.execute(q)
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 from typing import Any, Sequence
+from uuid import UUID
 
 from sqlalchemy import Row, func, select
 
 from app.core.dependencies import PaginationParams
 from app.models.category import Category, RecipeCategory
+from app.models.recipe import Recipe
 from app.repositories.base import BaseRepository
+from app.repositories.recipe import build_search_document_update, refresh_detail_documents
 from app.schemas.pagination import PaginatedResponse
 
 
 class CategoryRepository(BaseRepository[Category]):
     model = Category
+    search_columns = (Category.title,)
 
     async def find_by_title_or_slug(self, title: str, slug: str) -> Category | None:
         result = await self.db.execute(
@@ -27,21 +31,22 @@ class CategoryRepository(BaseRepository[Category]):
     ) -> PaginatedResponse[Category]:
         filters: list[Any] = []
         if search:
-            filters.append(Category.title.ilike(f"%{search}%"))
+            filters.append(self.build_search_filter(search))
         if is_active is not None:
             filters.append(Category.is_active == is_active)
         if slug:
             filters.append(Category.slug == slug)
 
         query = select(Category)
-        count_query = select(func.count()).select_from(Category)
         for f in filters:
             query = query.where(f)
-            count_query = count_query.where(f)
+
+        order: list[Any] = [Category.title.asc()]
+        if search:
+            order.insert(0, self.build_search_rank(search).desc())
 
         return await self.list(
-            pagination, base_query=query, count_query=count_query,
-            order_by=Category.title.asc(),
+            pagination, base_query=query, order_by=order,
         )
 
     async def list_client_with_counts(self, *, query: str | None = None) -> Sequence[Row[Any]]:
@@ -53,9 +58,28 @@ class CategoryRepository(BaseRepository[Category]):
             .outerjoin(RecipeCategory, RecipeCategory.category_id == Category.id)
             .where(Category.is_active.is_(True))
             .group_by(Category.id)
-            .order_by(Category.title.asc())
         )
         if query:
-            stmt = stmt.where(Category.title.ilike(f"%{query}%"))
+            stmt = stmt.where(self.build_search_filter(query)).order_by(
+                self.build_search_rank(query).desc(),
+            )
+        stmt = stmt.order_by(Category.title.asc())
         result = await self.db.execute(stmt)
         return result.all()
+
+    async def linked_recipe_ids(self, category_id: UUID) -> list[UUID]:
+        result = await self.db.execute(
+            select(RecipeCategory.recipe_id).where(RecipeCategory.category_id == category_id)
+        )
+        return list(result.scalars().all())
+
+    async def refresh_recipe_documents(
+        self, recipe_ids: Sequence[UUID], *, search: bool = True,
+    ) -> None:
+        """Rebuild detail documents (and, with ``search``, search documents) of recipes
+        that embed this category."""
+        if not recipe_ids:
+            return
+        if search:
+            await self.db.execute(build_search_document_update(Recipe.id.in_(recipe_ids)))
+        await refresh_detail_documents(self.db, recipe_ids)
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, time, timedelta
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Date, DateTime, Row, cast, literal, select
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import func
 
 from app.models.cooking_history import CookingHistory
+from app.models.recipe import Recipe
+from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.repositories.favorite import CARD_COLUMNS
 
 
 class CookingHistoryRepository(BaseRepository[CookingHistory]):
@@ -25,29 +32,79 @@ class CookingHistoryRepository(BaseRepository[CookingHistory]):
         )
         return list(result.scalars().all())
 
-    async def has_record_today(self, user_id: UUID) -> bool:
-        """Check if user already has a cooking history record for today."""
-        today_start = datetime.combine(date.today(), time.min)
-        result = await self.db.execute(
-            select(CookingHistory.id)
-            .where(
-                CookingHistory.user_id == user_id,
-                CookingHistory.cooked_at >= today_start,
+    async def list_cards(
+        self, user_id: UUID, limit: int, offset: int = 0, *,
+        after: tuple[datetime, UUID] | None = None, include_total: bool = True,
+    ) -> tuple[Sequence[Row[Any]], int | None]:
+        """Card rows of the user's history, latest first; see BaseRepository.list_seek.
+
+        Rows are ``id`` and ``cooked_at`` of the record plus the recipe's
+        CARD_COLUMNS prefixed ``recipe_``; ``after`` is the ``(cooked_at, id)``
+        key of the last record served.
+        """
+        query = (
+            select(
+                CookingHistory.id, CookingHistory.cooked_at,
+                *(column.label(f"recipe_{column.key}") for column in CARD_COLUMNS),
             )
-            .limit(1)
+            .join(Recipe, Recipe.id == CookingHistory.recipe_id)
+            .where(CookingHistory.user_id == user_id)
+        )
+        return await self.list_seek(
+            query, (CookingHistory.cooked_at, CookingHistory.id), limit, offset,
+            after=after, include_total=include_total,
         )
-        return result.first() is not None
 
-    async def list_recent_by_user(self, user_id: UUID, days: int = 7) -> list[CookingHistory]:
-        """Return cooking history records for the last N days with recipe data."""
-        cutoff = datetime.combine(date.today(), time.min) - timedelta(days=days - 1)
+    async def recipe_ids_by_user(self, user_id: UUID) -> set[UUID]:
         result = await self.db.execute(
-            select(CookingHistory)
+            select(CookingHistory.recipe_id).where(CookingHistory.user_id == user_id).distinct()
+        )
+        return set(result.scalars().all())
+
+    async def record(
+        self, user_id: UUID, recipe_id: UUID, cooked_at: datetime | None = None,
+    ) -> CookingHistory | None:
+        """Insert the user's record for the day of ``cooked_at`` (now when None); one statement.
+
+        The day is taken in the user's timezone and is unique per user, so
+        ON CONFLICT DO NOTHING turns a second record that day into None, even
+        when two requests race.
+        """
+        row = select(
+            func.gen_random_uuid(), User.id, literal(recipe_id, PGUUID(as_uuid=True)),
+            literal(cooked_at, DateTime(timezone=True)) if cooked_at is not None else func.now(),
+            User.timezone,
+        ).where(User.id == user_id)
+        result = await self.db.execute(
+            pg_insert(CookingHistory)
+            .from_select(["id", "user_id", "recipe_id", "cooked_at", "timezone"], row)
+            .on_conflict_do_nothing(constraint="uq_cooking_history_user_day")
+            .returning(CookingHistory)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_recent_by_user(self, user_id: UUID, days: int = 7) -> Sequence[Row[Any]]:
+        """Return recent records as (id, cooked_at, recipe_id, recipe_title, recipe_photo_url) rows.
+
+        The last N days are counted in the user's timezone, today included.
+        """
+        today = (
+            select(cast(func.timezone(User.timezone, func.now()), Date))
+            .where(User.id == user_id)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(
+                CookingHistory.id, CookingHistory.cooked_at,
+                Recipe.id.label("recipe_id"),
+                Recipe.title.label("recipe_title"),
+                Recipe.photo_url.label("recipe_photo_url"),
+            )
+            .join(Recipe, Recipe.id == CookingHistory.recipe_id)
             .where(
                 CookingHistory.user_id == user_id,
-                CookingHistory.cooked_at >= cutoff,
+                CookingHistory.cooked_on > today - days,
             )
-            .options(selectinload(CookingHistory.recipe))
             .order_by(CookingHistory.cooked_at.asc())
         )
-        return list(result.scalars().all())
+        return result.all()
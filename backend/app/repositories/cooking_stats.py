@@ -0,0 +1,335 @@
+"""Cooking stats repository — incremental and full maintenance of the cooking rollups, and reads."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    CTE,
+    Date,
+    Integer,
+    Row,
+    and_,
+    cast,
+    delete,
+    func,
+    literal,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.category import Category, RecipeCategory
+from app.models.cooking_history import CookingHistory
+from app.models.cooking_stats import (
+    CookingActivityStat,
+    CookingCategoryStat,
+    CookingDailyStat,
+    CookingWeeklyStat,
+)
+from app.models.user import User
+from app.repositories.base import BaseRepository
+
+
+def week_start(day: date) -> date:
+    """Monday of ``day``'s ISO week, matching PostgreSQL's date_trunc('week', ...)."""
+    return day - timedelta(days=day.weekday())
+
+
+def _uncount(model: Any, counts: CTE, keys: tuple[str, ...], **values: Any) -> tuple[CTE, CTE]:
+    """CTEs taking ``counts.c.n`` dishes off the matching ``model`` rows, deleting emptied ones.
+
+    The two touch disjoint rows, as data-modifying CTEs of one statement must.
+    """
+    match = and_(*(getattr(model, key) == counts.c[key] for key in keys))
+    name = model.__tablename__
+    decremented = (
+        update(model)
+        .where(match, model.dishes > counts.c.n)
+        .values(dishes=model.dishes - counts.c.n, **values)
+        .cte(f"{name}_decremented")
+    )
+    emptied = delete(model).where(match, model.dishes <= counts.c.n).cte(f"{name}_emptied")
+    return decremented, emptied
+
+
+def _add_category_dishes(insert: Any) -> Any:
+    """Make a CookingCategoryStat INSERT ... SELECT add to existing rows instead of failing."""
+    return insert.on_conflict_do_update(
+        index_elements=["user_id", "category_id"],
+        set_={
+            "dishes": CookingCategoryStat.dishes + insert.excluded.dishes,
+            "last_cooked_on": func.greatest(
+                CookingCategoryStat.last_cooked_on, insert.excluded.last_cooked_on,
+            ),
+        },
+    )
+
+
+def _last_cooked_on(keep: Any) -> Any:
+    """Latest day among the ``keep`` records of the CookingCategoryStat row being updated."""
+    return (
+        select(func.max(CookingHistory.cooked_on))
+        .join(RecipeCategory, RecipeCategory.recipe_id == CookingHistory.recipe_id)
+        .where(
+            CookingHistory.user_id == CookingCategoryStat.user_id,
+            RecipeCategory.category_id == CookingCategoryStat.category_id,
+            keep,
+        )
+        .correlate(CookingCategoryStat)
+        .scalar_subquery()
+    )
+
+
+class CookingStatsRepository(BaseRepository[CookingDailyStat]):
+    model = CookingDailyStat
+
+    async def apply(self, history: CookingHistory) -> None:
+        """Count one new history record into every rollup, in one statement of upsert CTEs."""
+        user_id = literal(history.user_id, PGUUID(as_uuid=True))
+        daily = pg_insert(CookingDailyStat).values(
+            user_id=history.user_id, day=history.cooked_on, dishes=1,
+        )
+        daily = daily.on_conflict_do_update(
+            index_elements=["user_id", "day"], set_={"dishes": CookingDailyStat.dishes + 1},
+        )
+        weekly = pg_insert(CookingWeeklyStat).values(
+            user_id=history.user_id, week_start=week_start(history.cooked_on), dishes=1,
+        )
+        weekly = weekly.on_conflict_do_update(
+            index_elements=["user_id", "week_start"], set_={"dishes": CookingWeeklyStat.dishes + 1},
+        )
+        categories = pg_insert(CookingCategoryStat).from_select(
+            ["user_id", "category_id", "dishes", "last_cooked_on"],
+            select(
+                user_id, RecipeCategory.category_id, literal(1), literal(history.cooked_on, Date),
+            ).where(RecipeCategory.recipe_id == history.recipe_id),
+        )
+        categories = _add_category_dishes(categories)
+        activity = pg_insert(CookingActivityStat).values(day=history.cooked_on, dishes=1)
+        activity = activity.on_conflict_do_update(
+            index_elements=["day"], set_={"dishes": CookingActivityStat.dishes + 1},
+        )
+        # add_cte renders the upserts even though the outer statement never reads them
+        await self.db.execute(
+            activity.add_cte(daily.cte("daily"), weekly.cte("weekly"), categories.cte("categories"))
+        )
+
+    async def retract(self, *, recipe_id: UUID | None = None, user_id: UUID | None = None) -> int:
+        """Delete the recipe's or user's history records and uncount them from every rollup.
+
+        One statement: a DELETE ... RETURNING CTE feeds per-rollup counts, rows
+        left with dishes are decremented and rows left without any are deleted,
+        so the rollups keep matching rebuild(). Categories are the recipe's
+        current ones, as everywhere else. Returns the number of records deleted.
+        """
+        condition = (
+            CookingHistory.recipe_id == recipe_id if recipe_id is not None
+            else CookingHistory.user_id == user_id
+        )
+        removed = (
+            delete(CookingHistory)
+            .where(condition)
+            .returning(
+                CookingHistory.id, CookingHistory.user_id,
+                CookingHistory.recipe_id, CookingHistory.cooked_on,
+            )
+            .cte("removed")
+        )
+        n = func.count().label("n")
+        week = cast(func.date_trunc("week", removed.c.cooked_on), Date)
+        daily = (
+            select(removed.c.user_id, removed.c.cooked_on.label("day"), n)
+            .group_by(removed.c.user_id, removed.c.cooked_on)
+            .cte("removed_daily")
+        )
+        weekly = (
+            select(removed.c.user_id, week.label("week_start"), n)
+            .group_by(removed.c.user_id, week)
+            .cte("removed_weekly")
+        )
+        categories = (
+            select(removed.c.user_id, RecipeCategory.category_id, n)
+            .join(RecipeCategory, RecipeCategory.recipe_id == removed.c.recipe_id)
+            .group_by(removed.c.user_id, RecipeCategory.category_id)
+            .cte("removed_categories")
+        )
+        activity = (
+            select(removed.c.cooked_on.label("day"), n)
+            .group_by(removed.c.cooked_on)
+            .cte("removed_activity")
+        )
+        last_cooked_on = _last_cooked_on(CookingHistory.id.not_in(select(removed.c.id)))
+
+        ctes = [
+            *_uncount(CookingDailyStat, daily, ("user_id", "day")),
+            *_uncount(CookingWeeklyStat, weekly, ("user_id", "week_start")),
+            *_uncount(
+                CookingCategoryStat, categories, ("user_id", "category_id"),
+                last_cooked_on=last_cooked_on,
+            ),
+            *_uncount(CookingActivityStat, activity, ("day",)),
+        ]
+        result = await self.db.execute(
+            select(func.count()).select_from(removed).add_cte(*ctes)
+        )
+        return result.scalar_one()
+
+    async def uncount_categories(self, recipe_id: UUID) -> None:
+        """Take the recipe's dishes off the rollups of its current categories.
+
+        With count_categories after the categories are replaced, this moves the
+        recipe's history to its new categories, keeping the rule rebuild() uses.
+        """
+        n = func.count().label("n")
+        counts = (
+            select(CookingHistory.user_id, RecipeCategory.category_id, n)
+            .join(RecipeCategory, RecipeCategory.recipe_id == CookingHistory.recipe_id)
+            .where(CookingHistory.recipe_id == recipe_id)
+            .group_by(CookingHistory.user_id, RecipeCategory.category_id)
+            .cte("recipe_categories_uncounted")
+        )
+        ctes = _uncount(
+            CookingCategoryStat, counts, ("user_id", "category_id"),
+            last_cooked_on=_last_cooked_on(CookingHistory.recipe_id != recipe_id),
+        )
+        await self.db.execute(select(func.count()).select_from(counts).add_cte(*ctes))
+
+    async def count_categories(self, recipe_id: UUID) -> None:
+        """Count the recipe's dishes into the rollups of its current categories."""
+        await self.db.execute(_add_category_dishes(
+            pg_insert(CookingCategoryStat).from_select(
+                ["user_id", "category_id", "dishes", "last_cooked_on"],
+                select(
+                    CookingHistory.user_id, RecipeCategory.category_id, func.count(),
+                    func.max(CookingHistory.cooked_on),
+                )
+                .join(RecipeCategory, RecipeCategory.recipe_id == CookingHistory.recipe_id)
+                .where(CookingHistory.recipe_id == recipe_id)
+                .group_by(CookingHistory.user_id, RecipeCategory.category_id),
+            ),
+        ))
+
+    async def rebuild(self) -> int:
+        """Recompute every rollup from cooking_history; returns the number of records counted.
+
+        Records are write-locked for the rest of the transaction, so none is
+        counted twice (or missed) by an incremental update running meanwhile.
+        """
+        await self.db.execute(text("LOCK TABLE cooking_history IN SHARE MODE"))
+        rollups = (CookingDailyStat, CookingWeeklyStat, CookingCategoryStat, CookingActivityStat)
+        for model in rollups:
+            await self.db.execute(delete(model))
+
+        dishes = func.count().label("dishes")
+        await self.db.execute(
+            pg_insert(CookingDailyStat).from_select(
+                ["user_id", "day", "dishes"],
+                select(CookingHistory.user_id, CookingHistory.cooked_on, dishes)
+                .group_by(CookingHistory.user_id, CookingHistory.cooked_on),
+            )
+        )
+        week = cast(func.date_trunc("week", CookingHistory.cooked_on), Date)
+        await self.db.execute(
+            pg_insert(CookingWeeklyStat).from_select(
+                ["user_id", "week_start", "dishes"],
+                select(CookingHistory.user_id, week, dishes).group_by(CookingHistory.user_id, week),
+            )
+        )
+        await self.db.execute(
+            pg_insert(CookingCategoryStat).from_select(
+                ["user_id", "category_id", "dishes", "last_cooked_on"],
+                select(
+                    CookingHistory.user_id, RecipeCategory.category_id, func.count(),
+                    func.max(CookingHistory.cooked_on),
+                )
+                .join(RecipeCategory, RecipeCategory.recipe_id == CookingHistory.recipe_id)
+                .group_by(CookingHistory.user_id, RecipeCategory.category_id),
+            )
+        )
+        await self.db.execute(
+            pg_insert(CookingActivityStat).from_select(
+                ["day", "dishes"],
+                select(CookingHistory.cooked_on, dishes).group_by(CookingHistory.cooked_on),
+            )
+        )
+        result = await self.db.execute(select(func.count()).select_from(CookingHistory))
+        return result.scalar_one()
+
+    async def today(self, user_id: UUID) -> date:
+        """The current date in the user's timezone."""
+        result = await self.db.execute(
+            select(cast(func.timezone(User.timezone, func.now()), Date)).where(User.id == user_id)
+        )
+        return result.scalar_one()
+
+    async def list_days(self, user_id: UUID, since: date) -> Sequence[Row[Any]]:
+        """(day, dishes) rows of the user's cooking days from ``since`` on, oldest first."""
+        result = await self.db.execute(
+            select(CookingDailyStat.day, CookingDailyStat.dishes)
+            .where(CookingDailyStat.user_id == user_id, CookingDailyStat.day >= since)
+            .order_by(CookingDailyStat.day)
+        )
+        return result.all()
+
+    async def list_weeks(self, user_id: UUID, since: date) -> Sequence[Row[Any]]:
+        """(week_start, dishes) rows of weeks starting from ``since`` on, oldest first."""
+        result = await self.db.execute(
+            select(CookingWeeklyStat.week_start, CookingWeeklyStat.dishes)
+            .where(CookingWeeklyStat.user_id == user_id, CookingWeeklyStat.week_start >= since)
+            .order_by(CookingWeeklyStat.week_start)
+        )
+        return result.all()
+
+    async def list_streaks(self, user_id: UUID) -> Sequence[Row[Any]]:
+        """One (days, dishes, last_day) row per run of consecutive cooking days.
+
+        Gaps-and-islands over the daily rollup: within a run, day minus its
+        row number is constant.
+        """
+        run = (
+            CookingDailyStat.day
+            - cast(func.row_number().over(order_by=CookingDailyStat.day), Integer)
+        ).label("run")
+        days = (
+            select(CookingDailyStat.day, CookingDailyStat.dishes, run)
+            .where(CookingDailyStat.user_id == user_id)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(
+                func.count().label("days"),
+                func.sum(days.c.dishes).label("dishes"),
+                func.max(days.c.day).label("last_day"),
+            ).group_by(days.c.run)
+        )
+        return result.all()
+
+    async def list_top_categories(self, user_id: UUID, limit: int) -> Sequence[Row[Any]]:
+        """(category_id, title, dishes) of the user's most cooked categories."""
+        result = await self.db.execute(
+            select(CookingCategoryStat.category_id, Category.title, CookingCategoryStat.dishes)
+            .join(Category, Category.id == CookingCategoryStat.category_id)
+            .where(CookingCategoryStat.user_id == user_id)
+            .order_by(
+                CookingCategoryStat.dishes.desc(),
+                CookingCategoryStat.last_cooked_on.desc(),
+                Category.title,
+            )
+            .limit(limit)
+        )
+        return result.all()
+
+    async def list_activity(self, since: date) -> Sequence[Row[Any]]:
+        """(day, dishes) rows across all users from ``since`` on, oldest first."""
+        result = await self.db.execute(
+            select(CookingActivityStat.day, CookingActivityStat.dishes)
+            .where(CookingActivityStat.day >= since)
+            .order_by(CookingActivityStat.day)
+        )
+        return result.all()
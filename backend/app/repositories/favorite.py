@@ -2,15 +2,61 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import ColumnElement, Row, and_, delete, exists, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.config import get_settings
+from app.models.dismissed_featured import UserDismissedFeatured
 from app.models.favorite import FavoriteRecipe
+from app.models.recipe import Recipe
 from app.repositories.base import BaseRepository
 
 
+# Recipe columns shown on a favorites card; the description and nutrition stay unloaded
+CARD_COLUMNS = (
+    Recipe.id, Recipe.slug, Recipe.title, Recipe.photo_url,
+    Recipe.prep_time, Recipe.cook_time, Recipe.difficulty, Recipe.servings,
+)
+
+
+def virtual_featured_favorites() -> bool:
+    """Whether featured recipes count as favorites at read time instead of being copied."""
+    return get_settings().virtual_featured_favorites
+
+
+def _featured_for(user_id: UUID, recipe_id: ColumnElement) -> ColumnElement[bool]:
+    """The recipe row is featured, active and not dismissed by ``user_id``."""
+    return and_(
+        Recipe.is_featured.is_(True),
+        Recipe.is_active.is_(True),
+        ~exists().where(
+            UserDismissedFeatured.user_id == user_id,
+            UserDismissedFeatured.recipe_id == recipe_id,
+        ),
+    )
+
+
+def build_favorited_filter(user_id: UUID) -> ColumnElement[bool]:
+    """Whether the correlated ``Recipe`` row is among ``user_id``'s favorites.
+
+    In virtual mode featured recipes are favorites unless the user dismissed them.
+    """
+    explicit = exists().where(
+        FavoriteRecipe.recipe_id == Recipe.id, FavoriteRecipe.user_id == user_id,
+    )
+    if not virtual_featured_favorites():
+        return explicit
+    return or_(explicit, _featured_for(user_id, Recipe.id))
+
+
 class FavoriteRepository(BaseRepository[FavoriteRecipe]):
     model = FavoriteRecipe
 
@@ -22,6 +68,74 @@ class FavoriteRepository(BaseRepository[FavoriteRecipe]):
         )
         return result.scalar_one_or_none()
 
+    async def is_virtual_favorite(self, user_id: UUID, recipe_id: UUID) -> bool:
+        """Whether the recipe is a favorite only by being featured (virtual mode)."""
+        if not virtual_featured_favorites():
+            return False
+        result = await self.db.execute(
+            select(exists().where(Recipe.id == recipe_id, _featured_for(user_id, Recipe.id)))
+        )
+        return result.scalar_one()
+
+    async def add(self, user_id: UUID, recipe_ids: Sequence[UUID]) -> list[UUID]:
+        """Favorite ``recipe_ids`` in one INSERT ... ON CONFLICT DO NOTHING; returns the ids added.
+
+        Ids that are already favorites (including virtual ones) or name no
+        recipe are skipped, so repeating a call is harmless.
+        """
+        rows = select(
+            func.gen_random_uuid(), literal(user_id, PGUUID(as_uuid=True)), Recipe.id,
+        ).where(Recipe.id.in_(recipe_ids))
+        if virtual_featured_favorites():
+            rows = rows.where(~_featured_for(user_id, Recipe.id))
+        result = await self.db.execute(
+            pg_insert(FavoriteRecipe)
+            .from_select(["id", "user_id", "recipe_id"], rows)
+            .on_conflict_do_nothing(constraint="uq_user_recipe_favorite")
+            .returning(FavoriteRecipe.recipe_id)
+        )
+        return list(result.scalars().all())
+
+    async def remove(self, user_id: UUID, recipe_ids: Sequence[UUID]) -> list[UUID]:
+        """Un-favorite ``recipe_ids`` in one statement; returns the ids that were favorites.
+
+        A data-modifying CTE deletes the favorite rows and, for featured recipes,
+        records the dismissals so sync (or virtual mode) does not bring them
+        back. In virtual mode a featured recipe without a row is a favorite too:
+        a newly recorded dismissal of an active recipe means one was removed.
+        """
+        virtual = virtual_featured_favorites()
+        deleted = (
+            delete(FavoriteRecipe)
+            .where(FavoriteRecipe.user_id == user_id, FavoriteRecipe.recipe_id.in_(recipe_ids))
+            .returning(FavoriteRecipe.recipe_id)
+            .cte("deleted")
+        )
+        dismiss = select(
+            func.gen_random_uuid(), literal(user_id, PGUUID(as_uuid=True)), Recipe.id,
+        ).where(Recipe.id.in_(recipe_ids), Recipe.is_featured.is_(True))
+        if not virtual:
+            dismiss = dismiss.where(Recipe.id.in_(select(deleted.c.recipe_id)))
+        dismissed = (
+            pg_insert(UserDismissedFeatured)
+            .from_select(["id", "user_id", "recipe_id"], dismiss)
+            .on_conflict_do_nothing(constraint="uq_user_recipe_dismissed")
+            .returning(UserDismissedFeatured.recipe_id)
+            .cte("dismissed")
+        )
+        removed = select(deleted.c.recipe_id)
+        if virtual:
+            removed = removed.union(
+                select(dismissed.c.recipe_id)
+                .join(Recipe, Recipe.id == dismissed.c.recipe_id)
+                .where(Recipe.is_active.is_(True))
+            )
+        else:
+            # Referenced so the dismissal CTE is part of the statement
+            removed = removed.union(select(dismissed.c.recipe_id))
+        result = await self.db.execute(removed)
+        return list(result.scalars().all())
+
     async def list_by_user(self, user_id: UUID) -> list[FavoriteRecipe]:
         result = await self.db.execute(
             select(FavoriteRecipe)
@@ -29,4 +143,69 @@ class FavoriteRepository(BaseRepository[FavoriteRecipe]):
             .options(selectinload(FavoriteRecipe.recipe))
             .order_by(FavoriteRecipe.created_at.desc())
         )
-        return list(result.scalars().all())
+        favorites = list(result.scalars().all())
+        if not virtual_featured_favorites():
+            return favorites
+
+        explicit_ids = {favorite.recipe_id for favorite in favorites}
+        featured = await self.db.execute(
+            select(Recipe).where(_featured_for(user_id, Recipe.id))
+        )
+        # Virtual entries are not persisted (id is None); featured_at stands in for created_at
+        for recipe in featured.scalars().all():
+            if recipe.id in explicit_ids:
+                continue
+            favorite = FavoriteRecipe(
+                user_id=user_id, recipe_id=recipe.id, created_at=recipe.featured_at or recipe.created_at,
+            )
+            set_committed_value(favorite, "recipe", recipe)
+            favorites.append(favorite)
+        favorites.sort(key=lambda favorite: favorite.created_at, reverse=True)
+        return favorites
+
+    async def list_cards(
+        self, user_id: UUID, limit: int, offset: int = 0, *,
+        after: tuple[datetime, UUID] | None = None, include_total: bool = True,
+    ) -> tuple[Sequence[Row[Any]], int | None]:
+        """Card rows of the user's active favorites, newest first; see BaseRepository.list_seek.
+
+        Rows are CARD_COLUMNS plus ``favorited_at``; ``after`` is the
+        ``(favorited_at, id)`` key of the last card served. In virtual mode
+        featured recipes are listed too, with featured_at as ``favorited_at``.
+        """
+        cards = (
+            select(*CARD_COLUMNS, FavoriteRecipe.created_at.label("favorited_at"))
+            .join(FavoriteRecipe, FavoriteRecipe.recipe_id == Recipe.id)
+            .where(FavoriteRecipe.user_id == user_id, Recipe.is_active.is_(True))
+        )
+        if virtual_featured_favorites():
+            cards = cards.union_all(
+                select(*CARD_COLUMNS, func.coalesce(Recipe.featured_at, Recipe.created_at))
+                .where(
+                    _featured_for(user_id, Recipe.id),
+                    ~exists().where(
+                        FavoriteRecipe.user_id == user_id, FavoriteRecipe.recipe_id == Recipe.id,
+                    ),
+                )
+            )
+        cards = cards.subquery("cards")
+        return await self.list_seek(
+            select(cards), (cards.c.favorited_at, cards.c.id), limit, offset,
+            after=after, include_total=include_total,
+        )
+
+    async def recipe_ids_by_user(self, user_id: UUID) -> set[UUID]:
+        """Ids of the user's favorites: explicit ones ∪ (featured − dismissed) in virtual mode."""
+        query = select(FavoriteRecipe.recipe_id).where(FavoriteRecipe.user_id == user_id)
+        if virtual_featured_favorites():
+            featured = (
+                select(Recipe.id)
+                .where(Recipe.is_featured.is_(True), Recipe.is_active.is_(True))
+                .except_(
+                    select(UserDismissedFeatured.recipe_id)
+                    .where(UserDismissedFeatured.user_id == user_id)
+                )
+            )
+            query = query.union(featured)
+        result = await self.db.execute(query)
+        return set(result.scalars().all())
@@ -0,0 +1,100 @@
+"""Featured sync repository — sync jobs and the chunked featured-to-favorites insert."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import exists, func, select, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.dismissed_featured import UserDismissedFeatured
+from app.models.favorite import FavoriteRecipe
+from app.models.featured_sync import FeaturedSyncConfig, FeaturedSyncJob
+from app.models.recipe import Recipe
+from app.models.user import User
+from app.repositories.base import BaseRepository
+
+
+class FeaturedSyncRepository(BaseRepository[FeaturedSyncJob]):
+    model = FeaturedSyncJob
+
+    async def lock_config(self) -> FeaturedSyncConfig:
+        """Row-lock the sync config for the rest of the transaction, creating it if missing."""
+        result = await self.db.execute(
+            select(FeaturedSyncConfig).where(FeaturedSyncConfig.id == 1).with_for_update()
+        )
+        config = result.scalar_one_or_none()
+        if config is None:
+            config = FeaturedSyncConfig(id=1)
+            self.db.add(config)
+            await self.db.flush()
+        return config
+
+    async def get_latest(self, statuses: Sequence[str] | None = None) -> FeaturedSyncJob | None:
+        query = select(FeaturedSyncJob).order_by(FeaturedSyncJob.created_at.desc()).limit(1)
+        if statuses is not None:
+            query = query.where(FeaturedSyncJob.status.in_(statuses))
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def lock(self, job_id: UUID) -> FeaturedSyncJob:
+        """Load the job row-locked, so two workers never process the same chunk."""
+        result = await self.db.execute(
+            select(FeaturedSyncJob)
+            .where(FeaturedSyncJob.id == job_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
+
+    async def count_users(self) -> int:
+        result = await self.db.execute(select(func.count()).select_from(User))
+        return result.scalar_one()
+
+    async def chunk_end(self, after: UUID | None, size: int) -> UUID | None:
+        """Id of the last user in the chunk following ``after``; None when it is the final chunk."""
+        query = select(User.id).order_by(User.id).offset(size - 1).limit(1)
+        if after is not None:
+            query = query.where(User.id > after)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def insert_featured_favorites(
+        self, job: FeaturedSyncJob, after: UUID | None, through: UUID | None,
+    ) -> int:
+        """Favorite the job's newly featured recipes for users in (after, through].
+
+        One INSERT ... SELECT: pairs already favorited hit the unique constraint,
+        dismissed pairs are anti-joined away. Returns the number of rows inserted.
+        """
+        new_featured = (
+            select(Recipe.id)
+            .where(
+                Recipe.is_featured.is_(True),
+                Recipe.is_active.is_(True),
+                Recipe.featured_at > job.featured_since,
+                Recipe.featured_at <= job.featured_until,
+            )
+            .subquery()
+        )
+        pairs = (
+            select(func.gen_random_uuid(), User.id, new_featured.c.id)
+            .join(new_featured, true())
+            .where(
+                ~exists().where(
+                    UserDismissedFeatured.user_id == User.id,
+                    UserDismissedFeatured.recipe_id == new_featured.c.id,
+                )
+            )
+        )
+        if after is not None:
+            pairs = pairs.where(User.id > after)
+        if through is not None:
+            pairs = pairs.where(User.id <= through)
+        result = await self.db.execute(
+            pg_insert(FavoriteRecipe)
+            .from_select(["id", "user_id", "recipe_id"], pairs)
+            .on_conflict_do_nothing(constraint="uq_user_recipe_favorite")
+        )
+        return result.rowcount
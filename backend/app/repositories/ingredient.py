@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
+from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 
 from app.core.dependencies import PaginationParams
-from app.models.ingredient import Ingredient
+from app.models.ingredient import Ingredient, RecipeIngredient
+from app.models.recipe import Recipe
 from app.repositories.base import BaseRepository
+from app.repositories.recipe import build_search_document_update, refresh_detail_documents
 from app.schemas.pagination import PaginatedResponse
 
 
 class IngredientRepository(BaseRepository[Ingredient]):
     model = Ingredient
+    search_columns = (Ingredient.title,)
 
     async def find_by_title_or_slug(self, title: str, slug: str) -> Ingredient | None:
         result = await self.db.execute(
@@ -27,19 +31,37 @@ class IngredientRepository(BaseRepository[Ingredient]):
     ) -> PaginatedResponse[Ingredient]:
         filters: list[Any] = []
         if search:
-            filters.append(Ingredient.title.ilike(f"%{search}%"))
+            filters.append(self.build_search_filter(search))
         if is_active is not None:
             filters.append(Ingredient.is_active == is_active)
         if slug:
             filters.append(Ingredient.slug == slug)
 
         query = select(Ingredient)
-        count_query = select(func.count()).select_from(Ingredient)
         for f in filters:
             query = query.where(f)
-            count_query = count_query.where(f)
+
+        order: list[Any] = [Ingredient.title.asc()]
+        if search:
+            order.insert(0, self.build_search_rank(search).desc())
 
         return await self.list(
-            pagination, base_query=query, count_query=count_query,
-            order_by=Ingredient.title.asc(),
+            pagination, base_query=query, order_by=order,
         )
+
+    async def linked_recipe_ids(self, ingredient_id: UUID) -> list[UUID]:
+        result = await self.db.execute(
+            select(RecipeIngredient.recipe_id).where(RecipeIngredient.ingredient_id == ingredient_id)
+        )
+        return list(result.scalars().all())
+
+    async def refresh_recipe_documents(
+        self, recipe_ids: Sequence[UUID], *, search: bool = True,
+    ) -> None:
+        """Rebuild detail documents (and, with ``search``, search documents) of recipes
+        that embed this ingredient."""
+        if not recipe_ids:
+            return
+        if search:
+            await self.db.execute(build_search_document_update(Recipe.id.in_(recipe_ids)))
+        await refresh_detail_documents(self.db, recipe_ids)
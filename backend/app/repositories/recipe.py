@@ -2,25 +2,132 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import Row, Select, delete, exists, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    Update,
+    delete,
+    exists,
+    func,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.dependencies import PaginationParams
-from app.models.category import RecipeCategory
+from app.models.category import Category, RecipeCategory
 from app.models.cooking_history import CookingHistory
-from app.models.favorite import FavoriteRecipe
-from app.models.ingredient import RecipeIngredient
+from app.models.ingredient import Ingredient, RecipeIngredient
 from app.models.recipe import Recipe
+from app.models.recipe_document import RecipeDocument
 from app.models.step import Step
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, build_count_query
+from app.repositories.favorite import build_favorited_filter
 from app.schemas.pagination import PaginatedResponse
+from app.schemas.recipe import RecipeDetailResponse
+from app.utils.translit import has_cyrillic, transliterate_sql
+
+# Inline literals: bound parameters would arrive as varchar, not regconfig/"char"
+SEARCH_CONFIG = literal_column("'russian'::regconfig")
+
+
+def build_search_document_update(recipe_filter: ColumnElement[bool] | None = None) -> Update:
+    """UPDATE that rebuilds search_vector/search_translit for the matching recipes.
+
+    Weights: title A, ingredient and category titles B, description C.
+    """
+    ingredient_titles = (
+        select(func.coalesce(func.string_agg(Ingredient.title, " "), ""))
+        .join(RecipeIngredient, RecipeIngredient.ingredient_id == Ingredient.id)
+        .where(RecipeIngredient.recipe_id == Recipe.id)
+        .scalar_subquery()
+    )
+    category_titles = (
+        select(func.coalesce(func.string_agg(Category.title, " "), ""))
+        .join(RecipeCategory, RecipeCategory.category_id == Category.id)
+        .where(RecipeCategory.recipe_id == Recipe.id)
+        .scalar_subquery()
+    )
+
+    def weighted(expr: Any, weight: str) -> Any:
+        return func.setweight(func.to_tsvector(SEARCH_CONFIG, expr), literal_column(f"'{weight}'"))
+
+    vector = (
+        weighted(Recipe.title, "A")
+        .op("||")(weighted(ingredient_titles, "B"))
+        .op("||")(weighted(category_titles, "B"))
+        .op("||")(weighted(Recipe.description, "C"))
+    )
+    translit_source = func.concat_ws(" ", Recipe.title, ingredient_titles, category_titles)
+
+    stmt = update(Recipe).values(
+        search_vector=vector, search_translit=transliterate_sql(translit_source),
+    )
+    if recipe_filter is not None:
+        stmt = stmt.where(recipe_filter)
+    return stmt.execution_options(synchronize_session=False)
+
+
+# Rows per INSERT; keeps bind parameters well under the asyncpg limit
+DOCUMENT_BATCH_SIZE = 1000
+
+
+def build_detail_document(recipe: Recipe) -> dict[str, Any]:
+    """Serialize a recipe loaded with steps, ingredients and categories, minus user flags."""
+    return RecipeDetailResponse(
+        id=recipe.id, title=recipe.title, photo_url=recipe.photo_url,
+        description=recipe.description, protein=recipe.protein,
+        fat=recipe.fat, carbs=recipe.carbs, prep_time=recipe.prep_time,
+        cook_time=recipe.cook_time, difficulty=recipe.difficulty,
+        servings=recipe.servings, slug=recipe.slug, is_active=recipe.is_active,
+        created_at=recipe.created_at, updated_at=recipe.updated_at,
+        steps=recipe.steps, recipe_ingredients=recipe.recipe_ingredients,
+        categories=[rc.category for rc in recipe.recipe_categories],
+    ).model_dump(mode="json", exclude={"is_favorited", "is_in_history"})
+
+
+async def refresh_detail_documents(
+    db: AsyncSession, recipe_ids: Sequence[UUID] | Select,
+) -> dict[UUID, dict[str, Any]]:
+    """Rebuild and upsert RecipeDocument rows for the given recipes; returns the documents.
+
+    Call after flushing the change so the reload sees it.
+    """
+    result = await db.execute(
+        select(Recipe)
+        .where(Recipe.id.in_(recipe_ids))
+        .options(
+            selectinload(Recipe.steps),
+            selectinload(Recipe.recipe_ingredients).selectinload(RecipeIngredient.ingredient),
+            selectinload(Recipe.recipe_categories).selectinload(RecipeCategory.category),
+        )
+        .execution_options(populate_existing=True)
+    )
+    documents = {recipe.id: build_detail_document(recipe) for recipe in result.scalars()}
+
+    rows = [{"recipe_id": rid, "document": doc} for rid, doc in documents.items()]
+    for start in range(0, len(rows), DOCUMENT_BATCH_SIZE):
+        stmt = pg_insert(RecipeDocument).values(rows[start:start + DOCUMENT_BATCH_SIZE])
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[RecipeDocument.recipe_id],
+            set_={"document": stmt.excluded.document, "updated_at": func.now()},
+        ))
+    return documents
 
 
 class RecipeRepository(BaseRepository[Recipe]):
     model = Recipe
+    search_columns = (Recipe.title,)
 
     async def get_with_relations(self, recipe_id: UUID) -> Recipe | None:
         result = await self.db.execute(
@@ -50,7 +157,7 @@ class RecipeRepository(BaseRepository[Recipe]):
     ) -> PaginatedResponse[Recipe]:
         filters: list[Any] = []
         if search:
-            filters.append(Recipe.title.ilike(f"%{search}%"))
+            filters.append(self.build_search_filter(search))
         if is_active is not None:
             filters.append(Recipe.is_active == is_active)
         if slug:
@@ -63,98 +170,187 @@ class RecipeRepository(BaseRepository[Recipe]):
         query: Select[tuple[Recipe]] = select(Recipe).options(
             selectinload(Recipe.recipe_categories).selectinload(RecipeCategory.category),
         )
-        count_query = select(func.count()).select_from(Recipe)
-
         for f in filters:
             query = query.where(f)
-            count_query = count_query.where(f)
 
         if category_id:
             query = query.join(RecipeCategory).where(RecipeCategory.category_id == category_id)
-            count_query = select(func.count()).select_from(Recipe).join(RecipeCategory).where(
-                RecipeCategory.category_id == category_id,
-            )
-            for f in filters:
-                count_query = count_query.where(f)
 
-        order = self.SORT_OPTIONS.get(sort_by, Recipe.created_at.desc())
+        order: list[Any] = [self.SORT_OPTIONS.get(sort_by, Recipe.created_at.desc())]
+        if search and sort_by not in self.SORT_OPTIONS:
+            order.insert(0, self.build_search_rank(search).desc())
 
-        return await self.list(
-            pagination, base_query=query, count_query=count_query,
-            order_by=order,
-        )
+        return await self.list(pagination, base_query=query, order_by=order)
 
     async def list_client(
         self, limit: int, offset: int, user_id: UUID, *,
         category_id: UUID | None = None, search: str | None = None, slug: str | None = None,
         is_in_history: bool | None = None, is_favorited: bool | None = None,
-        random: bool = False,
-    ) -> tuple[Sequence[Row[Any]], int]:
+        after: tuple[datetime, UUID] | None = None,
+        sample_start: float | None = None,
+        sample_after: tuple[bool, float, UUID] | None = None,
+        exclude_cooked_since: datetime | None = None,
+        fulltext: bool = False,
+        include_total: bool = True,
+    ) -> tuple[Sequence[Row[Any]], int | None]:
+        """Return up to ``limit + 1`` rows and the total match count (None unless ``include_total``).
+
+        The extra row lets the caller detect a following page. When ``after`` is
+        given, rows are sought past that ``(created_at, id)`` key instead of
+        skipped with OFFSET, so deep pages cost the same as the first one.
+
+        When ``sample_start`` is given, rows come in shuffled order: the
+        precomputed ``sample_key`` ring is walked from that point and wrapped
+        once, so pages of one session never repeat a recipe. ``sample_after``
+        is ``(wrapped, sample_key, id)`` of the last row already served.
+
+        With ``fulltext``, ``search`` is matched against the Russian search_vector
+        (or, for Latin queries, the transliterated document) and ranked accordingly.
+
+        Offset pages carry the total as ``COUNT(*) OVER()``; cursor and shuffled
+        pages only see the rows past their seek key, so they count separately.
+
+        Rows are catalog columns only: the per-user favorite/history flags come
+        from MembershipService. ``user_id`` is used by the membership filters.
+        """
         history_exists = exists(
             select(CookingHistory.id).where(
                 CookingHistory.recipe_id == Recipe.id, CookingHistory.user_id == user_id,
             )
         )
 
-        favorite_exists = exists(
-            select(FavoriteRecipe.id).where(
-                FavoriteRecipe.recipe_id == Recipe.id, FavoriteRecipe.user_id == user_id,
-            )
-        )
+        favorite_exists = build_favorited_filter(user_id)
 
         query = select(
             Recipe.id, Recipe.slug, Recipe.title, Recipe.photo_url,
             Recipe.prep_time, Recipe.cook_time, Recipe.difficulty, Recipe.servings,
-            favorite_exists.label("is_favorited"),
-            history_exists.label("is_in_history"),
+            Recipe.created_at, Recipe.sample_key,
         ).where(Recipe.is_active.is_(True))
 
-        count_query = select(func.count()).select_from(Recipe).where(Recipe.is_active.is_(True))
-
         if is_in_history is True:
             query = query.where(history_exists)
-            count_query = count_query.where(history_exists)
         elif is_in_history is False:
             query = query.where(~history_exists)
-            count_query = count_query.where(~history_exists)
 
         if is_favorited is True:
             query = query.where(favorite_exists)
-            count_query = count_query.where(favorite_exists)
         elif is_favorited is False:
             query = query.where(~favorite_exists)
-            count_query = count_query.where(~favorite_exists)
+
+        if exclude_cooked_since is not None:
+            cooked_recently = exists(
+                select(CookingHistory.id).where(
+                    CookingHistory.recipe_id == Recipe.id, CookingHistory.user_id == user_id,
+                    CookingHistory.cooked_at >= exclude_cooked_since,
+                )
+            )
+            query = query.where(~cooked_recently)
 
         if category_id:
             query = query.join(RecipeCategory).where(RecipeCategory.category_id == category_id)
-            count_query = count_query.join(RecipeCategory).where(RecipeCategory.category_id == category_id)
+        search_rank = None
         if search:
-            query = query.where(Recipe.title.ilike(f"%{search}%"))
-            count_query = count_query.where(Recipe.title.ilike(f"%{search}%"))
+            if fulltext:
+                search_filter, search_rank = self._fulltext_search(search)
+            else:
+                search_filter, search_rank = (
+                    self.build_search_filter(search), self.build_search_rank(search),
+                )
+            query = query.where(search_filter)
         if slug:
             query = query.where(Recipe.slug == slug)
-            count_query = count_query.where(Recipe.slug == slug)
 
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar_one()
+        if sample_start is not None:
+            total = await self.count(build_count_query(query)) if include_total else None
+            return await self._list_sampled(query, limit, offset, sample_start, sample_after), total
 
-        order = func.random() if random else Recipe.created_at.desc()
-        query = query.offset(offset).limit(limit).order_by(order)
-        result = await self.db.execute(query)
-        return result.all(), total
+        if search_rank is not None:
+            query = query.order_by(search_rank.desc())
+        query = query.order_by(Recipe.created_at.desc(), Recipe.id.desc())
 
-    async def get_user_flags(self, recipe_id: UUID, user_id: UUID) -> tuple[bool, bool]:
-        fav = await self.db.execute(
-            select(FavoriteRecipe.id).where(
-                FavoriteRecipe.recipe_id == recipe_id, FavoriteRecipe.user_id == user_id,
-            )
+        if after is not None:
+            # Counted before the seek predicate, which would hide the rows already served
+            total = await self.count(build_count_query(query)) if include_total else None
+            query = query.where(tuple_(Recipe.created_at, Recipe.id) < tuple_(*after))
+            result = await self.db.execute(query.limit(limit + 1))
+            return result.all(), total
+
+        if not include_total:
+            result = await self.db.execute(query.offset(offset).limit(limit + 1))
+            return result.all(), None
+
+        result = await self.db.execute(
+            query.add_columns(func.count().over().label("total")).offset(offset).limit(limit + 1)
         )
-        hist = await self.db.execute(
-            select(CookingHistory.id).where(
-                CookingHistory.recipe_id == recipe_id, CookingHistory.user_id == user_id,
-            )
+        rows = result.all()
+        if rows:
+            return rows, rows[0].total
+        # Past the last page the window has no rows to report on
+        return rows, (await self.count(build_count_query(query)) if offset else 0)
+
+    @staticmethod
+    def _fulltext_search(search: str) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+        """Filter and rank for the ranked search mode.
+
+        Cyrillic queries are stemmed with the Russian config; Latin queries such as
+        "borsch" are fuzzy-matched word-wise against the transliterated document.
+        """
+        if has_cyrillic(search):
+            tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, search)
+            return Recipe.search_vector.op("@@")(tsquery), func.ts_rank_cd(Recipe.search_vector, tsquery)
+        term = literal(search.lower())
+        return Recipe.search_translit.op("%>")(term), func.word_similarity(term, Recipe.search_translit)
+
+    async def refresh_search_documents(self, recipe_ids: Sequence[UUID] | Select | None = None) -> None:
+        """Rebuild search documents for the given recipes (all recipes when None)."""
+        recipe_filter = Recipe.id.in_(recipe_ids) if recipe_ids is not None else None
+        await self.db.execute(build_search_document_update(recipe_filter))
+
+    async def refresh_detail_documents(
+        self, recipe_ids: Sequence[UUID] | Select,
+    ) -> dict[UUID, dict[str, Any]]:
+        return await refresh_detail_documents(self.db, recipe_ids)
+
+    async def get_detail_documents(self, recipe_ids: Sequence[UUID]) -> dict[UUID, dict[str, Any]]:
+        result = await self.db.execute(
+            select(RecipeDocument.recipe_id, RecipeDocument.document)
+            .where(RecipeDocument.recipe_id.in_(recipe_ids))
         )
-        return fav.first() is not None, hist.first() is not None
+        return {row.recipe_id: row.document for row in result}
+
+    async def _list_sampled(
+        self, query: Select, limit: int, offset: int,
+        start: float, after: tuple[bool, float, UUID] | None,
+    ) -> list[Row[Any]]:
+        """Walk the sample_key ring from ``start``: first keys >= start, then keys < start."""
+        key = tuple_(Recipe.sample_key, Recipe.id)
+        head = query.where(Recipe.sample_key >= start)
+        tail = query.where(Recipe.sample_key < start)
+
+        if after is None and offset:
+            # Legacy offset paging: a single ordered query, correct but without the index seek
+            wrapped = Recipe.sample_key < start
+            result = await self.db.execute(
+                query.order_by(wrapped, Recipe.sample_key, Recipe.id).offset(offset).limit(limit + 1)
+            )
+            return list(result.all())
+
+        if after is None:
+            segments = [head, tail]
+        else:
+            after_wrapped, after_key, after_id = after
+            seek = key > tuple_(after_key, after_id)
+            segments = [tail.where(seek)] if after_wrapped else [head.where(seek), tail]
+
+        rows: list[Row[Any]] = []
+        for segment in segments:
+            result = await self.db.execute(
+                segment.order_by(Recipe.sample_key, Recipe.id).limit(limit + 1 - len(rows))
+            )
+            rows.extend(result.all())
+            if len(rows) > limit:
+                break
+        return rows
 
     async def replace_categories(self, recipe_id: UUID, category_ids: list[UUID]) -> None:
         await self.db.execute(delete(RecipeCategory).where(RecipeCategory.recipe_id == recipe_id))
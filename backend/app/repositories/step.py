@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import Any
+from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 
 from app.core.dependencies import PaginationParams
 from app.models.step import Step
 from app.repositories.base import BaseRepository
+from app.repositories.recipe import refresh_detail_documents
 from app.schemas.pagination import PaginatedResponse
 
 
 class StepRepository(BaseRepository[Step]):
     model = Step
+    search_columns = (Step.title,)
 
     async def list_admin(
         self, pagination: PaginationParams, *,
@@ -22,7 +26,7 @@ class StepRepository(BaseRepository[Step]):
     ) -> PaginatedResponse[Step]:
         filters: list[Any] = []
         if search:
-            filters.append(Step.title.ilike(f"%{search}%"))
+            filters.append(self.build_search_filter(search))
         if is_active is not None:
             filters.append(Step.is_active == is_active)
         if slug:
@@ -31,12 +35,17 @@ class StepRepository(BaseRepository[Step]):
             filters.append(Step.recipe_id == recipe_id)
 
         query = select(Step)
-        count_query = select(func.count()).select_from(Step)
         for f in filters:
             query = query.where(f)
-            count_query = count_query.where(f)
+
+        order: list[Any] = [Step.created_at.desc()]
+        if search:
+            order.insert(0, self.build_search_rank(search).desc())
 
         return await self.list(
-            pagination, base_query=query, count_query=count_query,
-            order_by=Step.created_at.desc(),
+            pagination, base_query=query, order_by=order,
         )
+
+    async def refresh_recipe_documents(self, recipe_ids: Collection[UUID]) -> None:
+        """Rebuild the detail documents of the recipes the step belonged to."""
+        await refresh_detail_documents(self.db, list(recipe_ids))
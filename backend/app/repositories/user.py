@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import ColumnElement, func, or_, select
+from sqlalchemy import Boolean, Row, false, func, literal_column, select, true, tuple_, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.core.dependencies import PaginationParams
 from app.models.user import Admin, User
@@ -15,33 +17,69 @@ from app.schemas.pagination import PaginatedResponse
 
 class UserRepository(BaseRepository[User]):
     model = User
+    search_columns = (User.username, User.first_name, User.last_name)
 
     async def get_by_tg_id(self, tg_id: int) -> User | None:
         result = await self.db.execute(select(User).where(User.tg_id == tg_id))
         return result.scalar_one_or_none()
 
-    def build_search_filter(self, search: str) -> ColumnElement[bool]:
-        pattern = f"%{search}%"
-        return or_(
-            User.username.ilike(pattern),
-            User.first_name.ilike(pattern),
-            User.last_name.ilike(pattern),
+    async def upsert_telegram(
+        self, tg_id: int, tg_username: str | None, first_name: str | None, last_name: str | None,
+    ) -> Row[Any]:
+        """Insert or refresh the Telegram profile of ``tg_id`` in one statement.
+
+        Returns (id, tg_id, tg_username, phone_number, inserted, written). The
+        row is only rewritten when the profile changed. ON CONFLICT still locks
+        the conflicting row, so an unchanged login takes a row lock but writes
+        no new row version; its columns come from the SELECT branch.
+        """
+        stmt = pg_insert(User).values(
+            id=uuid4(), tg_id=tg_id, tg_username=tg_username,
+            first_name=first_name, last_name=last_name,
+        )
+        profile = (User.tg_username, User.first_name, User.last_name)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.tg_id],
+            set_={
+                "tg_username": stmt.excluded.tg_username,
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+                "updated_at": func.now(),
+            },
+            where=tuple_(*profile).is_distinct_from(
+                tuple_(stmt.excluded.tg_username, stmt.excluded.first_name, stmt.excluded.last_name)
+            ),
         )
+        columns = (User.id, User.tg_id, User.tg_username, User.phone_number)
+        upsert = stmt.returning(
+            *columns,
+            # xmax is 0 only on a freshly inserted row version
+            literal_column("users.xmax = 0", Boolean).label("inserted"),
+            true().label("written"),
+        ).cte("upsert")
+        existing = select(*columns, false().label("inserted"), false().label("written"))
+        unchanged = existing.where(User.tg_id == tg_id, ~select(upsert.c.id).exists())
+        result = await self.db.execute(union_all(select(upsert), unchanged))
+        row = result.one_or_none()
+        if row is None:
+            # A concurrent first login committed after this statement's snapshot was taken
+            result = await self.db.execute(existing.where(User.tg_id == tg_id))
+            row = result.one()
+        return row
 
     async def list_admin(
         self, pagination: PaginationParams, *, search: str | None = None,
     ) -> PaginatedResponse[User]:
         query = select(User)
-        count_query = select(func.count()).select_from(User)
+        order: list[Any] = [User.created_at.desc()]
 
         if search:
             search_filter = self.build_search_filter(search)
             query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
+            order.insert(0, self.build_search_rank(search).desc())
 
         return await self.list(
-            pagination, base_query=query, count_query=count_query,
-            order_by=User.created_at.desc(),
+            pagination, base_query=query, order_by=order,
         )
 
     async def get_admin_by_username(self, username: str) -> Admin | None:
@@ -51,3 +89,7 @@ class UserRepository(BaseRepository[User]):
     async def get_admin_by_user_id(self, user_id: UUID) -> Admin | None:
         result = await self.db.execute(select(Admin).where(Admin.user_id == user_id))
         return result.scalar_one_or_none()
+
+    async def list_admin_user_ids(self) -> Sequence[UUID]:
+        result = await self.db.execute(select(Admin.user_id))
+        return result.scalars().all()
@@ -1,6 +1,6 @@
 """Cooking history Pydantic schemas."""
 
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -31,3 +31,49 @@ class CookingHistoryRecentResponse(BaseModel):
     id: UUID
     cooked_at: datetime
     recipe: CookingHistoryRecipeInfo
+
+
+class CookingHistoryRecipeCard(CookingHistoryRecipeInfo):
+    slug: str
+    prep_time: int
+    cook_time: int
+    difficulty: str
+    servings: str
+
+
+class CookingHistoryCardResponse(BaseModel):
+    id: UUID
+    cooked_at: datetime
+    recipe: CookingHistoryRecipeCard
+
+
+class CookingDayStat(BaseModel):
+    day: date
+    dishes: int
+
+
+class CookingWeekStat(BaseModel):
+    week_start: date
+    dishes: int
+
+
+class CookingCategoryStat(BaseModel):
+    category_id: UUID
+    title: str
+    dishes: int
+
+
+class CookingStatsResponse(BaseModel):
+    total_dishes: int
+    # Consecutive cooking days ending today or yesterday (in the user's timezone)
+    current_streak: int
+    longest_streak: int
+    # One entry per day of the window, oldest first; days without cooking have 0 dishes
+    daily: list[CookingDayStat]
+    # Weeks (Monday start) overlapping the window that have dishes, oldest first
+    weekly: list[CookingWeekStat]
+    top_categories: list[CookingCategoryStat]
+
+
+class CookingActivityResponse(BaseModel):
+    daily: list[CookingDayStat]
@@ -11,6 +11,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
     model_config = ConfigDict(arbitrary_types_allowed=True, from_attributes=True)
 
     items: list[T]
-    total: int
+    total: int | None  # None when the caller opted out with include_total=false
     limit: int
     offset: int
+    has_more: bool = False
+    next_cursor: str | None = None
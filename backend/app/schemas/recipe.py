@@ -2,10 +2,12 @@
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.core.constants import FAVORITES_BULK_MAX_IDS
 from app.models.recipe import DifficultyEnum
 from app.schemas.category import CategoryResponse
 from app.schemas.ingredient import RecipeIngredientResponse
@@ -134,11 +136,46 @@ class RecipeDetailResponse(BaseModel):
     is_in_history: bool = False
 
 
+class RecipeBatchItem(BaseModel):
+    id: UUID
+    status: int
+    recipe: RecipeDetailResponse | None = None
+
+
+class RecipeBatchResponse(BaseModel):
+    items: list[RecipeBatchItem]
+
+
 class FavoriteToggleResponse(BaseModel):
     id: UUID
     is_favorited: bool
 
 
+class FavoriteCardResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    slug: str
+    title: str
+    photo_url: str
+    prep_time: int
+    cook_time: int
+    difficulty: str
+    servings: str
+    favorited_at: datetime
+
+
+class FavoriteBulkRequest(BaseModel):
+    action: Literal["add", "remove"]
+    recipe_ids: list[UUID] = Field(..., min_length=1, max_length=FAVORITES_BULK_MAX_IDS)
+
+
+class FavoriteBulkResponse(BaseModel):
+    action: Literal["add", "remove"]
+    # Ids whose state changed; the rest already were in the requested state or are unknown
+    changed: list[UUID]
+
+
 class HistoryToggleResponse(BaseModel):
     id: UUID
     is_in_history: bool
@@ -149,5 +186,15 @@ class RecipeDeleteResponse(BaseModel):
     is_deleted: bool = True
 
 
-class FeaturedSyncResponse(BaseModel):
-    added: int
+class FeaturedSyncJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    status: str
+    chunks_done: int
+    chunks_total: int
+    rows_inserted: int
+    started_at: datetime | None
+    finished_at: datetime | None
+    error: str | None
+    eta_seconds: float | None = None
@@ -2,8 +2,9 @@
 
 from datetime import datetime
 from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class UserUpdate(BaseModel):
@@ -11,6 +12,18 @@ class UserUpdate(BaseModel):
     phone_number: str | None = Field(None, max_length=20)
     first_name: str | None = Field(None, max_length=255)
     last_name: str | None = Field(None, max_length=255)
+    timezone: str | None = Field(None, max_length=64, description="IANA zone, e.g. Europe/Moscow")
+
+    @field_validator("timezone")
+    @classmethod
+    def validate_timezone(cls, value: str | None) -> str:
+        if value is None:
+            raise ValueError("timezone cannot be null")
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError) as exc:
+            raise ValueError(f"Unknown timezone: {value}") from exc
+        return value
 
 
 class UserResponse(BaseModel):
@@ -23,6 +36,7 @@ class UserResponse(BaseModel):
     phone_number: str | None
     first_name: str | None
     last_name: str | None
+    timezone: str
     created_at: datetime
     updated_at: datetime
 
@@ -46,6 +60,7 @@ class UserAdminResponse(BaseModel):
     phone_number: str | None
     first_name: str | None
     last_name: str | None
+    timezone: str
     created_at: datetime
     updated_at: datetime
 
@@ -0,0 +1,58 @@
+"""Admin cache — per-worker set of the user ids in ``admins``, behind admin authorization."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from app.core import events
+from app.core.constants import ADMIN_CACHE_TTL
+
+ADMIN_CACHE_CHANNEL = "admin_cache:invalidate"
+
+
+class AdminCache:
+    """The admin user ids, reloaded when any worker changes them or ``ttl`` seconds after loading.
+
+    Writers call invalidate_admins; rows changed behind the application's back
+    (a manual DELETE FROM admins, a missed message) stop counting after at most
+    ``ttl``.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._user_ids: frozenset[UUID] | None = None
+        self._expires_at = 0.0
+        # Bumped on every invalidation, so a load that raced one is not stored
+        self.version = 0
+
+    def get(self) -> frozenset[UUID] | None:
+        if self._user_ids is None or self._expires_at <= time.monotonic():
+            return None
+        return self._user_ids
+
+    def put(self, user_ids: Iterable[UUID], version: int) -> frozenset[UUID]:
+        """Store the set loaded when the cache was at ``version``; skipped if it moved on."""
+        loaded = frozenset(user_ids)
+        if version == self.version:
+            self._user_ids = loaded
+            self._expires_at = time.monotonic() + self.ttl
+        return loaded
+
+    def clear(self) -> None:
+        self.version += 1
+        self._user_ids = None
+
+
+admin_cache = AdminCache(ADMIN_CACHE_TTL)
+
+events.subscribe(ADMIN_CACHE_CHANNEL, lambda message: admin_cache.clear(), resync=admin_cache.clear)
+
+
+async def invalidate_admins(redis: Redis) -> None:
+    """Reload the admin set on next use, in this worker and the others."""
+    admin_cache.clear()
+    await events.publish(redis, ADMIN_CACHE_CHANNEL, "")
@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any
 
-import bcrypt
 import structlog
 from redis.asyncio import Redis
 
 from app.core.config import get_settings
-from app.core.constants import REDIS_BLACKLIST_VALUE, TOKEN_TYPE
-from sqlalchemy import select
+from app.core.constants import ADMIN_ROLE, TOKEN_TYPE, USER_ROLE
+from app.core.database import after_commit
+from sqlalchemy import Row, func, literal, select
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.core.exceptions import BadRequestException, UnauthorizedException
+from app.core.passwords import get_password_hasher
 from app.core.security import (
     create_access_token,
     create_refresh_token,
@@ -23,8 +27,11 @@ from app.core.security import (
 )
 from app.models.favorite import FavoriteRecipe
 from app.models.recipe import Recipe
-from app.models.user import Admin, User
+from app.models.user import Admin
+from app.repositories.favorite import virtual_featured_favorites
 from app.repositories.user import UserRepository
+from app.services.token_revocations import is_revoked, revoke
+from app.services.user_cache import invalidate_user
 from app.schemas.auth import (
     AdminLoginResponse,
     LoginResponse,
@@ -35,8 +42,6 @@ from app.schemas.auth import (
 
 logger = structlog.get_logger()
 
-TOKEN_BLACKLIST_PREFIX = "bl:"
-
 
 class AuthService:
     def __init__(self, repo: UserRepository, redis: Redis) -> None:
@@ -52,7 +57,7 @@ class AuthService:
         if not verify_telegram_hash(data_str, settings.telegram_bot_token):
             raise BadRequestException("Invalid Telegram authentication data")
 
-        user = await self._get_or_create_user(auth_data)
+        user = await self._upsert_user(auth_data)
 
         access_token = create_access_token(user.id)
         refresh_token = create_refresh_token(user.id)
@@ -92,7 +97,7 @@ class AuthService:
             hash=parsed.get("hash", [""])[0],
         )
 
-        user = await self._get_or_create_user(auth_data)
+        user = await self._upsert_user(auth_data)
 
         access_token = create_access_token(user.id)
         refresh_token = create_refresh_token(user.id)
@@ -120,7 +125,7 @@ class AuthService:
             auth_date=int(datetime.now(timezone.utc).timestamp()),
             hash="dev",
         )
-        user = await self._get_or_create_user(auth_data)
+        user = await self._upsert_user(auth_data)
 
         access_token = create_access_token(user.id)
         refresh_token = create_refresh_token(user.id)
@@ -141,11 +146,11 @@ class AuthService:
         if admin is None or admin.password_hash is None:
             raise UnauthorizedException("Invalid username or password")
 
-        if not bcrypt.checkpw(password.encode("utf-8"), admin.password_hash.encode("utf-8")):
+        if not await get_password_hasher().check(password, admin.password_hash):
             raise UnauthorizedException("Invalid username or password")
 
-        access_token = create_access_token(admin.user_id)
-        refresh_token = create_refresh_token(admin.user_id)
+        access_token = create_access_token(admin.user_id, role=ADMIN_ROLE)
+        refresh_token = create_refresh_token(admin.user_id, role=ADMIN_ROLE)
 
         logger.info("admin_authenticated", user_id=str(admin.user_id), username=username)
         return AdminLoginResponse(
@@ -169,7 +174,13 @@ class AuthService:
         if user is None:
             raise UnauthorizedException("User not found")
 
-        access_token = create_access_token(user.id)
+        # Carry the admin role over only while the user is still an admin; a
+        # token from before the role claim gets an access token without one
+        role = payload.get("role")
+        if role == ADMIN_ROLE and await self.repo.get_admin_by_user_id(user.id) is None:
+            role = USER_ROLE
+
+        access_token = create_access_token(user.id, role=role)
         logger.info("tokens_refreshed", user_id=str(user.id))
         return RefreshResponse(
             access_token=access_token, token_type=TOKEN_TYPE,
@@ -184,7 +195,7 @@ class AuthService:
         return LogoutResponse(message="Successfully logged out")
 
     async def _blacklist_token(self, token: str) -> None:
-        """Add a token's jti to the Redis blacklist with TTL = remaining lifetime."""
+        """Revoke a token's jti until the token would have expired anyway."""
         try:
             payload = decode_token_payload(token)
         except Exception:
@@ -194,41 +205,40 @@ class AuthService:
         if not jti:
             return
 
-        exp = payload.get("exp", 0)
-        ttl = max(int(exp - datetime.now(timezone.utc).timestamp()), 0)
-        if ttl > 0:
-            await self.redis.setex(f"{TOKEN_BLACKLIST_PREFIX}{jti}", ttl, REDIS_BLACKLIST_VALUE)
+        await revoke(self.redis, jti, payload.get("exp", 0))
 
     async def _is_blacklisted(self, jti: str) -> bool:
-        return await self.redis.exists(f"{TOKEN_BLACKLIST_PREFIX}{jti}") > 0
+        return await is_revoked(self.redis, jti)
 
-    async def _get_or_create_user(self, auth_data: TelegramAuthData) -> User:
-        user = await self.repo.get_by_tg_id(auth_data.id)
+    async def _upsert_user(self, auth_data: TelegramAuthData) -> Row[Any]:
+        """Create the user on first login, otherwise refresh their Telegram profile.
 
-        if user is not None:
-            user.tg_username = auth_data.username
-            user.first_name = auth_data.first_name
-            user.last_name = auth_data.last_name
-            await self.repo.flush()
-            return user
-
-        user = User(
-            tg_id=auth_data.id, tg_username=auth_data.username,
-            first_name=auth_data.first_name, last_name=auth_data.last_name,
+        One statement either way; featured recipes are copied only for a new user.
+        """
+        user = await self.repo.upsert_telegram(
+            auth_data.id, auth_data.username, auth_data.first_name, auth_data.last_name,
         )
-        await self.repo.create(user)
-        await self._copy_featured_to_favorites(user.id)
-        logger.info("user_created", user_id=str(user.id), tg_id=auth_data.id)
+        if user.inserted:
+            await self._copy_featured_to_favorites(user.id)
+            logger.info("user_created", user_id=str(user.id), tg_id=auth_data.id)
+        elif user.written:
+            after_commit(self.repo.db, lambda: invalidate_user(self.redis, user.id))
         return user
 
     async def _copy_featured_to_favorites(self, user_id: UUID) -> None:
-        """Copy all featured recipes into the new user's favorites."""
-        db = self.repo.db
-        result = await db.execute(
-            select(Recipe.id).where(Recipe.is_featured.is_(True), Recipe.is_active.is_(True))
+        """Copy all featured recipes into the new user's favorites.
+
+        Nothing to copy when featured favorites are resolved at read time.
+        """
+        if virtual_featured_favorites():
+            return
+        # One INSERT ... SELECT instead of loading ids and adding a row object per recipe
+        featured = select(
+            func.gen_random_uuid(), literal(user_id, PGUUID(as_uuid=True)), Recipe.id,
+        ).where(Recipe.is_featured.is_(True), Recipe.is_active.is_(True))
+        result = await self.repo.db.execute(
+            pg_insert(FavoriteRecipe)
+            .from_select(["id", "user_id", "recipe_id"], featured)
+            .on_conflict_do_nothing(constraint="uq_user_recipe_favorite")
         )
-        recipe_ids = result.scalars().all()
-        for recipe_id in recipe_ids:
-            db.add(FavoriteRecipe(user_id=user_id, recipe_id=recipe_id))
-        await db.flush()
-        logger.info("featured_copied_to_favorites", user_id=str(user_id), count=len(recipe_ids))
+        logger.info("featured_copied_to_favorites", user_id=str(user_id), count=result.rowcount)
@@ -0,0 +1,117 @@
+"""Catalog cache — shared, user-independent pages of the client recipe feed in Redis."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
+from uuid import UUID
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import after_commit
+
+logger = structlog.get_logger()
+
+CATALOG_PREFIX = "catalog:"
+CATALOG_VERSION_KEY = f"{CATALOG_PREFIX}version"
+CATALOG_TTL = 5 * 60
+
+
+class CatalogRow(NamedTuple):
+    """Catalog columns of one feed row, as selected by RecipeRepository.list_client."""
+
+    id: UUID
+    slug: str
+    title: str
+    photo_url: str
+    prep_time: int
+    cook_time: int
+    difficulty: str
+    servings: str
+    created_at: datetime
+    sample_key: float
+
+
+CachedPage = tuple[list[CatalogRow], int | None]
+
+
+class CatalogCache:
+    """Pages are keyed by the catalog version plus every parameter that shapes the page.
+
+    Invalidation bumps the version instead of deleting keys, so pages of the old
+    catalog are never read again and simply expire after CATALOG_TTL. The bump
+    runs once the writer's transaction commits; a page read before the commit
+    is stored under the old version and never served afterwards. Redis errors
+    degrade to misses.
+    """
+
+    def __init__(self, redis: Redis, db: AsyncSession) -> None:
+        self.redis = redis
+        self.db = db
+
+    async def get(self, params: dict[str, Any]) -> tuple[str | None, CachedPage | None]:
+        """Return the current catalog version and the cached page for ``params``, if any.
+
+        Pass the version back to set() so a page computed while the catalog
+        changed is stored under the version it was read at, never the new one.
+        """
+        try:
+            version = await self.redis.get(CATALOG_VERSION_KEY) or "0"
+            cached = await self.redis.get(self._key(version, params))
+        except RedisError as exc:
+            logger.warning("catalog_cache_unavailable", error=str(exc))
+            return None, None
+        if cached is None:
+            return version, None
+        payload = json.loads(cached)
+        rows = [
+            CatalogRow(UUID(r[0]), *r[1:8], datetime.fromisoformat(r[8]), r[9])
+            for r in payload["rows"]
+        ]
+        return version, (rows, payload["total"])
+
+    async def set(
+        self, version: str | None, params: dict[str, Any], rows: Sequence[Any], total: int | None,
+    ) -> None:
+        if version is None:
+            return
+        payload = {
+            "rows": [
+                [
+                    str(r.id), r.slug, r.title, r.photo_url, r.prep_time, r.cook_time,
+                    r.difficulty, r.servings, r.created_at.isoformat(), r.sample_key,
+                ]
+                for r in rows
+            ],
+            "total": total,
+        }
+        try:
+            await self.redis.setex(self._key(version, params), CATALOG_TTL, json.dumps(payload))
+        except RedisError as exc:
+            logger.warning("catalog_cache_write_failed", error=str(exc))
+
+    def invalidate(self) -> None:
+        """Retire every cached page once the current transaction commits.
+
+        Call after any change visible in the client feed.
+        """
+        after_commit(self.db, self._bump_version)
+
+    async def _bump_version(self) -> None:
+        try:
+            await self.redis.incr(CATALOG_VERSION_KEY)
+        except RedisError as exc:
+            logger.warning("catalog_cache_invalidate_failed", error=str(exc))
+
+    @staticmethod
+    def _key(version: str, params: dict[str, Any]) -> str:
+        digest = hashlib.sha256(
+            json.dumps(params, sort_keys=True, default=str).encode(),
+        ).hexdigest()
+        return f"{CATALOG_PREFIX}{version}:{digest}"
@@ -12,13 +12,15 @@ from app.models.category import Category
 from app.repositories.category import CategoryRepository
 from app.schemas.category import CategoryClientResponse, CategoryCreate, CategoryUpdate
 from app.schemas.pagination import PaginatedResponse
+from app.services.catalog_cache import CatalogCache
 
 logger = structlog.get_logger()
 
 
 class CategoryService:
-    def __init__(self, repo: CategoryRepository) -> None:
+    def __init__(self, repo: CategoryRepository, catalog_cache: CatalogCache) -> None:
         self.repo = repo
+        self.catalog_cache = catalog_cache
 
     async def create(self, data: CategoryCreate) -> Category:
         """Create a category; raises ConflictException if title or slug already exists."""
@@ -57,11 +59,17 @@ class CategoryService:
         category = await self.repo.get_by_id(category_id)
         update_data = data.model_dump(exclude_unset=True)
         category = await self.repo.update(category, update_data)
+        recipe_ids = await self.repo.linked_recipe_ids(category_id)
+        await self.repo.refresh_recipe_documents(recipe_ids, search="title" in update_data)
+        self.catalog_cache.invalidate()
         logger.info("category_updated", category_id=str(category_id))
         return category
 
     async def delete(self, category_id: UUID) -> None:
         """Delete a category by ID; raises NotFoundException if missing."""
         category = await self.repo.get_by_id(category_id)
+        recipe_ids = await self.repo.linked_recipe_ids(category_id)
         await self.repo.delete(category)
+        await self.repo.refresh_recipe_documents(recipe_ids)
+        self.catalog_cache.invalidate()
         logger.info("category_deleted", category_id=str(category_id))
@@ -2,35 +2,52 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
 import structlog
+from sqlalchemy import Row
 
+from app.core.dependencies import PaginationParams
 from app.core.exceptions import ConflictException
 from app.models.cooking_history import CookingHistory
 from app.repositories.cooking_history import CookingHistoryRepository
-from app.schemas.cooking_history import CookingHistoryCreate
+from app.schemas.cooking_history import (
+    CookingHistoryCardResponse,
+    CookingHistoryCreate,
+    CookingHistoryRecipeCard,
+)
+from app.schemas.pagination import PaginatedResponse
+from app.services.cooking_stats import CookingStatsService
+from app.services.membership import HISTORY, MembershipService
+from app.utils.cursor import decode_cursor, encode_cursor
 
 logger = structlog.get_logger()
 
 
 class CookingHistoryService:
-    def __init__(self, repo: CookingHistoryRepository) -> None:
+    def __init__(
+        self,
+        repo: CookingHistoryRepository,
+        membership: MembershipService,
+        stats: CookingStatsService,
+    ) -> None:
         self.repo = repo
+        self.membership = membership
+        self.stats = stats
 
     async def record(self, user_id: UUID, data: CookingHistoryCreate) -> CookingHistory:
         """Record that a user cooked a recipe (creates a new history entry).
 
-        Raises ConflictException if user already recorded a dish today.
+        Raises ConflictException if user already recorded a dish that day.
         """
-        if await self.repo.has_record_today(user_id):
+        history = await self.repo.record(user_id, data.recipe_id, data.cooked_at)
+        if history is None:
             raise ConflictException("Вы уже отметили блюдо сегодня")
 
-        record_data = data.model_dump(exclude_unset=True)
-        record_data["user_id"] = user_id
-
-        history = CookingHistory(**record_data)
-        await self.repo.create(history)
+        await self.stats.record(history)
+        self.membership.invalidate(HISTORY, [user_id])
         logger.info("cooking_recorded", user_id=str(user_id), recipe_id=str(data.recipe_id))
         return history
 
@@ -38,6 +55,37 @@ class CookingHistoryService:
         """Return all cooking history records for a given user."""
         return await self.repo.list_by_user(user_id)
 
-    async def list_recent(self, user_id: UUID, days: int = 7) -> list[CookingHistory]:
-        """Return cooking history records for the last N days."""
+    async def list_cards(
+        self, user_id: UUID, pagination: PaginationParams,
+    ) -> PaginatedResponse[CookingHistoryCardResponse]:
+        """Return a keyset-paginated page of history records with recipe cards, latest first."""
+        after = decode_cursor(pagination.cursor) if pagination.cursor is not None else None
+        rows, total = await self.repo.list_cards(
+            user_id, pagination.limit, pagination.offset,
+            after=after, include_total=pagination.include_total,
+        )
+        has_more = len(rows) > pagination.limit
+        rows = rows[:pagination.limit]
+        next_cursor = encode_cursor(rows[-1].cooked_at, rows[-1].id) if has_more else None
+        items = [
+            CookingHistoryCardResponse(
+                id=row.id,
+                cooked_at=row.cooked_at,
+                recipe=CookingHistoryRecipeCard(
+                    id=row.recipe_id, slug=row.recipe_slug, title=row.recipe_title,
+                    photo_url=row.recipe_photo_url, prep_time=row.recipe_prep_time,
+                    cook_time=row.recipe_cook_time, difficulty=row.recipe_difficulty,
+                    servings=row.recipe_servings,
+                ),
+            )
+            for row in rows
+        ]
+        return PaginatedResponse(
+            items=items, total=total, limit=pagination.limit,
+            offset=0 if after is not None else pagination.offset,
+            has_more=has_more, next_cursor=next_cursor,
+        )
+
+    async def list_recent(self, user_id: UUID, days: int = 7) -> Sequence[Row[Any]]:
+        """Return the last N days of records as rows; see list_recent_by_user."""
         return await self.repo.list_recent_by_user(user_id, days)
@@ -0,0 +1,91 @@
+"""Cooking stats service — user and admin statistics served from the cooking rollups."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from app.core.constants import COOKING_STATS_TOP_CATEGORIES, DEFAULT_TIMEZONE
+from app.models.cooking_history import CookingHistory
+from app.repositories.cooking_stats import CookingStatsRepository, week_start
+from app.schemas.cooking_history import (
+    CookingActivityResponse,
+    CookingCategoryStat,
+    CookingDayStat,
+    CookingStatsResponse,
+    CookingWeekStat,
+)
+
+
+def _fill_days(rows: list[tuple[date, int]], since: date, until: date) -> list[CookingDayStat]:
+    """One entry per day in [since, until]; days missing from ``rows`` get 0 dishes."""
+    dishes = dict(rows)
+    days = (since + timedelta(days=offset) for offset in range((until - since).days + 1))
+    return [CookingDayStat(day=day, dishes=dishes.get(day, 0)) for day in days]
+
+
+class CookingStatsService:
+    """Reads cost O(days in the window + cooking days of the user), never O(history rows)."""
+
+    def __init__(self, repo: CookingStatsRepository) -> None:
+        self.repo = repo
+
+    async def record(self, history: CookingHistory) -> None:
+        """Count a newly recorded dish into the rollups, in the recording transaction."""
+        await self.repo.apply(history)
+
+    async def forget_recipe(self, recipe_id: UUID) -> None:
+        """Delete the recipe's history and uncount it from the rollups, before deleting the recipe."""
+        await self.repo.retract(recipe_id=recipe_id)
+
+    async def uncount_categories(self, recipe_id: UUID) -> None:
+        """Take the recipe's history off its category rollups, before its categories change."""
+        await self.repo.uncount_categories(recipe_id)
+
+    async def count_categories(self, recipe_id: UUID) -> None:
+        """Count the recipe's history into its category rollups, after its categories changed."""
+        await self.repo.count_categories(recipe_id)
+
+    async def forget_user(self, user_id: UUID) -> None:
+        """Delete the user's history and uncount it from the rollups, before deleting the user."""
+        await self.repo.retract(user_id=user_id)
+
+    async def user_stats(self, user_id: UUID, days: int) -> CookingStatsResponse:
+        """Streaks, totals and top categories, plus daily and weekly dishes of the last ``days``."""
+        today = await self.repo.today(user_id)
+        since = today - timedelta(days=days - 1)
+
+        current_streak = longest_streak = total_dishes = 0
+        for streak in await self.repo.list_streaks(user_id):
+            total_dishes += streak.dishes
+            longest_streak = max(longest_streak, streak.days)
+            if streak.last_day >= today - timedelta(days=1):
+                current_streak = streak.days
+
+        daily = await self.repo.list_days(user_id, since)
+        weekly = await self.repo.list_weeks(user_id, week_start(since))
+        categories = await self.repo.list_top_categories(user_id, COOKING_STATS_TOP_CATEGORIES)
+        return CookingStatsResponse(
+            total_dishes=total_dishes,
+            current_streak=current_streak,
+            longest_streak=longest_streak,
+            daily=_fill_days([(row.day, row.dishes) for row in daily], since, today),
+            weekly=[CookingWeekStat(week_start=r.week_start, dishes=r.dishes) for r in weekly],
+            top_categories=[
+                CookingCategoryStat(category_id=row.category_id, title=row.title, dishes=row.dishes)
+                for row in categories
+            ],
+        )
+
+    async def activity(self, days: int) -> CookingActivityResponse:
+        """Dishes per day across all users for the last ``days`` days.
+
+        Records fall on their users' local days; the window ends today in DEFAULT_TIMEZONE.
+        """
+        today = datetime.now(ZoneInfo(DEFAULT_TIMEZONE)).date()
+        since = today - timedelta(days=days - 1)
+        rows = await self.repo.list_activity(since)
+        return CookingActivityResponse(
+            daily=_fill_days([(row.day, row.dishes) for row in rows], since, today),
+        )
@@ -5,65 +5,84 @@ from __future__ import annotations
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select
 
-from app.core.exceptions import ConflictException, NotFoundException
-from app.models.dismissed_featured import UserDismissedFeatured
+from app.core.dependencies import PaginationParams
+from app.core.exceptions import NotFoundException
 from app.models.favorite import FavoriteRecipe
-from app.models.recipe import Recipe
 from app.repositories.favorite import FavoriteRepository
+from app.schemas.pagination import PaginatedResponse
+from app.schemas.recipe import FavoriteCardResponse
+from app.services.membership import FAVORITES, MembershipService
+from app.utils.cursor import decode_cursor, encode_cursor
 
 logger = structlog.get_logger()
 
 
 class FavoriteService:
-    def __init__(self, repo: FavoriteRepository) -> None:
+    def __init__(self, repo: FavoriteRepository, membership: MembershipService) -> None:
         self.repo = repo
+        self.membership = membership
 
-    async def add(self, user_id: UUID, recipe_id: UUID) -> FavoriteRecipe:
-        """Add a recipe to user's favorites; raises ConflictException if already added."""
-        existing = await self.repo.find(user_id, recipe_id)
-        if existing is not None:
-            raise ConflictException("Recipe is already in favorites")
+    async def add(self, user_id: UUID, recipe_id: UUID) -> bool:
+        """Add a recipe to user's favorites; returns False if it already was one.
 
-        favorite = FavoriteRecipe(user_id=user_id, recipe_id=recipe_id)
-        await self.repo.create(favorite)
-        logger.info("favorite_added", user_id=str(user_id), recipe_id=str(recipe_id))
-        return favorite
+        Idempotent, so a double tap never fails; raises NotFoundException for an unknown recipe.
+        """
+        added = await self.add_many(user_id, [recipe_id])
+        if not added and not await self.is_favorite(user_id, recipe_id):
+            raise NotFoundException("Recipe", recipe_id)
+        return bool(added)
 
     async def remove(self, user_id: UUID, recipe_id: UUID) -> None:
         """Remove a recipe from user's favorites; raises NotFoundException if not found.
 
-        If the recipe is featured, record it in dismissed so sync won't re-add it.
+        If the recipe is featured, record it in dismissed so sync won't re-add it
+        (and, with virtual featured favorites, so it stops counting as a favorite).
         """
-        favorite = await self.repo.find(user_id, recipe_id)
-        if favorite is None:
+        if not await self.remove_many(user_id, [recipe_id]):
             raise NotFoundException("FavoriteRecipe", recipe_id)
 
-        # Check if recipe is featured — if so, track dismissal
-        db = getattr(self.repo, "db", None)
-        if db is not None:
-            recipe_result = await db.execute(
-                select(Recipe.is_featured).where(Recipe.id == recipe_id)
-            )
-            is_featured = recipe_result.scalar_one_or_none()
-            if is_featured:
-                existing_dismissed = await db.execute(
-                    select(UserDismissedFeatured).where(
-                        UserDismissedFeatured.user_id == user_id,
-                        UserDismissedFeatured.recipe_id == recipe_id,
-                    )
-                )
-                if existing_dismissed.scalar_one_or_none() is None:
-                    db.add(UserDismissedFeatured(user_id=user_id, recipe_id=recipe_id))
-
-        await self.repo.delete(favorite)
-        logger.info("favorite_removed", user_id=str(user_id), recipe_id=str(recipe_id))
+    async def add_many(self, user_id: UUID, recipe_ids: list[UUID]) -> list[UUID]:
+        """Favorite several recipes in one statement; returns the ids newly added."""
+        added = await self.repo.add(user_id, recipe_ids)
+        if added:
+            self.membership.invalidate(FAVORITES, [user_id])
+            logger.info("favorites_added", user_id=str(user_id), recipe_ids=[str(r) for r in added])
+        return added
+
+    async def remove_many(self, user_id: UUID, recipe_ids: list[UUID]) -> list[UUID]:
+        """Un-favorite several recipes in one statement; returns the ids that were favorites."""
+        removed = await self.repo.remove(user_id, recipe_ids)
+        if removed:
+            self.membership.invalidate(FAVORITES, [user_id])
+            logger.info("favorites_removed", user_id=str(user_id), recipe_ids=[str(r) for r in removed])
+        return removed
 
     async def list_by_user(self, user_id: UUID) -> list[FavoriteRecipe]:
         """Return all favorite recipe records for a given user."""
         return await self.repo.list_by_user(user_id)
 
+    async def list_cards(
+        self, user_id: UUID, pagination: PaginationParams,
+    ) -> PaginatedResponse[FavoriteCardResponse]:
+        """Return a keyset-paginated page of favorite recipe cards, newest first."""
+        after = decode_cursor(pagination.cursor) if pagination.cursor is not None else None
+        rows, total = await self.repo.list_cards(
+            user_id, pagination.limit, pagination.offset,
+            after=after, include_total=pagination.include_total,
+        )
+        has_more = len(rows) > pagination.limit
+        rows = rows[:pagination.limit]
+        next_cursor = encode_cursor(rows[-1].favorited_at, rows[-1].id) if has_more else None
+        return PaginatedResponse(
+            items=[FavoriteCardResponse.model_validate(row) for row in rows],
+            total=total, limit=pagination.limit,
+            offset=0 if after is not None else pagination.offset,
+            has_more=has_more, next_cursor=next_cursor,
+        )
+
     async def is_favorite(self, user_id: UUID, recipe_id: UUID) -> bool:
         """Check whether a recipe is in the user's favorites."""
-        return await self.repo.find(user_id, recipe_id) is not None
+        if await self.repo.find(user_id, recipe_id) is not None:
+            return True
+        return await self.repo.is_virtual_favorite(user_id, recipe_id)
@@ -0,0 +1,240 @@
+"""Featured sync service — copies newly featured recipes into every user's favorites.
+
+The sync runs as a background job outside the admin's request: users are walked
+in id order, one chunk per transaction, and the job row records the checkpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import secrets
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timezone
+from uuid import UUID
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import (
+    FEATURED_SYNC_CHUNK_SIZE,
+    FEATURED_SYNC_LOCK_RETRY,
+    FEATURED_SYNC_LOCK_TTL,
+)
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.models.featured_sync import ACTIVE_SYNC_STATUSES, FeaturedSyncJob, FeaturedSyncStatus
+from app.repositories.favorite import virtual_featured_favorites
+from app.repositories.featured_sync import FeaturedSyncRepository
+from app.schemas.recipe import FeaturedSyncJobResponse
+from app.services.membership import FAVORITES, invalidate_memberships
+
+logger = structlog.get_logger()
+
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+FEATURED_SYNC_LOCK_KEY = "featured_sync:lock"
+
+# Compare-and-set on the lock token, so a worker whose lock expired never
+# extends or releases the lock another worker has taken since.
+_REFRESH_LOCK = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('expire', KEYS[1], ARGV[2]) end return 0"
+)
+_RELEASE_LOCK = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('del', KEYS[1]) end return 0"
+)
+
+_workers: set[asyncio.Task[None]] = set()
+
+
+async def wait_featured_sync() -> None:
+    """Wait for the sync workers started by this process to finish."""
+    while _workers:
+        await asyncio.gather(*_workers, return_exceptions=True)
+
+
+async def stop_featured_sync() -> None:
+    """Cancel running workers; their jobs keep the last checkpoint and resume later."""
+    for worker in _workers:
+        worker.cancel()
+    await wait_featured_sync()
+
+
+class FeaturedSyncService:
+    """Queues, runs and reports featured sync jobs.
+
+    At most one job is unfinished at a time: starting a sync while one is
+    pending, running or failed resumes that job instead of queueing another.
+    A Redis lock keeps a single worker on the job; the job row is also locked
+    per chunk, so chunks stay exact even if Redis is unavailable.
+    """
+
+    def __init__(self, session_scope: SessionScope, redis: Redis) -> None:
+        self.session_scope = session_scope
+        self.redis = redis
+
+    async def start(self) -> FeaturedSyncJobResponse:
+        """Queue a job for recipes featured since the last sync and start a worker on it."""
+        if virtual_featured_favorites():
+            raise BadRequestException("Featured favorites are virtual; there is nothing to sync")
+        async with self.session_scope() as session:
+            repo = FeaturedSyncRepository(session)
+            # Serializes concurrent starts, so two admins never queue the same window twice
+            config = await repo.lock_config()
+            job = await repo.get_latest(statuses=(*ACTIVE_SYNC_STATUSES, FeaturedSyncStatus.FAILED.value))
+            if job is None:
+                users = await repo.count_users()
+                job = await repo.create(FeaturedSyncJob(
+                    status=FeaturedSyncStatus.PENDING.value,
+                    featured_since=config.last_sync_at,
+                    featured_until=datetime.now(timezone.utc),
+                    chunk_size=FEATURED_SYNC_CHUNK_SIZE,
+                    chunks_total=max(1, math.ceil(users / FEATURED_SYNC_CHUNK_SIZE)),
+                    chunks_done=0,
+                    rows_inserted=0,
+                ))
+                logger.info("featured_sync_queued", job_id=str(job.id), users=users)
+            response = self._to_response(job)
+
+        self._spawn(job.id)
+        return response
+
+    async def resume(self) -> None:
+        """Restart the worker for a job left pending or running, e.g. by a crashed process."""
+        async with self.session_scope() as session:
+            job = await FeaturedSyncRepository(session).get_latest(statuses=ACTIVE_SYNC_STATUSES)
+        if job is not None:
+            logger.info("featured_sync_resumed", job_id=str(job.id), chunks_done=job.chunks_done)
+            self._spawn(job.id)
+
+    async def status(self) -> FeaturedSyncJobResponse:
+        async with self.session_scope() as session:
+            job = await FeaturedSyncRepository(session).get_latest()
+        if job is None:
+            raise NotFoundException("featured_sync_jobs", "latest")
+        return self._to_response(job)
+
+    async def run(self, job_id: UUID) -> None:
+        """Process the job chunk by chunk until it completes, fails or another worker takes it."""
+        token = await self._wait_for_lock()
+        if token is None:
+            logger.info("featured_sync_already_running", job_id=str(job_id))
+            return
+        try:
+            while not await self._run_chunk(job_id):
+                if await self._refresh_lock(token):
+                    continue
+                # The lock expired during a slow chunk; carry on unless another worker took it
+                logger.warning("featured_sync_lock_lost", job_id=str(job_id))
+                token = await self._acquire_lock()
+                if token is None:
+                    return
+        except Exception as exc:
+            logger.exception("featured_sync_failed", job_id=str(job_id))
+            await self._mark_failed(job_id, str(exc))
+        finally:
+            await self._release_lock(token)
+
+    async def _run_chunk(self, job_id: UUID) -> bool:
+        """Insert favorites for the next chunk of users; True once the job is finished."""
+        async with self.session_scope() as session:
+            repo = FeaturedSyncRepository(session)
+            job = await repo.lock(job_id)
+            if job.status == FeaturedSyncStatus.COMPLETED.value:
+                return True
+            now = datetime.now(timezone.utc)
+            if job.status != FeaturedSyncStatus.RUNNING.value:
+                job.status = FeaturedSyncStatus.RUNNING.value
+                job.started_at = job.started_at or now
+                job.error = None
+
+            through = await repo.chunk_end(job.cursor_user_id, job.chunk_size)
+            job.rows_inserted += await repo.insert_featured_favorites(job, job.cursor_user_id, through)
+            job.cursor_user_id = through
+            job.chunks_done += 1
+            # Users signing up mid-run can add chunks beyond the initial estimate
+            job.chunks_total = max(job.chunks_total, job.chunks_done + (through is not None))
+
+            finished = through is None
+            if finished:
+                config = await repo.lock_config()
+                config.last_sync_at = job.featured_until
+                job.status = FeaturedSyncStatus.COMPLETED.value
+                job.finished_at = now
+            await session.flush()
+            rows_inserted = job.rows_inserted
+
+        if finished:
+            if rows_inserted:
+                await invalidate_memberships(self.redis, FAVORITES)
+            logger.info("featured_sync_completed", job_id=str(job_id), added=rows_inserted)
+        return finished
+
+    async def _mark_failed(self, job_id: UUID, error: str) -> None:
+        async with self.session_scope() as session:
+            job = await FeaturedSyncRepository(session).lock(job_id)
+            job.status = FeaturedSyncStatus.FAILED.value
+            job.error = error
+            await session.flush()
+
+    async def _acquire_lock(self) -> str | None:
+        """Take the worker lock; returns its token, or None if another worker holds it.
+
+        Without Redis the worker proceeds unlocked and relies on the job row lock.
+        """
+        token = secrets.token_hex(16)
+        try:
+            acquired = await self.redis.set(
+                FEATURED_SYNC_LOCK_KEY, token, nx=True, ex=FEATURED_SYNC_LOCK_TTL,
+            )
+        except RedisError as exc:
+            logger.warning("featured_sync_lock_unavailable", error=str(exc))
+            return token
+        return token if acquired else None
+
+    async def _wait_for_lock(self) -> str | None:
+        """Take the worker lock, waiting out one left behind by a worker that died.
+
+        A dead worker's lock expires within FEATURED_SYNC_LOCK_TTL; one still held
+        after that belongs to a live worker, which refreshes it after every chunk.
+        """
+        deadline = time.monotonic() + FEATURED_SYNC_LOCK_TTL
+        while (token := await self._acquire_lock()) is None:
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(FEATURED_SYNC_LOCK_RETRY)
+        return token
+
+    async def _refresh_lock(self, token: str) -> bool:
+        try:
+            refreshed = await self.redis.eval(
+                _REFRESH_LOCK, 1, FEATURED_SYNC_LOCK_KEY, token, FEATURED_SYNC_LOCK_TTL,
+            )
+        except RedisError:
+            return True
+        return bool(refreshed)
+
+    async def _release_lock(self, token: str) -> None:
+        try:
+            await self.redis.eval(_RELEASE_LOCK, 1, FEATURED_SYNC_LOCK_KEY, token)
+        except RedisError as exc:
+            logger.warning("featured_sync_unlock_failed", error=str(exc))
+
+    def _spawn(self, job_id: UUID) -> None:
+        worker = asyncio.create_task(self.run(job_id))
+        _workers.add(worker)
+        worker.add_done_callback(_workers.discard)
+
+    @staticmethod
+    def _to_response(job: FeaturedSyncJob) -> FeaturedSyncJobResponse:
+        response = FeaturedSyncJobResponse.model_validate(job)
+        if job.status == FeaturedSyncStatus.RUNNING.value and job.chunks_done and job.started_at:
+            elapsed = (datetime.now(timezone.utc) - job.started_at).total_seconds()
+            remaining = max(job.chunks_total - job.chunks_done, 0)
+            response.eta_seconds = round(elapsed / job.chunks_done * remaining, 1)
+        return response
@@ -12,13 +12,15 @@ from app.models.ingredient import Ingredient
 from app.repositories.ingredient import IngredientRepository
 from app.schemas.ingredient import IngredientCreate, IngredientUpdate
 from app.schemas.pagination import PaginatedResponse
+from app.services.catalog_cache import CatalogCache
 
 logger = structlog.get_logger()
 
 
 class IngredientService:
-    def __init__(self, repo: IngredientRepository) -> None:
+    def __init__(self, repo: IngredientRepository, catalog_cache: CatalogCache) -> None:
         self.repo = repo
+        self.catalog_cache = catalog_cache
 
     async def create(self, data: IngredientCreate) -> Ingredient:
         """Create an ingredient; raises ConflictException if title or slug exists."""
@@ -49,11 +51,17 @@ class IngredientService:
         ingredient = await self.repo.get_by_id(ingredient_id)
         update_data = data.model_dump(exclude_unset=True)
         ingredient = await self.repo.update(ingredient, update_data)
+        recipe_ids = await self.repo.linked_recipe_ids(ingredient_id)
+        await self.repo.refresh_recipe_documents(recipe_ids, search="title" in update_data)
+        self.catalog_cache.invalidate()
         logger.info("ingredient_updated", ingredient_id=str(ingredient_id))
         return ingredient
 
     async def delete(self, ingredient_id: UUID) -> None:
         """Delete an ingredient by ID; raises NotFoundException if missing."""
         ingredient = await self.repo.get_by_id(ingredient_id)
+        recipe_ids = await self.repo.linked_recipe_ids(ingredient_id)
         await self.repo.delete(ingredient)
+        await self.repo.refresh_recipe_documents(recipe_ids)
+        self.catalog_cache.invalidate()
         logger.info("ingredient_deleted", ingredient_id=str(ingredient_id))
@@ -0,0 +1,159 @@
+"""Membership service — per-user favorite and cooked recipe id sets kept in Redis."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from uuid import UUID
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import after_commit
+from app.repositories.cooking_history import CookingHistoryRepository
+from app.repositories.favorite import FavoriteRepository
+
+logger = structlog.get_logger()
+
+MEMBERSHIP_PREFIX = "rm:"
+MEMBERSHIP_TTL = 60 * 60
+
+FAVORITES = "fav"
+HISTORY = "hist"
+
+# Generation counter per kind, embedded in every set key. Bumping it retires all
+# users' sets at once after a bulk write whose affected users are not enumerated.
+GENERATION_PREFIX = f"{MEMBERSHIP_PREFIX}gen:"
+
+# Epoch counter per kind and user, also embedded in the set key. Writers bump it
+# after their commit, so a reload that read the database before that commit
+# stores its set under the old epoch, where no reader looks any more. It outlives
+# the sets by a margin so that no stale set is ever read again under epoch 0.
+EPOCH_PREFIX = f"{MEMBERSHIP_PREFIX}ep:"
+EPOCH_TTL = 2 * MEMBERSHIP_TTL
+
+# Member present in every set, so that a user with no memberships still has a
+# key and an absent key means "not loaded".
+_LOADED = "*"
+
+
+async def invalidate_memberships(redis: Redis, kind: str) -> None:
+    """Retire every user's ``kind`` set; they are reloaded from the database on next read."""
+    try:
+        await redis.incr(f"{GENERATION_PREFIX}{kind}")
+    except RedisError as exc:
+        logger.warning("membership_invalidate_failed", kind=kind, error=str(exc))
+
+
+class MembershipService:
+    """Answers "is this recipe favorited / cooked by the user" without touching the catalog query.
+
+    Sets are loaded lazily from the database and expire after MEMBERSHIP_TTL.
+    Services that change favorites and history invalidate the user's set once
+    their transaction commits, and the next read loads it again. When Redis is
+    unavailable the flags are computed from the database directly.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        db: AsyncSession,
+        favorites: FavoriteRepository,
+        history: CookingHistoryRepository,
+    ) -> None:
+        self.redis = redis
+        self.db = db
+        self.loaders = {
+            FAVORITES: favorites.recipe_ids_by_user,
+            HISTORY: history.recipe_ids_by_user,
+        }
+
+    async def flags(self, user_id: UUID, recipe_ids: Sequence[UUID]) -> dict[UUID, tuple[bool, bool]]:
+        """Map each recipe id to its (is_favorited, is_in_history) pair for ``user_id``."""
+        if not recipe_ids:
+            return {}
+        members = [str(recipe_id) for recipe_id in recipe_ids]
+        try:
+            keys = await self._keys((FAVORITES, HISTORY), user_id)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.smismember(key, [_LOADED, *members])
+                cached = await pipe.execute()
+            answers = []
+            for kind, key, result in zip((FAVORITES, HISTORY), keys, cached, strict=True):
+                if result[0]:
+                    answers.append(result[1:])
+                else:
+                    answers.append(await self._load_membership(kind, key, user_id, members))
+            favorites, history = answers
+        except RedisError as exc:
+            logger.warning("membership_unavailable", error=str(exc))
+            fav_ids = await self.loaders[FAVORITES](user_id)
+            hist_ids = await self.loaders[HISTORY](user_id)
+            return {rid: (rid in fav_ids, rid in hist_ids) for rid in recipe_ids}
+
+        return {
+            rid: (bool(fav), bool(hist))
+            for rid, fav, hist in zip(recipe_ids, favorites, history, strict=True)
+        }
+
+    def invalidate(self, kind: str, user_ids: Iterable[UUID]) -> None:
+        """Drop the users' ``kind`` sets once the current transaction commits."""
+        user_ids = list(user_ids)
+        if user_ids:
+            after_commit(self.db, lambda: self._retire(kind, user_ids))
+
+    def invalidate_all(self, kind: str) -> None:
+        """Retire every user's ``kind`` set once the current transaction commits."""
+        after_commit(self.db, lambda: invalidate_memberships(self.redis, kind))
+
+    async def _retire(self, kind: str, user_ids: list[UUID]) -> None:
+        """Move each user to a new epoch and delete the set of the old one."""
+        try:
+            generation = await self._generation(kind)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for user_id in user_ids:
+                    pipe.incr(self._epoch_key(kind, user_id))
+                    pipe.expire(self._epoch_key(kind, user_id), EPOCH_TTL)
+                epochs = (await pipe.execute())[::2]
+            await self.redis.delete(*[
+                self._key(kind, generation, str(epoch - 1), user_id)
+                for user_id, epoch in zip(user_ids, epochs, strict=True)
+            ])
+        except RedisError as exc:
+            logger.warning("membership_invalidate_failed", kind=kind, error=str(exc))
+
+    async def _load_membership(
+        self, kind: str, key: str, user_id: UUID, members: list[str],
+    ) -> list[bool]:
+        """Rebuild the user's set from the database and answer ``members`` from it."""
+        loaded = {str(recipe_id) for recipe_id in await self.loaders[kind](user_id)}
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.sadd(key, _LOADED, *loaded)
+            pipe.expire(key, MEMBERSHIP_TTL)
+            await pipe.execute()
+        return [member in loaded for member in members]
+
+    async def _generation(self, kind: str) -> str:
+        return await self.redis.get(f"{GENERATION_PREFIX}{kind}") or "0"
+
+    async def _keys(self, kinds: Sequence[str], user_id: UUID) -> list[str]:
+        counters = await self.redis.mget(
+            [f"{GENERATION_PREFIX}{kind}" for kind in kinds]
+            + [self._epoch_key(kind, user_id) for kind in kinds]
+        )
+        generations, epochs = counters[:len(kinds)], counters[len(kinds):]
+        return [
+            self._key(kind, generation or "0", epoch or "0", user_id)
+            for kind, generation, epoch in zip(kinds, generations, epochs, strict=True)
+        ]
+
+    @staticmethod
+    def _epoch_key(kind: str, user_id: UUID) -> str:
+        return f"{EPOCH_PREFIX}{kind}:{user_id}"
+
+    @staticmethod
+    def _key(kind: str, generation: str, epoch: str, user_id: UUID) -> str:
+        return f"{MEMBERSHIP_PREFIX}{kind}:{generation}:{epoch}:{user_id}"
@@ -2,36 +2,54 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select
 
 from app.core.dependencies import PaginationParams
-from app.core.exceptions import NotFoundException
+from app.core.exceptions import BadRequestException, NotFoundException
 from app.models.category import RecipeCategory
-from app.models.dismissed_featured import UserDismissedFeatured
-from app.models.favorite import FavoriteRecipe
-from app.models.featured_sync import FeaturedSyncConfig
 from app.models.ingredient import RecipeIngredient
 from app.models.recipe import Recipe
-from app.models.user import User
+from app.repositories.favorite import virtual_featured_favorites
 from app.repositories.recipe import RecipeRepository
+from app.services.catalog_cache import CatalogCache
+from app.services.cooking_stats import CookingStatsService
+from app.services.membership import FAVORITES, MembershipService
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.recipe import (
+    RecipeBatchItem,
+    RecipeBatchResponse,
     RecipeClientListResponse,
     RecipeCreate,
     RecipeDetailResponse,
     RecipeUpdate,
 )
+from app.utils.cursor import (
+    decode_cursor,
+    decode_sample_cursor,
+    encode_cursor,
+    encode_sample_cursor,
+)
 
 logger = structlog.get_logger()
 
 
 class RecipeService:
-    def __init__(self, repo: RecipeRepository) -> None:
+    def __init__(
+        self,
+        repo: RecipeRepository,
+        membership: MembershipService,
+        catalog_cache: CatalogCache,
+        stats: CookingStatsService,
+    ) -> None:
         self.repo = repo
+        self.membership = membership
+        self.catalog_cache = catalog_cache
+        self.stats = stats
 
     async def create(self, data: RecipeCreate) -> Recipe:
         """Create a recipe with optional ingredient and category associations."""
@@ -50,6 +68,9 @@ class RecipeService:
                 self.repo.add(RecipeCategory(recipe_id=recipe.id, category_id=cid))
 
         await self.repo.flush()
+        await self.repo.refresh_search_documents([recipe.id])
+        await self.repo.refresh_detail_documents([recipe.id])
+        self.catalog_cache.invalidate()
         logger.info("recipe_created", recipe_id=str(recipe.id), title=recipe.title)
         return recipe
 
@@ -80,6 +101,9 @@ class RecipeService:
         recipe.is_featured = not recipe.is_featured
         recipe.featured_at = datetime.now(timezone.utc) if recipe.is_featured else None
         await self.repo.flush()
+        await self.repo.refresh_detail_documents([recipe_id])
+        self.catalog_cache.invalidate()
+        await self._featured_favorites_changed()
         logger.info("recipe_featured_toggled", recipe_id=str(recipe_id), is_featured=recipe.is_featured)
         return recipe
 
@@ -87,42 +111,131 @@ class RecipeService:
         self, pagination: PaginationParams, user_id: UUID, *,
         category_id: UUID | None = None, search: str | None = None, slug: str | None = None,
         is_in_history: bool | None = None, is_favorited: bool | None = None,
-        random: bool = False,
+        random: bool = False, seed: int | None = None, exclude_cooked_days: int | None = None,
+        search_mode: str = "substring",
     ) -> PaginatedResponse[RecipeClientListResponse]:
-        """Return a paginated client-facing recipe list with favorite/history flags."""
-        rows, total = await self.repo.list_client(
-            pagination.limit, pagination.offset, user_id,
-            category_id=category_id, search=search, slug=slug,
-            is_in_history=is_in_history, is_favorited=is_favorited,
-            random=random,
-        )
+        """Return a paginated client-facing recipe list with favorite/history flags.
+
+        Pages are keyset-paginated when ``pagination.cursor`` is set; ``next_cursor``
+        is returned for every page that has a successor, except for search results,
+        which are ranked by similarity and paged by offset. Random order is a stable
+        shuffle seeded by (user, seed): following its cursors never repeats a recipe.
+
+        Pages that do not depend on the user (no random order, no history/favorite
+        filters) are served from the shared CatalogCache; flags are overlaid per user.
+        """
+        after = None
+        sample_start = None
+        sample_after = None
+        if random:
+            if pagination.cursor is not None:
+                sample_start, sample_after = decode_sample_cursor(pagination.cursor)
+            else:
+                sample_start = self._sample_start(user_id, seed)
+        elif pagination.cursor is not None:
+            if search:
+                raise BadRequestException("Search results are ranked; page them with offset")
+            after = decode_cursor(pagination.cursor)
+
+        exclude_cooked_since = None
+        if exclude_cooked_days is not None:
+            exclude_cooked_since = datetime.now(timezone.utc) - timedelta(days=exclude_cooked_days)
+
+        cache_params = None
+        cache_version = None
+        page = None
+        user_independent = sample_start is None and exclude_cooked_since is None
+        if user_independent and is_in_history is None and is_favorited is None:
+            cache_params = {
+                "limit": pagination.limit, "offset": pagination.offset if after is None else 0,
+                "after": after, "category_id": category_id, "search": search, "slug": slug,
+                "search_mode": search_mode, "include_total": pagination.include_total,
+            }
+            cache_version, page = await self.catalog_cache.get(cache_params)
+
+        if page is not None:
+            rows, total = page
+        else:
+            rows, total = await self.repo.list_client(
+                pagination.limit, pagination.offset, user_id,
+                category_id=category_id, search=search, slug=slug,
+                is_in_history=is_in_history, is_favorited=is_favorited,
+                after=after, sample_start=sample_start, sample_after=sample_after,
+                exclude_cooked_since=exclude_cooked_since, fulltext=search_mode == "fulltext",
+                include_total=pagination.include_total,
+            )
+            if cache_params is not None:
+                await self.catalog_cache.set(cache_version, cache_params, rows, total)
+        has_more = len(rows) > pagination.limit
+        rows = rows[:pagination.limit]
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            if sample_start is not None:
+                next_cursor = encode_sample_cursor(
+                    sample_start, last.sample_key < sample_start, last.sample_key, last.id,
+                )
+            elif not search:
+                next_cursor = encode_cursor(last.created_at, last.id)
+
+        flags = await self.membership.flags(user_id, [r.id for r in rows])
         items = [
             RecipeClientListResponse(
                 id=r.id, slug=r.slug, title=r.title, photo_url=r.photo_url,
                 prep_time=r.prep_time, cook_time=r.cook_time, difficulty=r.difficulty,
-                servings=r.servings, is_favorited=r.is_favorited, is_in_history=r.is_in_history,
+                servings=r.servings, is_favorited=flags[r.id][0], is_in_history=flags[r.id][1],
             )
             for r in rows
         ]
-        return PaginatedResponse(items=items, total=total, limit=pagination.limit, offset=pagination.offset)
+        return PaginatedResponse(
+            items=items, total=total, limit=pagination.limit,
+            offset=0 if pagination.cursor is not None else pagination.offset,
+            has_more=has_more, next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _sample_start(user_id: UUID, seed: int | None) -> float:
+        """Map (user, seed) to a point on the [0, 1) sample_key ring; a fresh seed if none given."""
+        if seed is None:
+            seed = secrets.randbits(32)
+        digest = hashlib.sha256(f"{user_id}:{seed}".encode()).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64
 
     async def get_client(self, recipe_id: UUID, user_id: UUID) -> RecipeDetailResponse:
         """Return full recipe detail for a client, including user-specific flags."""
-        recipe = await self.get_by_id(recipe_id)
-        is_favorited, is_in_history = await self.repo.get_user_flags(recipe_id, user_id)
-        categories = [rc.category for rc in recipe.recipe_categories]
-
-        return RecipeDetailResponse(
-            id=recipe.id, title=recipe.title, photo_url=recipe.photo_url,
-            description=recipe.description, protein=recipe.protein,
-            fat=recipe.fat, carbs=recipe.carbs, prep_time=recipe.prep_time,
-            cook_time=recipe.cook_time, difficulty=recipe.difficulty,
-            servings=recipe.servings, slug=recipe.slug, is_active=recipe.is_active,
-            created_at=recipe.created_at, updated_at=recipe.updated_at,
-            steps=recipe.steps, recipe_ingredients=recipe.recipe_ingredients,
-            categories=categories,
-            is_favorited=is_favorited, is_in_history=is_in_history,
-        )
+        details = await self._client_details([recipe_id], user_id)
+        if recipe_id not in details:
+            raise NotFoundException("Recipe", recipe_id)
+        return details[recipe_id]
+
+    async def get_client_batch(self, recipe_ids: list[UUID], user_id: UUID) -> RecipeBatchResponse:
+        """Return details for several recipes in request order; unknown ids get a 404 entry."""
+        details = await self._client_details(list(dict.fromkeys(recipe_ids)), user_id)
+        return RecipeBatchResponse(items=[
+            RecipeBatchItem(id=rid, status=200, recipe=details[rid]) if rid in details
+            else RecipeBatchItem(id=rid, status=404)
+            for rid in recipe_ids
+        ])
+
+    async def _client_details(
+        self, recipe_ids: list[UUID], user_id: UUID,
+    ) -> dict[UUID, RecipeDetailResponse]:
+        """Details keyed by id for the recipes that exist, served from RecipeDocument.
+
+        Recipes without a document yet (created before documents existed) get it
+        built on first read.
+        """
+        documents = await self.repo.get_detail_documents(recipe_ids)
+        missing = [rid for rid in recipe_ids if rid not in documents]
+        if missing:
+            documents.update(await self.repo.refresh_detail_documents(missing))
+        flags = await self.membership.flags(user_id, list(documents))
+        return {
+            rid: RecipeDetailResponse(
+                **document, is_favorited=flags[rid][0], is_in_history=flags[rid][1],
+            )
+            for rid, document in documents.items()
+        }
 
     async def update(self, recipe_id: UUID, data: RecipeUpdate) -> Recipe:
         """Partially update a recipe, replacing categories/ingredients when provided."""
@@ -133,94 +246,34 @@ class RecipeService:
             setattr(recipe, field, value)
 
         if data.categories is not None:
+            # Category rollups follow current categories: move the history along.
+            await self.stats.uncount_categories(recipe_id)
             await self.repo.replace_categories(recipe_id, data.categories)
+            await self.repo.flush()
+            await self.stats.count_categories(recipe_id)
 
         if data.ingredients is not None:
             await self.repo.replace_ingredients(recipe_id, data.ingredients)
 
         await self.repo.flush()
+        await self.repo.refresh_search_documents([recipe_id])
+        await self.repo.refresh_detail_documents([recipe_id])
+        self.catalog_cache.invalidate()
+        if recipe.is_featured and "is_active" in update_data:
+            await self._featured_favorites_changed()
         logger.info("recipe_updated", recipe_id=str(recipe_id))
         return recipe
 
     async def delete(self, recipe_id: UUID) -> None:
         """Delete a recipe and all its associations; raises NotFoundException."""
         recipe = await self.repo.get_by_id(recipe_id)
+        # The history would go by cascade, but the rollups counting it would not
+        await self.stats.forget_recipe(recipe_id)
         await self.repo.delete(recipe)
+        self.catalog_cache.invalidate()
         logger.info("recipe_deleted", recipe_id=str(recipe_id))
 
-    async def sync_featured_to_users(self) -> int:
-        """Sync new featured recipes to all users' favorites.
-
-        Only adds recipes that became featured after the last sync.
-        Skips recipes already in user's favorites or dismissed by the user.
-        Returns the number of new favorite entries created.
-        """
-        db = self.repo.db
-
-        # 1. Get last sync timestamp
-        config_result = await db.execute(
-            select(FeaturedSyncConfig).where(FeaturedSyncConfig.id == 1)
-        )
-        config = config_result.scalar_one_or_none()
-        if config is None:
-            config = FeaturedSyncConfig(id=1)
-            db.add(config)
-            await db.flush()
-
-        last_sync_at = config.last_sync_at
-
-        # 2. Get recipes that became featured after last sync
-        new_featured_result = await db.execute(
-            select(Recipe.id).where(
-                Recipe.is_featured.is_(True),
-                Recipe.is_active.is_(True),
-                Recipe.featured_at.isnot(None),
-                Recipe.featured_at > last_sync_at,
-            )
-        )
-        new_recipe_ids = list(new_featured_result.scalars().all())
-
-        if not new_recipe_ids:
-            logger.info("featured_sync_no_new_recipes")
-            return 0
-
-        # 3. Get all user IDs
-        all_users_result = await db.execute(select(User.id))
-        all_user_ids = list(all_users_result.scalars().all())
-
-        # 4. Get existing favorites for these recipes (to skip)
-        existing_favs_result = await db.execute(
-            select(FavoriteRecipe.user_id, FavoriteRecipe.recipe_id).where(
-                FavoriteRecipe.recipe_id.in_(new_recipe_ids)
-            )
-        )
-        existing_favs = {(row.user_id, row.recipe_id) for row in existing_favs_result}
-
-        # 5. Get dismissed entries for these recipes (to skip)
-        dismissed_result = await db.execute(
-            select(UserDismissedFeatured.user_id, UserDismissedFeatured.recipe_id).where(
-                UserDismissedFeatured.recipe_id.in_(new_recipe_ids)
-            )
-        )
-        dismissed = {(row.user_id, row.recipe_id) for row in dismissed_result}
-
-        # 6. Create new favorites
-        added = 0
-        for user_id in all_user_ids:
-            for recipe_id in new_recipe_ids:
-                pair = (user_id, recipe_id)
-                if pair not in existing_favs and pair not in dismissed:
-                    db.add(FavoriteRecipe(user_id=user_id, recipe_id=recipe_id))
-                    added += 1
-
-        # 7. Update last_sync_at
-        config.last_sync_at = datetime.now(timezone.utc)
-        await db.flush()
-
-        logger.info(
-            "featured_sync_completed",
-            new_recipes=len(new_recipe_ids),
-            users=len(all_user_ids),
-            added=added,
-        )
-        return added
+    async def _featured_favorites_changed(self) -> None:
+        """Featured recipes are everyone's favorites in virtual mode: retire the cached sets."""
+        if virtual_featured_favorites():
+            self.membership.invalidate_all(FAVORITES)
@@ -23,6 +23,7 @@ class StepService:
         """Create a recipe step with the given step number and content."""
         step = Step(**data.model_dump())
         await self.repo.create(step)
+        await self.repo.refresh_recipe_documents([step.recipe_id])
         logger.info("step_created", step_id=str(step.id), recipe_id=str(data.recipe_id))
         return step
 
@@ -43,13 +44,19 @@ class StepService:
     async def update(self, step_id: UUID, data: StepUpdate) -> Step:
         """Partially update a step, applying only the fields provided."""
         step = await self.repo.get_by_id(step_id)
+        # Moving a step to another recipe changes both recipes' documents
+        recipe_ids = {step.recipe_id}
         update_data = data.model_dump(exclude_unset=True)
         step = await self.repo.update(step, update_data)
+        recipe_ids.add(step.recipe_id)
+        await self.repo.refresh_recipe_documents(recipe_ids)
         logger.info("step_updated", step_id=str(step_id))
         return step
 
     async def delete(self, step_id: UUID) -> None:
         """Delete a step by ID; raises NotFoundException if missing."""
         step = await self.repo.get_by_id(step_id)
+        recipe_id = step.recipe_id
         await self.repo.delete(step)
+        await self.repo.refresh_recipe_documents([recipe_id])
         logger.info("step_deleted", step_id=str(step_id))
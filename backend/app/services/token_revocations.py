@@ -0,0 +1,154 @@
+"""Token revocations — per-worker copy of the ``bl:`` blacklist, synced over pub/sub."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core import events
+from app.core.constants import (
+    REDIS_BLACKLIST_VALUE,
+    REVOCATION_PRUNE_INTERVAL,
+    REVOCATION_SCAN_COUNT,
+)
+from app.core.redis import get_redis
+
+logger = structlog.get_logger()
+
+TOKEN_BLACKLIST_PREFIX = "bl:"
+REVOCATION_CHANNEL = "token_revocations:add"
+
+
+class RevocationSet:
+    """Revoked jtis and the wall-clock time their blacklist entry expires.
+
+    The set is only trusted once ``ready``: after the listener (re)subscribes,
+    a SCAN of ``bl:*`` loads every entry written before, and published
+    messages add those written since. Until then, and from the moment the
+    listener's connection fails until the next SCAN finishes, callers must
+    ask Redis instead.
+    """
+
+    def __init__(self) -> None:
+        self._expires: dict[str, float] = {}
+        self.ready = False
+        # Bumped on every reset, so a SCAN that raced one does not mark the set ready
+        self.version = 0
+        self._pruned_at = time.monotonic()
+        self._seeding: asyncio.Task[None] | None = None
+
+    def add(self, jti: str, expires_at: float) -> None:
+        self._expires[jti] = max(expires_at, self._expires.get(jti, 0.0))
+        self._maybe_prune()
+
+    def __contains__(self, jti: str) -> bool:
+        self._maybe_prune()
+        expires_at = self._expires.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    def reset(self) -> None:
+        """Distrust the set until a new SCAN completes; entries already known are kept."""
+        self.version += 1
+        self.ready = False
+
+    async def seed(self, redis: Redis) -> None:
+        version = self.version
+        loaded = 0
+        async for keys in _scan_batches(redis):
+            async with redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.ttl(key)
+                ttls = await pipe.execute()
+            now = time.time()
+            for key, ttl in zip(keys, ttls, strict=True):
+                if ttl > 0:
+                    self.add(key.removeprefix(TOKEN_BLACKLIST_PREFIX), now + ttl)
+                    loaded += 1
+        if version == self.version:
+            self.ready = True
+            logger.info("token_revocations_seeded", revoked=loaded)
+
+    def schedule_seed(self) -> None:
+        """Reset and reload the set in the background; called on every (re)subscribe."""
+        self.reset()
+        if self._seeding is None or self._seeding.done():
+            self._seeding = asyncio.get_running_loop().create_task(self._seed_until_ready())
+
+    async def _seed_until_ready(self) -> None:
+        # A reset during a SCAN leaves the set unready, so that SCAN is repeated
+        while not self.ready:
+            try:
+                await self.seed(await get_redis())
+            except RedisError as exc:
+                # The listener resubscribes, and so schedules another seed, once Redis is back
+                logger.warning("token_revocations_seed_failed", error=str(exc))
+                return
+
+    def _maybe_prune(self) -> None:
+        if time.monotonic() - self._pruned_at < REVOCATION_PRUNE_INTERVAL:
+            return
+        self._pruned_at = time.monotonic()
+        now = time.time()
+        self._expires = {jti: exp for jti, exp in self._expires.items() if exp > now}
+
+
+async def _scan_batches(redis: Redis) -> AsyncIterator[list[str]]:
+    keys: list[str] = []
+    pattern = f"{TOKEN_BLACKLIST_PREFIX}*"
+    async for key in redis.scan_iter(match=pattern, count=REVOCATION_SCAN_COUNT):
+        keys.append(key)
+        if len(keys) >= REVOCATION_SCAN_COUNT:
+            yield keys
+            keys = []
+    if keys:
+        yield keys
+
+
+revoked_tokens = RevocationSet()
+
+
+def _on_revoked(message: str) -> None:
+    jti, _, expires_at = message.partition(" ")
+    revoked_tokens.add(jti, float(expires_at))
+
+
+def _on_disconnect() -> None:
+    # Revocations published from now until the next SCAN may be lost
+    revoked_tokens.reset()
+
+
+events.subscribe(
+    REVOCATION_CHANNEL, _on_revoked,
+    resync=revoked_tokens.schedule_seed, on_disconnect=_on_disconnect,
+)
+
+
+async def revoke(redis: Redis, jti: str, expires_at: float) -> None:
+    """Blacklist ``jti`` until ``expires_at`` (epoch seconds) in Redis and every worker."""
+    ttl = int(expires_at - time.time())
+    if ttl <= 0:
+        return
+    await redis.setex(f"{TOKEN_BLACKLIST_PREFIX}{jti}", ttl, REDIS_BLACKLIST_VALUE)
+    revoked_tokens.add(jti, expires_at)
+    await events.publish(redis, REVOCATION_CHANNEL, f"{jti} {expires_at}")
+
+
+async def is_revoked(redis: Redis, jti: str) -> bool:
+    """Whether ``jti`` is blacklisted; Redis is only asked on a local hit or before seeding."""
+    if revoked_tokens.ready and jti not in revoked_tokens:
+        return False
+    try:
+        return await redis.exists(f"{TOKEN_BLACKLIST_PREFIX}{jti}") > 0
+    except RedisError:
+        if revoked_tokens.ready:
+            # A local hit stands when Redis cannot confirm it
+            return True
+        raise
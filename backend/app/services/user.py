@@ -5,20 +5,27 @@ from __future__ import annotations
 from uuid import UUID
 
 import structlog
+from redis.asyncio import Redis
 
+from app.core.database import after_commit
 from app.core.dependencies import PaginationParams
 from app.core.exceptions import ConflictException
 from app.models.user import User
 from app.repositories.user import UserRepository
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.admin_cache import invalidate_admins
+from app.services.cooking_stats import CookingStatsService
+from app.services.user_cache import invalidate_user
 
 logger = structlog.get_logger()
 
 
 class UserService:
-    def __init__(self, repo: UserRepository) -> None:
+    def __init__(self, repo: UserRepository, redis: Redis, stats: CookingStatsService) -> None:
         self.repo = repo
+        self.redis = redis
+        self.stats = stats
 
     async def get_by_id(self, user_id: UUID) -> User:
         """Return a user by primary key; raises NotFoundException if missing."""
@@ -50,11 +57,18 @@ class UserService:
         user = await self.repo.get_by_id(user_id)
         update_data = data.model_dump(exclude_unset=True)
         user = await self.repo.update(user, update_data)
+        after_commit(self.repo.db, lambda: invalidate_user(self.redis, user_id))
         logger.info("user_updated", user_id=str(user_id), fields=list(update_data.keys()))
         return user
 
     async def delete(self, user_id: UUID) -> None:
         """Delete a user by ID; raises NotFoundException if missing."""
         user = await self.repo.get_by_id(user_id)
+        was_admin = await self.repo.get_admin_by_user_id(user_id) is not None
+        # The user's own rollups go by cascade, but the all-users activity counts would not
+        await self.stats.forget_user(user_id)
         await self.repo.delete(user)
+        after_commit(self.repo.db, lambda: invalidate_user(self.redis, user_id))
+        if was_admin:
+            after_commit(self.repo.db, lambda: invalidate_admins(self.redis))
         logger.info("user_deleted", user_id=str(user_id))
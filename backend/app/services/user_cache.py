@@ -0,0 +1,102 @@
+"""User cache — per-worker TTL/LRU cache of the profiles behind authenticated requests."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from app.core import events
+from app.core.constants import USER_CACHE_MAX_SIZE, USER_CACHE_TTL
+from app.models.user import User
+
+USER_CACHE_CHANNEL = "user_cache:invalidate"
+
+
+@dataclass(frozen=True, slots=True)
+class UserPrincipal:
+    """The authenticated user: the token's subject plus a detached copy of the profile."""
+
+    id: UUID
+    tg_id: int
+    tg_username: str | None
+    username: str | None
+    phone_number: str | None
+    first_name: str | None
+    last_name: str | None
+    timezone: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> UserPrincipal:
+        return cls(
+            id=user.id, tg_id=user.tg_id, tg_username=user.tg_username, username=user.username,
+            phone_number=user.phone_number, first_name=user.first_name, last_name=user.last_name,
+            timezone=user.timezone, created_at=user.created_at, updated_at=user.updated_at,
+        )
+
+
+class UserCache:
+    """Principals by user id, dropped after ``ttl`` seconds or when least recently used.
+
+    Writers register invalidate_user to run after their transaction commits;
+    it drops the entry here and in every other worker. Workers that miss the
+    message while Redis is unavailable serve the old principal for at most
+    ``ttl``.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[UUID, tuple[float, UserPrincipal]] = OrderedDict()
+        # Bumped on every invalidation, so a load that raced one is not stored
+        self.version = 0
+
+    def get(self, user_id: UUID) -> UserPrincipal | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def put(self, principal: UserPrincipal, version: int) -> None:
+        """Store a principal loaded when the cache was at ``version``; skipped if it moved on."""
+        if version != self.version:
+            return
+        self._entries[principal.id] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, user_id: UUID) -> None:
+        self.version += 1
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+user_cache = UserCache(USER_CACHE_TTL, USER_CACHE_MAX_SIZE)
+
+events.subscribe(
+    USER_CACHE_CHANNEL, lambda message: user_cache.discard(UUID(message)), resync=user_cache.clear,
+)
+
+
+async def invalidate_user(redis: Redis, user_id: UUID) -> None:
+    """Drop the user's cached principal in this worker and broadcast it to the others."""
+    user_cache.discard(user_id)
+    await events.publish(redis, USER_CACHE_CHANNEL, str(user_id))
@@ -0,0 +1,54 @@
+"""Opaque pagination cursors for keyset (seek) pagination."""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from app.core.exceptions import BadRequestException
+
+_SEPARATOR = "|"
+
+
+def _pack(*parts: str) -> str:
+    raw = _SEPARATOR.join(parts)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _unpack(cursor: str, size: int) -> list[str]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+    parts = raw.split(_SEPARATOR)
+    if len(parts) != size:
+        raise ValueError("Unexpected cursor shape")
+    return parts
+
+
+def encode_cursor(created_at: datetime, entity_id: UUID) -> str:
+    """Pack the (created_at, id) sort key of the last row on a page into a URL-safe token."""
+    return _pack(created_at.isoformat(), str(entity_id))
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Unpack a token produced by encode_cursor; raises BadRequestException if malformed."""
+    try:
+        created_at, entity_id = _unpack(cursor, 2)
+        return datetime.fromisoformat(created_at), UUID(entity_id)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise BadRequestException("Invalid pagination cursor") from exc
+
+
+def encode_sample_cursor(start: float, wrapped: bool, sample_key: float, entity_id: UUID) -> str:
+    """Pack a shuffled-feed position: ring start point plus the last row served."""
+    return _pack(repr(start), "1" if wrapped else "0", repr(sample_key), str(entity_id))
+
+
+def decode_sample_cursor(cursor: str) -> tuple[float, tuple[bool, float, UUID]]:
+    """Unpack a token produced by encode_sample_cursor into (start, (wrapped, key, id))."""
+    try:
+        start, wrapped, sample_key, entity_id = _unpack(cursor, 4)
+        if wrapped not in ("0", "1"):
+            raise ValueError("Invalid wrap flag")
+        return float(start), (wrapped == "1", float(sample_key), UUID(entity_id))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise BadRequestException("Invalid pagination cursor") from exc
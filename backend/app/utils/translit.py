@@ -0,0 +1,51 @@
+"""Russian → Latin transliteration shared by slugs and transliterated search."""
+
+import re
+from typing import Any
+
+from sqlalchemy import func
+
+TRANSLIT_MAP = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "yo",
+    "ж": "zh", "з": "z", "и": "i", "й": "y", "к": "k", "л": "l", "м": "m",
+    "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u",
+    "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch",
+    "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya",
+}
+
+_CYRILLIC_RE = re.compile("[а-яё]", re.IGNORECASE)
+
+
+def has_cyrillic(text: str) -> bool:
+    return _CYRILLIC_RE.search(text) is not None
+
+
+def slugify(text: str) -> str:
+    """Transliterate and slugify a Russian string."""
+    result = []
+    for ch in text.lower():
+        if ch in TRANSLIT_MAP:
+            result.append(TRANSLIT_MAP[ch])
+        elif ch.isascii() and (ch.isalnum() or ch in "-_"):
+            result.append(ch)
+        else:
+            result.append("-")
+    slug = re.sub(r"-+", "-", "".join(result)).strip("-")
+    return slug
+
+
+def transliterate_sql(expr: Any) -> Any:
+    """SQL counterpart of TRANSLIT_MAP applied to lower(expr); other characters pass through.
+
+    Multi-letter and empty mappings go through replace(), the 1:1 letters through
+    a single translate() call.
+    """
+    result = func.lower(expr)
+    single_src, single_dst = [], []
+    for src, dst in TRANSLIT_MAP.items():
+        if len(dst) == 1:
+            single_src.append(src)
+            single_dst.append(dst)
+        else:
+            result = func.replace(result, src, dst)
+    return func.translate(result, "".join(single_src), "".join(single_dst))
@@ -0,0 +1,49 @@
+"""
+Rebuild the cooking statistics rollups from cooking_history.
+
+Usage:
+  DATABASE_URL=postgresql+asyncpg://... python scripts/backfill_cooking_stats.py
+
+Run once after migrating to the rollup tables, and any time the rollups are
+suspected to have drifted. Safe to rerun: every rollup is recomputed from
+scratch in one transaction. Recording new dishes waits until it commits.
+"""
+
+import asyncio
+import os
+import sys
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Ensure all models are loaded for relationship resolution
+import app.models.category  # noqa: F401
+import app.models.ingredient  # noqa: F401
+import app.models.recipe  # noqa: F401
+import app.models.step  # noqa: F401
+import app.models.image  # noqa: F401
+import app.models.favorite  # noqa: F401
+import app.models.cooking_history  # noqa: F401
+import app.models.user  # noqa: F401
+from app.repositories.cooking_stats import CookingStatsRepository
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+if not DATABASE_URL:
+    sys.exit("ERROR: DATABASE_URL is not set. Check your .env file.")
+
+
+async def main() -> None:
+    engine = create_async_engine(DATABASE_URL)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        records = await CookingStatsRepository(session).rebuild()
+        await session.commit()
+    await engine.dispose()
+    print(f"Cooking stats rebuilt from {records} history records.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+"""
+Benchmark substring search latency for recipes and users.
+
+Usage:
+  BENCH_DATABASE_URL=postgresql+asyncpg://... python scripts/bench_search.py [--seed]
+
+Point BENCH_DATABASE_URL at a scratch database migrated to head
+(`alembic upgrade head`). With --seed, inserts 100k synthetic recipes and
+1M synthetic users first (slugs `bench-*`, tg_ids from 10^10, safe to rerun).
+
+Each search runs through the real repository code path and is timed twice:
+once as deployed (pg_trgm GIN indexes) and once inside a rolled-back
+transaction with the trigram indexes dropped, i.e. the old sequential-scan plan.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.dependencies import PaginationParams
+from app.models.user import User  # noqa: F401
+from app.models.recipe import Recipe  # noqa: F401
+from app.models.ingredient import Ingredient  # noqa: F401
+from app.models.category import Category  # noqa: F401
+from app.models.step import Step  # noqa: F401
+from app.models.favorite import FavoriteRecipe  # noqa: F401
+from app.models.cooking_history import CookingHistory  # noqa: F401
+from app.repositories.recipe import RecipeRepository
+from app.repositories.user import UserRepository
+
+RECIPES = 100_000
+USERS = 1_000_000
+RUNS = 20
+
+WORDS = [
+    "борщ", "суп", "салат", "плов", "каша", "пирог", "котлеты", "рагу", "блины", "паста",
+    "курица", "говядина", "свинина", "рыба", "грибы", "сыр", "картофель", "капуста", "рис", "тыква",
+]
+NAMES = ["Иван", "Мария", "Алексей", "Ольга", "Дмитрий", "Анна", "Сергей", "Елена", "Павел", "Юлия"]
+
+RECIPE_QUERIES = ["борщ", "курица", "ыр", "пирог с грибами"]
+USER_QUERIES = ["user_12345", "Ольга", "ьга"]
+
+TRGM_INDEXES = {
+    "recipes": ["ix_recipes_title_trgm"],
+    "users": ["ix_users_username_trgm", "ix_users_first_name_trgm", "ix_users_last_name_trgm"],
+}
+
+
+async def seed(session: AsyncSession) -> None:
+    words = "ARRAY[" + ", ".join(f"'{w}'" for w in WORDS) + "]"
+    names = "ARRAY[" + ", ".join(f"'{n}'" for n in NAMES) + "]"
+    await session.execute(text(f"""
+        INSERT INTO recipes (id, title, photo_url, description, prep_time, cook_time,
+                             difficulty, servings, slug, is_active, is_featured)
+        SELECT gen_random_uuid(),
+               initcap(({words})[1 + i % 20]) || ' с ' || ({words})[1 + (i / 20) % 20]
+                   || ' №' || i,
+               '', 'Синтетический рецепт для бенчмарка', 10, 20, 'medium', '4', 'bench-' || i, true, false
+        FROM generate_series(1, {RECIPES}) AS i
+        ON CONFLICT (slug) DO NOTHING
+    """))
+    await session.execute(text(f"""
+        INSERT INTO users (id, tg_id, username, first_name, last_name)
+        SELECT gen_random_uuid(), 10000000000 + i, 'user_' || i,
+               ({names})[1 + i % 10], md5(i::text)
+        FROM generate_series(1, {USERS}) AS i
+        ON CONFLICT (tg_id) DO NOTHING
+    """))
+    await session.execute(text("ANALYZE recipes"))
+    await session.execute(text("ANALYZE users"))
+    await session.commit()
+    print(f"Seeded up to {RECIPES} recipes and {USERS} users")
+
+
+async def timed(call) -> tuple[float, float]:
+    samples = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+async def run_suite(session: AsyncSession, label: str) -> None:
+    page = PaginationParams(limit=20, offset=0)
+    recipes = RecipeRepository(session)
+    users = UserRepository(session)
+    print(f"\n{label}")
+    for query in RECIPE_QUERIES:
+        p50, p95 = await timed(lambda query=query: recipes.list_admin(page, search=query))
+        print(f"  recipes  {query!r:<22} p50={p50:8.2f} ms  p95={p95:8.2f} ms")
+    for query in USER_QUERIES:
+        p50, p95 = await timed(lambda query=query: users.list_admin(page, search=query))
+        print(f"  users    {query!r:<22} p50={p50:8.2f} ms  p95={p95:8.2f} ms")
+
+
+async def main(database_url: str, do_seed: bool) -> None:
+    engine = create_async_engine(database_url, echo=False)
+    Session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with Session() as session:
+        if do_seed:
+            await seed(session)
+        await run_suite(session, "pg_trgm GIN indexes")
+        await session.rollback()
+
+    async with Session() as session:
+        for indexes in TRGM_INDEXES.values():
+            for name in indexes:
+                await session.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        await run_suite(session, "without trigram indexes (sequential scan)")
+        await session.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--seed", action="store_true", help="insert synthetic data first")
+    args = parser.parse_args()
+
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        sys.exit("ERROR: BENCH_DATABASE_URL is not set (use a scratch database).")
+    asyncio.run(main(url, args.seed))
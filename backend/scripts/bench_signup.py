@@ -0,0 +1,128 @@
+"""
+Benchmark the first-login path: creating a user and copying featured recipes to favorites.
+
+Usage:
+  BENCH_DATABASE_URL=postgresql+asyncpg://... python scripts/bench_signup.py [--seed]
+
+Point BENCH_DATABASE_URL at a scratch database migrated to head
+(`alembic upgrade head`). With --seed, inserts 500 synthetic featured recipes
+first (slugs `bench-featured-*`, safe to rerun).
+
+Every sample signs up a fresh Telegram user through AuthService inside a
+savepoint that is rolled back, so the database is left unchanged. The current
+single INSERT ... SELECT copy is timed against the previous implementation,
+which loaded the featured ids and added one FavoriteRecipe object per recipe.
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import sys
+import time
+
+from redis.asyncio import Redis
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.user import User  # noqa: F401
+from app.models.recipe import Recipe
+from app.models.ingredient import Ingredient  # noqa: F401
+from app.models.category import Category  # noqa: F401
+from app.models.step import Step  # noqa: F401
+from app.models.favorite import FavoriteRecipe
+from app.models.cooking_history import CookingHistory  # noqa: F401
+from app.repositories.user import UserRepository
+from app.schemas.auth import TelegramAuthData
+from app.services.auth import AuthService
+
+FEATURED = 500
+RUNS = 50
+
+_tg_ids = itertools.count(20_000_000_000)
+
+
+async def seed(session: AsyncSession) -> None:
+    await session.execute(text(f"""
+        INSERT INTO recipes (id, title, photo_url, description, prep_time, cook_time,
+                             difficulty, servings, slug, is_active, is_featured, featured_at)
+        SELECT gen_random_uuid(), 'Избранный рецепт №' || i, '', 'Синтетический рецепт для бенчмарка',
+               10, 20, 'medium', '4', 'bench-featured-' || i, true, true, now()
+        FROM generate_series(1, {FEATURED}) AS i
+        ON CONFLICT (slug) DO NOTHING
+    """))
+    await session.commit()
+    print(f"Seeded up to {FEATURED} featured recipes")
+
+
+async def legacy_copy(service: AuthService, user_id) -> None:
+    """The pre-bulk implementation: SELECT the ids, then one ORM object per recipe."""
+    db = service.repo.db
+    result = await db.execute(
+        select(Recipe.id).where(Recipe.is_featured.is_(True), Recipe.is_active.is_(True))
+    )
+    for recipe_id in result.scalars().all():
+        db.add(FavoriteRecipe(user_id=user_id, recipe_id=recipe_id))
+    await db.flush()
+
+
+async def first_login(session: AsyncSession, service: AuthService) -> None:
+    tg_id = next(_tg_ids)
+    auth_data = TelegramAuthData(
+        id=tg_id, first_name="Bench", username=f"bench_{tg_id}", auth_date=0, hash="bench",
+    )
+    savepoint = await session.begin_nested()
+    await service._upsert_user(auth_data)
+    await savepoint.rollback()
+
+
+async def timed(call) -> tuple[float, float]:
+    samples = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+async def main(database_url: str, do_seed: bool) -> None:
+    engine = create_async_engine(database_url, echo=False)
+    Session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    # Never contacted: the first-login path does not touch Redis
+    redis = Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"), decode_responses=True)
+
+    async with Session() as session:
+        if do_seed:
+            await seed(session)
+        featured = (await session.execute(
+            select(func.count()).select_from(Recipe)
+            .where(Recipe.is_featured.is_(True), Recipe.is_active.is_(True))
+        )).scalar_one()
+        print(f"First login with {featured} featured recipes, {RUNS} runs each")
+
+        service = AuthService(UserRepository(session), redis)
+        p50, p95 = await timed(lambda: first_login(session, service))
+        print(f"  bulk INSERT ... SELECT   p50={p50:8.2f} ms  p95={p95:8.2f} ms")
+
+        service._copy_featured_to_favorites = lambda user_id: legacy_copy(service, user_id)
+        p50, p95 = await timed(lambda: first_login(session, service))
+        print(f"  per-row ORM objects      p50={p50:8.2f} ms  p95={p95:8.2f} ms")
+        await session.rollback()
+
+    await redis.aclose()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--seed", action="store_true", help="insert synthetic featured recipes first")
+    args = parser.parse_args()
+
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        sys.exit("ERROR: BENCH_DATABASE_URL is not set (use a scratch database).")
+    asyncio.run(main(url, args.seed))
@@ -12,7 +12,6 @@ Skips recipes that already exist (by slug).
 import asyncio
 import json
 import os
-import re
 import sys
 from pathlib import Path
 from uuid import uuid4
@@ -30,31 +29,12 @@ from app.models.step import Step
 from app.models.favorite import FavoriteRecipe  # noqa: F401
 from app.models.cooking_history import CookingHistory  # noqa: F401
 from app.models.image import Image  # noqa: F401
+from app.repositories.recipe import RecipeRepository
+from app.utils.translit import slugify
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "recipes"
 
 
-def slugify(text: str) -> str:
-    """Transliterate and slugify a Russian string."""
-    mapping = {
-        "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "yo",
-        "ж": "zh", "з": "z", "и": "i", "й": "y", "к": "k", "л": "l", "м": "m",
-        "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u",
-        "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch",
-        "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya",
-    }
-    result = []
-    for ch in text.lower():
-        if ch in mapping:
-            result.append(mapping[ch])
-        elif ch.isascii() and (ch.isalnum() or ch in "-_"):
-            result.append(ch)
-        else:
-            result.append("-")
-    slug = re.sub(r"-+", "-", "".join(result)).strip("-")
-    return slug
-
-
 async def seed(database_url: str):
     engine = create_async_engine(database_url, echo=False)
     Session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -195,6 +175,10 @@ async def seed(database_url: str):
 
             created += 1
 
+        await session.flush()
+        repo = RecipeRepository(session)
+        await repo.refresh_search_documents()
+        await repo.refresh_detail_documents(select(Recipe.id))
         await session.commit()
 
     await engine.dispose()
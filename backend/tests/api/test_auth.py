@@ -1,8 +1,14 @@
 """Tests for /api/v1/auth endpoints."""
 
+import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import passwords
+from app.core.passwords import PasswordHasher
 from app.models.user import User
+from app.repositories.user import UserRepository
 
 
 async def test_login_invalid_body(client: AsyncClient):
@@ -51,7 +57,41 @@ async def test_logout_authenticated(client: AsyncClient):
     assert "message" in response.json()
 
 
+async def test_login_admin_rejected_while_hashing_pool_is_full(
+    client: AsyncClient,
+    test_admin_with_password: tuple[User, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    user, password = test_admin_with_password
+    hasher = PasswordHasher(workers=1, max_queue=0)
+    hasher.stats.in_flight = 1
+    monkeypatch.setattr(passwords, "_hasher", hasher)
+    response = await client.post(
+        "/api/v1/auth/login/admin",
+        json={"username": f"admin_{user.tg_id}", "password": password},
+    )
+    hasher.shutdown()
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+
 async def test_logout_admin(client: AsyncClient):
     response = await client.post("/api/v1/auth/logout/admin")
     assert response.status_code == 200
     assert "message" in response.json()
+
+
+async def test_telegram_upsert_writes_only_changed_profiles(db_session: AsyncSession):
+    repo = UserRepository(db_session)
+    created = await repo.upsert_telegram(555_000_111, "cook", "Anna", None)
+    assert (created.inserted, created.written) == (True, True)
+
+    again = await repo.upsert_telegram(555_000_111, "cook", "Anna", None)
+    assert again.id == created.id
+    assert (again.inserted, again.written) == (False, False)
+
+    renamed = await repo.upsert_telegram(555_000_111, "cook", "Anna", "Petrova")
+    assert renamed.id == created.id
+    assert (renamed.inserted, renamed.written) == (False, True)
+    last_name = await db_session.scalar(select(User.last_name).where(User.id == created.id))
+    assert last_name == "Petrova"
@@ -0,0 +1,263 @@
+"""Tests for /api/v1/cooking-history endpoints."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cooking_history import CookingHistory
+from app.models.cooking_stats import (
+    CookingActivityStat,
+    CookingCategoryStat,
+    CookingDailyStat,
+    CookingWeeklyStat,
+)
+from app.models.user import User
+from app.repositories.cooking_history import CookingHistoryRepository
+from app.repositories.cooking_stats import CookingStatsRepository
+from tests.factories.user import UserFactory
+
+
+def _recipe_payload() -> dict:
+    suffix = uuid.uuid4().hex[:8]
+    return {
+        "title": f"Test Recipe {suffix}",
+        "photo_url": "https://example.com/photo.jpg",
+        "description": "A test recipe description",
+        "prep_time": 10,
+        "cook_time": 20,
+        "difficulty": "easy",
+        "servings": "4",
+        "slug": f"test-recipe-{suffix}",
+        "is_active": True,
+    }
+
+
+async def _cook(
+    client: AsyncClient, db_session: AsyncSession, user: User, days_ago: int,
+) -> CookingHistory:
+    """Record a dish cooked ``days_ago`` days back on a new recipe."""
+    recipe = (await client.post("/api/v1/recipes/admin", json=_recipe_payload())).json()
+    record = CookingHistory(
+        user_id=user.id, recipe_id=uuid.UUID(recipe["id"]),
+        cooked_at=datetime.now(timezone.utc) - timedelta(days=days_ago),
+    )
+    db_session.add(record)
+    await db_session.flush()
+    return record
+
+
+async def test_list_history_cursor_pagination(
+    client: AsyncClient, db_session: AsyncSession, test_user: User,
+):
+    records = [await _cook(client, db_session, test_user, days_ago) for days_ago in (3, 1, 2)]
+
+    seen: list[str] = []
+    params: dict = {"limit": 2}
+    while True:
+        resp = await client.get("/api/v1/cooking-history", params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 3
+        seen.extend(item["id"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": data["next_cursor"]}
+
+    by_latest = sorted(records, key=lambda record: record.cooked_at, reverse=True)
+    assert seen == [str(record.id) for record in by_latest]
+    recipe = data["items"][0]["recipe"]
+    assert "description" not in recipe
+    assert {"id", "slug", "title", "photo_url", "difficulty"} <= recipe.keys()
+
+
+async def test_list_recent_history(client: AsyncClient, db_session: AsyncSession, test_user: User):
+    recent = await _cook(client, db_session, test_user, days_ago=1)
+    await _cook(client, db_session, test_user, days_ago=30)
+
+    resp = await client.get("/api/v1/cooking-history/recent")
+    assert resp.status_code == 200
+    items = resp.json()
+    assert [item["id"] for item in items] == [str(recent.id)]
+    assert items[0]["recipe"]["id"] == str(recent.recipe_id)
+
+
+async def test_record_history_once_per_day(client: AsyncClient):
+    first = (await client.post("/api/v1/recipes/admin", json=_recipe_payload())).json()
+    second = (await client.post("/api/v1/recipes/admin", json=_recipe_payload())).json()
+
+    assert (await client.post(f"/api/v1/recipes/{first['id']}/history")).status_code == 200
+    resp = await client.post(f"/api/v1/recipes/{second['id']}/history")
+    assert resp.status_code == 409
+
+
+async def test_record_day_follows_user_timezone(
+    client: AsyncClient, db_session: AsyncSession, test_user: User,
+):
+    recipe = (await client.post("/api/v1/recipes/admin", json=_recipe_payload())).json()
+    test_user.timezone = "Asia/Tokyo"
+    await db_session.flush()
+    repo = CookingHistoryRepository(db_session)
+
+    async def record(day: int, hour: int) -> CookingHistory | None:
+        cooked_at = datetime(2026, 1, day, hour, tzinfo=timezone.utc)
+        return await repo.record(test_user.id, uuid.UUID(recipe["id"]), cooked_at)
+
+    # 19:00 on Jan 1 and 01:00 on Jan 2 in Tokyo: the same UTC day, two local days
+    evening = await record(1, 10)
+    night = await record(1, 16)
+    assert evening is not None and night is not None
+    assert (evening.cooked_on.day, night.cooked_on.day) == (1, 2)
+    assert night.timezone == "Asia/Tokyo"
+
+    # 11:00 on Jan 2 in Tokyo
+    assert await record(2, 2) is None
+
+
+async def test_stats_follow_recorded_history(
+    client: AsyncClient, db_session: AsyncSession, test_user: User,
+):
+    suffix = uuid.uuid4().hex[:8]
+    category = await client.post(
+        "/api/v1/categories/admin", json={"title": f"Супы {suffix}", "slug": f"soups-{suffix}"},
+    )
+    assert category.status_code == 201, category.text
+    category_id = category.json()["id"]
+    recipe = (await client.post(
+        "/api/v1/recipes/admin", json={**_recipe_payload(), "category_ids": [category_id]},
+    )).json()
+
+    resp = await client.post(f"/api/v1/recipes/{recipe['id']}/history")
+    assert resp.status_code == 200
+
+    resp = await client.get("/api/v1/cooking-history/stats", params={"days": 7})
+    assert resp.status_code == 200
+    stats = resp.json()
+    assert (stats["total_dishes"], stats["current_streak"], stats["longest_streak"]) == (1, 1, 1)
+    assert len(stats["daily"]) == 7
+    assert stats["daily"][-1]["dishes"] == 1
+    assert [week["dishes"] for week in stats["weekly"]] == [1]
+    assert stats["top_categories"] == [
+        {"category_id": category_id, "title": category.json()["title"], "dishes": 1},
+    ]
+
+    resp = await client.get("/api/v1/cooking-history/admin/stats", params={"days": 2})
+    assert resp.status_code == 200
+    assert sum(day["dishes"] for day in resp.json()["daily"]) >= 1
+
+
+async def test_stats_rebuild_matches_incremental_rollups(
+    client: AsyncClient, db_session: AsyncSession, test_user: User,
+):
+    for days_ago in (0, 1, 2, 9):
+        recipe = (await client.post("/api/v1/recipes/admin", json=_recipe_payload())).json()
+        cooked_at = datetime.now(timezone.utc) - timedelta(days=days_ago)
+        history = await CookingHistoryRepository(db_session).record(
+            test_user.id, uuid.UUID(recipe["id"]), cooked_at,
+        )
+        await CookingStatsRepository(db_session).apply(history)
+
+    incremental = (await client.get("/api/v1/cooking-history/stats", params={"days": 14})).json()
+    await CookingStatsRepository(db_session).rebuild()
+    rebuilt = (await client.get("/api/v1/cooking-history/stats", params={"days": 14})).json()
+
+    assert rebuilt == incremental
+    assert (incremental["total_dishes"], incremental["longest_streak"]) == (4, 3)
+
+
+async def _rollups(db_session: AsyncSession) -> dict[str, list[tuple]]:
+    rows = {}
+    for model in (CookingDailyStat, CookingWeeklyStat, CookingCategoryStat, CookingActivityStat):
+        result = await db_session.execute(select(model.__table__))
+        rows[model.__tablename__] = sorted(tuple(row) for row in result.all())
+    return rows
+
+
+async def _cook_in_category(
+    client: AsyncClient, db_session: AsyncSession, user: User, category_id: str, days_ago: int,
+) -> str:
+    payload = {**_recipe_payload(), "category_ids": [category_id]}
+    recipe = (await client.post("/api/v1/recipes/admin", json=payload)).json()
+    history = await CookingHistoryRepository(db_session).record(
+        user.id, uuid.UUID(recipe["id"]), datetime.now(timezone.utc) - timedelta(days=days_ago),
+    )
+    await CookingStatsRepository(db_session).apply(history)
+    return recipe["id"]
+
+
+async def test_stats_forget_deleted_recipe(
+    client: AsyncClient, db_session: AsyncSession, test_user: User,
+):
+    suffix = uuid.uuid4().hex[:8]
+    category = (await client.post(
+        "/api/v1/categories/admin", json={"title": f"Soups {suffix}", "slug": f"soups-{suffix}"},
+    )).json()
+    for days_ago in (3, 1):
+        await _cook_in_category(client, db_session, test_user, category["id"], days_ago)
+    # The latest dish, so the category's last_cooked_on has to move back
+    deleted = await _cook_in_category(client, db_session, test_user, category["id"], days_ago=0)
+
+    resp = await client.delete(f"/api/v1/recipes/{deleted}/admin")
+    assert resp.status_code == 200
+    incremental = await _rollups(db_session)
+    await CookingStatsRepository(db_session).rebuild()
+
+    assert incremental == await _rollups(db_session)
+    assert sum(row[2] for row in incremental["cooking_daily_stats"]) == 2
+
+
+async def test_stats_follow_changed_categories(
+    client: AsyncClient, db_session: AsyncSession, test_user: User,
+):
+    suffix = uuid.uuid4().hex[:8]
+    soups, salads = [(await client.post(
+        "/api/v1/categories/admin", json={"title": f"{title} {suffix}", "slug": f"{title}-{suffix}"},
+    )).json() for title in ("soups", "salads")]
+    await _cook_in_category(client, db_session, test_user, soups["id"], days_ago=3)
+    # The latest soup, so the category's last_cooked_on has to move back
+    moved = await _cook_in_category(client, db_session, test_user, soups["id"], days_ago=1)
+
+    resp = await client.patch(
+        f"/api/v1/recipes/{moved}/admin", json={"categories": [salads["id"]]},
+    )
+    assert resp.status_code == 200
+    incremental = await _rollups(db_session)
+    await CookingStatsRepository(db_session).rebuild()
+    assert incremental == await _rollups(db_session)
+    dishes = {
+        row[1]: row[2] for row in incremental["cooking_category_stats"] if row[0] == test_user.id
+    }
+    assert dishes == {uuid.UUID(soups["id"]): 1, uuid.UUID(salads["id"]): 1}
+
+    resp = await client.delete(f"/api/v1/recipes/{moved}/admin")
+    assert resp.status_code == 200
+    incremental = await _rollups(db_session)
+    await CookingStatsRepository(db_session).rebuild()
+    assert incremental == await _rollups(db_session)
+    assert uuid.UUID(salads["id"]) not in {
+        row[1] for row in incremental["cooking_category_stats"] if row[0] == test_user.id
+    }
+
+
+async def test_stats_forget_deleted_user(
+    client: AsyncClient, db_session: AsyncSession, test_user: User,
+):
+    category = (await client.post(
+        "/api/v1/categories/admin",
+        json={"title": f"Salads {uuid.uuid4().hex[:8]}", "slug": f"salads-{uuid.uuid4().hex[:8]}"},
+    )).json()
+    other = UserFactory.build()
+    db_session.add(other)
+    await db_session.flush()
+    await _cook_in_category(client, db_session, test_user, category["id"], days_ago=0)
+    await _cook_in_category(client, db_session, other, category["id"], days_ago=0)
+
+    resp = await client.delete(f"/api/v1/users/{other.id}/admin")
+    assert resp.status_code == 200
+    incremental = await _rollups(db_session)
+    await CookingStatsRepository(db_session).rebuild()
+
+    assert incremental == await _rollups(db_session)
+    assert [r[1] for r in incremental["cooking_activity_stats"]] == [1]
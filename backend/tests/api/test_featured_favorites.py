@@ -1,11 +1,14 @@
-"""Integration test: featured recipes are auto-copied to new user's favorites."""
+"""Integration tests: featured recipes as favorites, copied or resolved virtually."""
 
 import uuid
 
+import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
+from app.models.dismissed_featured import UserDismissedFeatured
 from app.models.favorite import FavoriteRecipe
 from app.models.recipe import Recipe
 from app.models.user import User
@@ -67,6 +70,28 @@ async def test_featured_copied_to_favorites_on_user_creation(
     assert recipe_id in fav_recipe_ids
 
 
+async def test_first_login_copies_featured_to_favorites(
+    db_session: AsyncSession,
+    client: AsyncClient,
+):
+    """First login copies every featured recipe into the new user's favorites."""
+    featured_ids = set()
+    for _ in range(3):
+        r = await client.post("/api/v1/recipes/admin", json=_recipe_payload())
+        await client.patch(f"/api/v1/recipes/{r.json()['id']}/admin/featured")
+        featured_ids.add(uuid.UUID(r.json()["id"]))
+    await client.post("/api/v1/recipes/admin", json=_recipe_payload())
+
+    resp = await client.post("/api/v1/auth/login/dev")
+    assert resp.status_code == 200
+    user_id = uuid.UUID(resp.json()["user_id"])
+
+    favs = await db_session.execute(
+        select(FavoriteRecipe.recipe_id).where(FavoriteRecipe.user_id == user_id)
+    )
+    assert set(favs.scalars().all()) == featured_ids
+
+
 async def test_existing_user_no_duplicate_favorites(
     client: AsyncClient,
 ):
@@ -80,6 +105,130 @@ async def test_existing_user_no_duplicate_favorites(
     resp = await client.post(f"/api/v1/recipes/{recipe_id}/favorite")
     assert resp.status_code == 200
 
-    # Adding again should fail with conflict (409)
+    # Adding again is idempotent (double taps must not fail)
     resp2 = await client.post(f"/api/v1/recipes/{recipe_id}/favorite")
-    assert resp2.status_code == 409
+    assert resp2.status_code == 200
+    assert resp2.json()["is_favorited"] is True
+
+
+async def test_remove_tracks_dismissal_only_for_featured(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+):
+    plain = (await client.post("/api/v1/recipes/admin", json=_recipe_payload())).json()["id"]
+    featured = (await client.post("/api/v1/recipes/admin", json=_recipe_payload())).json()["id"]
+    await client.patch(f"/api/v1/recipes/{featured}/admin/featured")
+
+    # Featured but never favorited: nothing to remove, nothing dismissed
+    assert (await client.delete(f"/api/v1/recipes/{featured}/favorite")).status_code == 404
+
+    for recipe_id in (plain, featured):
+        assert (await client.post(f"/api/v1/recipes/{recipe_id}/favorite")).status_code == 200
+        assert (await client.delete(f"/api/v1/recipes/{recipe_id}/favorite")).status_code == 200
+
+    dismissed = await db_session.execute(
+        select(UserDismissedFeatured.recipe_id).where(UserDismissedFeatured.user_id == test_user.id)
+    )
+    assert dismissed.scalars().all() == [uuid.UUID(featured)]
+    remaining = await db_session.execute(
+        select(FavoriteRecipe).where(FavoriteRecipe.user_id == test_user.id)
+    )
+    assert remaining.scalars().all() == []
+
+
+@pytest.fixture
+def virtual_featured(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(get_settings(), "virtual_featured_favorites", True)
+
+
+async def _favorited_ids(client: AsyncClient) -> set[str]:
+    resp = await client.get("/api/v1/recipes", params={"is_favorited": "true", "limit": 100})
+    assert resp.status_code == 200
+    items = resp.json()["items"]
+    assert all(item["is_favorited"] for item in items)
+    return {item["id"] for item in items}
+
+
+async def test_virtual_featured_is_favorite_without_copies(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    virtual_featured: None,
+):
+    """In virtual mode featuring a recipe writes no favorites, yet every user sees it."""
+    r = await client.post("/api/v1/recipes/admin", json=_recipe_payload())
+    recipe_id = r.json()["id"]
+    await client.patch(f"/api/v1/recipes/{recipe_id}/admin/featured")
+
+    assert recipe_id in await _favorited_ids(client)
+    detail = await client.get(f"/api/v1/recipes/{recipe_id}")
+    assert detail.json()["is_favorited"] is True
+
+    copies = await db_session.execute(
+        select(FavoriteRecipe).where(FavoriteRecipe.recipe_id == uuid.UUID(recipe_id))
+    )
+    assert copies.scalars().all() == []
+
+    # Already a favorite by being featured: adding writes no row
+    resp = await client.post(f"/api/v1/recipes/{recipe_id}/favorite")
+    assert resp.status_code == 200
+    copies = await db_session.execute(
+        select(FavoriteRecipe).where(FavoriteRecipe.recipe_id == uuid.UUID(recipe_id))
+    )
+    assert copies.scalars().all() == []
+
+
+async def test_virtual_featured_dismiss_and_readd(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    virtual_featured: None,
+):
+    r = await client.post("/api/v1/recipes/admin", json=_recipe_payload())
+    recipe_id = r.json()["id"]
+    await client.patch(f"/api/v1/recipes/{recipe_id}/admin/featured")
+
+    resp = await client.delete(f"/api/v1/recipes/{recipe_id}/favorite")
+    assert resp.status_code == 200
+    assert recipe_id not in await _favorited_ids(client)
+    dismissed = await db_session.execute(
+        select(UserDismissedFeatured).where(
+            UserDismissedFeatured.user_id == test_user.id,
+            UserDismissedFeatured.recipe_id == uuid.UUID(recipe_id),
+        )
+    )
+    assert dismissed.scalar_one_or_none() is not None
+
+    # Removing again: no longer a favorite
+    resp = await client.delete(f"/api/v1/recipes/{recipe_id}/favorite")
+    assert resp.status_code == 404
+
+    # An explicit favorite wins over the dismissal
+    resp = await client.post(f"/api/v1/recipes/{recipe_id}/favorite")
+    assert resp.status_code == 200
+    assert recipe_id in await _favorited_ids(client)
+
+
+async def test_virtual_featured_listed_as_favorite_cards(
+    client: AsyncClient,
+    virtual_featured: None,
+):
+    featured = (await client.post("/api/v1/recipes/admin", json=_recipe_payload())).json()["id"]
+    await client.patch(f"/api/v1/recipes/{featured}/admin/featured")
+    explicit = (await client.post("/api/v1/recipes/admin", json=_recipe_payload())).json()["id"]
+    await client.post(f"/api/v1/recipes/{explicit}/favorite")
+
+    resp = await client.get("/api/v1/recipes/favorites", params={"limit": 100})
+    assert resp.status_code == 200
+    listed = [item["id"] for item in resp.json()["items"]]
+    assert {featured, explicit} <= set(listed)
+    assert len(listed) == len(set(listed))
+
+    await client.delete(f"/api/v1/recipes/{featured}/favorite")
+    resp = await client.get("/api/v1/recipes/favorites", params={"limit": 100})
+    assert featured not in {item["id"] for item in resp.json()["items"]}
+
+
+async def test_virtual_featured_sync_is_rejected(client: AsyncClient, virtual_featured: None):
+    resp = await client.post("/api/v1/recipes/admin/sync-featured")
+    assert resp.status_code == 400
@@ -1,15 +1,46 @@
 """Integration tests for featured sync endpoint."""
 
 import uuid
+from datetime import datetime, timedelta, timezone
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
+import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.dependencies import get_session_scope
+from app.main import app
 from app.models.dismissed_featured import UserDismissedFeatured
 from app.models.favorite import FavoriteRecipe
-from app.models.featured_sync import FeaturedSyncConfig
+from app.models.featured_sync import FeaturedSyncConfig, FeaturedSyncJob
 from app.models.user import User
+from app.services.featured_sync import wait_featured_sync
+from tests.factories.user import UserFactory
+
+
+@pytest.fixture(autouse=True)
+def _sync_in_test_transaction(db_session: AsyncSession):
+    """Run the sync worker's transactions as savepoints of the test transaction."""
+    @asynccontextmanager
+    async def scope() -> AsyncIterator[AsyncSession]:
+        async with db_session.begin_nested():
+            yield db_session
+
+    app.dependency_overrides[get_session_scope] = lambda: scope
+    yield
+    app.dependency_overrides.pop(get_session_scope, None)
+
+
+async def _sync(client: AsyncClient) -> dict:
+    """Start a sync, wait for its worker and return the final job status."""
+    resp = await client.post("/api/v1/recipes/admin/sync-featured")
+    assert resp.status_code == 202
+    await wait_featured_sync()
+    resp = await client.get("/api/v1/recipes/admin/sync-featured/status")
+    assert resp.status_code == 200
+    return resp.json()
 
 
 def _recipe_payload() -> dict:
@@ -41,10 +72,9 @@ async def test_sync_featured_adds_new_recipes(
     await client.patch(f"/api/v1/recipes/{recipe_id}/admin/featured")
 
     # Run sync
-    resp = await client.post("/api/v1/recipes/admin/sync-featured")
-    assert resp.status_code == 200
-    data = resp.json()
-    assert data["added"] >= 1
+    data = await _sync(client)
+    assert data["status"] == "completed"
+    assert data["rows_inserted"] >= 1
 
     # Verify recipe is now in user's favorites
     favs = await db_session.execute(
@@ -58,6 +88,7 @@ async def test_sync_featured_adds_new_recipes(
 
 async def test_sync_featured_no_duplicates(
     client: AsyncClient,
+    db_session: AsyncSession,
 ):
     """Second sync should not add duplicates."""
     r = await client.post("/api/v1/recipes/admin", json=_recipe_payload())
@@ -65,14 +96,18 @@ async def test_sync_featured_no_duplicates(
     await client.patch(f"/api/v1/recipes/{recipe_id}/admin/featured")
 
     # First sync
-    resp1 = await client.post("/api/v1/recipes/admin/sync-featured")
-    assert resp1.status_code == 200
-    first_added = resp1.json()["added"]
+    first = await _sync(client)
+    assert first["rows_inserted"] >= 1
 
     # Second sync — should add 0 (already synced, featured_at <= last_sync_at)
-    resp2 = await client.post("/api/v1/recipes/admin/sync-featured")
-    assert resp2.status_code == 200
-    assert resp2.json()["added"] == 0
+    resp = await client.post("/api/v1/recipes/admin/sync-featured")
+    await wait_featured_sync()
+    second = await db_session.get(
+        FeaturedSyncJob, uuid.UUID(resp.json()["id"]), populate_existing=True,
+    )
+    assert second.id != uuid.UUID(first["id"])
+    assert second.status == "completed"
+    assert second.rows_inserted == 0
 
 
 async def test_sync_skips_dismissed(
@@ -85,7 +120,7 @@ async def test_sync_skips_dismissed(
     r = await client.post("/api/v1/recipes/admin", json=_recipe_payload())
     recipe_id = uuid.UUID(r.json()["id"])
     await client.patch(f"/api/v1/recipes/{recipe_id}/admin/featured")
-    await client.post("/api/v1/recipes/admin/sync-featured")
+    await _sync(client)
 
     # User removes recipe from favorites (triggers dismissed)
     await client.delete(f"/api/v1/recipes/{recipe_id}/favorite")
@@ -104,8 +139,7 @@ async def test_sync_skips_dismissed(
     await client.patch(f"/api/v1/recipes/{recipe_id}/admin/featured")  # on again
 
     # Sync again — should NOT re-add because it's dismissed
-    resp = await client.post("/api/v1/recipes/admin/sync-featured")
-    assert resp.status_code == 200
+    assert (await _sync(client))["status"] == "completed"
 
     # Verify recipe is NOT back in favorites
     favs = await db_session.execute(
@@ -129,7 +163,7 @@ async def test_sync_preserves_user_own_favorites(
     await client.post(f"/api/v1/recipes/{recipe_id}/favorite")
 
     # Run sync (for other featured recipes)
-    await client.post("/api/v1/recipes/admin/sync-featured")
+    await _sync(client)
 
     # Verify user's manual favorite is still there
     favs = await db_session.execute(
@@ -144,7 +178,71 @@ async def test_sync_preserves_user_own_favorites(
 async def test_sync_no_new_recipes_returns_zero(
     client: AsyncClient,
 ):
-    """If no new featured recipes, sync should return 0."""
-    resp = await client.post("/api/v1/recipes/admin/sync-featured")
-    assert resp.status_code == 200
-    assert resp.json()["added"] == 0
+    """If no new featured recipes, sync should insert nothing."""
+    data = await _sync(client)
+    assert data["status"] == "completed"
+    assert data["rows_inserted"] == 0
+
+
+
+async def test_sync_processes_users_in_chunks(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Every user is covered when the sync walks them in several chunks."""
+    monkeypatch.setattr("app.services.featured_sync.FEATURED_SYNC_CHUNK_SIZE", 2)
+    db_session.add_all(UserFactory.build_batch(3))
+    await db_session.flush()
+    users = (await db_session.execute(select(func.count()).select_from(User))).scalar_one()
+
+    r = await client.post("/api/v1/recipes/admin", json=_recipe_payload())
+    await client.patch(f"/api/v1/recipes/{r.json()['id']}/admin/featured")
+
+    data = await _sync(client)
+    assert data["status"] == "completed"
+    assert data["rows_inserted"] == users
+    assert data["chunks_done"] == data["chunks_total"] >= 3
+
+
+async def test_sync_resumes_from_checkpoint(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """An interrupted job continues after its cursor instead of starting over."""
+    db_session.add_all(UserFactory.build_batch(2))
+    r = await client.post("/api/v1/recipes/admin", json=_recipe_payload())
+    recipe_id = uuid.UUID(r.json()["id"])
+    await client.patch(f"/api/v1/recipes/{recipe_id}/admin/featured")
+
+    config = (await db_session.execute(select(FeaturedSyncConfig))).scalar_one_or_none()
+    user_ids = sorted((await db_session.execute(select(User.id))).scalars().all())
+    # A worker died after committing the chunk ending at the second user
+    job = FeaturedSyncJob(
+        status="running",
+        featured_since=config.last_sync_at if config else datetime.now(timezone.utc) - timedelta(days=1),
+        featured_until=datetime.now(timezone.utc),
+        chunk_size=2,
+        chunks_total=2,
+        chunks_done=1,
+        rows_inserted=0,
+        cursor_user_id=user_ids[1],
+        started_at=datetime.now(timezone.utc),
+    )
+    db_session.add(job)
+    await db_session.flush()
+
+    data = await _sync(client)
+    assert data["id"] == str(job.id)
+    assert data["status"] == "completed"
+    assert data["rows_inserted"] == len(user_ids) - 2
+
+    favorited = set((await db_session.execute(
+        select(FavoriteRecipe.user_id).where(FavoriteRecipe.recipe_id == recipe_id)
+    )).scalars().all())
+    assert favorited == set(user_ids[2:])
+
+
+async def test_sync_status_without_jobs(client: AsyncClient):
+    resp = await client.get("/api/v1/recipes/admin/sync-featured/status")
+    assert resp.status_code == 404
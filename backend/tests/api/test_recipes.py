@@ -3,6 +3,11 @@
 import uuid
 
 from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import FAVORITES_BULK_MAX_IDS
+from app.models.recipe_document import RecipeDocument
 
 
 def _recipe_payload(slug_suffix: str = "") -> dict:
@@ -105,6 +110,70 @@ async def test_remove_favorite(client: AsyncClient):
     assert data["is_favorited"] is False
 
 
+async def test_add_favorite_unknown_recipe(client: AsyncClient):
+    response = await client.post(f"/api/v1/recipes/{uuid.uuid4()}/favorite")
+    assert response.status_code == 404
+
+
+async def test_bulk_favorites(client: AsyncClient):
+    first, second = await _create_recipe(client), await _create_recipe(client)
+    await client.post(f"/api/v1/recipes/{first['id']}/favorite")
+    unknown = str(uuid.uuid4())
+
+    response = await client.post("/api/v1/recipes/favorites/bulk", json={
+        "action": "add", "recipe_ids": [first["id"], second["id"], unknown],
+    })
+    assert response.status_code == 200
+    assert response.json() == {"action": "add", "changed": [second["id"]]}
+
+    response = await client.post("/api/v1/recipes/favorites/bulk", json={
+        "action": "remove", "recipe_ids": [first["id"], second["id"], unknown],
+    })
+    assert sorted(response.json()["changed"]) == sorted([first["id"], second["id"]])
+
+    listed = await client.get("/api/v1/recipes", params={"is_favorited": "true"})
+    assert listed.json()["items"] == []
+
+
+async def test_bulk_favorites_limits(client: AsyncClient):
+    response = await client.post("/api/v1/recipes/favorites/bulk", json={"action": "add", "recipe_ids": []})
+    assert response.status_code == 422
+    response = await client.post("/api/v1/recipes/favorites/bulk", json={
+        "action": "add", "recipe_ids": [str(uuid.uuid4()) for _ in range(FAVORITES_BULK_MAX_IDS + 1)],
+    })
+    assert response.status_code == 422
+
+
+async def test_list_favorites_cursor_pagination(client: AsyncClient):
+    created = [(await _create_recipe(client))["id"] for _ in range(3)]
+    for recipe_id in created:
+        await client.post(f"/api/v1/recipes/{recipe_id}/favorite")
+    unfavorited = await _create_recipe(client)
+
+    seen: list[str] = []
+    params: dict = {"limit": 2}
+    while True:
+        resp = await client.get("/api/v1/recipes/favorites", params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 3
+        seen.extend(item["id"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": data["next_cursor"]}
+
+    assert sorted(seen) == sorted(created)
+    assert unfavorited["id"] not in seen
+    item = data["items"][0]
+    assert "description" not in item
+    assert {"slug", "title", "photo_url", "difficulty", "favorited_at"} <= item.keys()
+
+
+async def test_list_favorites_invalid_cursor(client: AsyncClient):
+    resp = await client.get("/api/v1/recipes/favorites", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
 async def test_record_history(client: AsyncClient):
     recipe = await _create_recipe(client)
     response = await client.post(f"/api/v1/recipes/{recipe['id']}/history")
@@ -161,3 +230,194 @@ async def test_admin_list_includes_is_featured_field(client: AsyncClient):
     item = resp.json()["items"][0]
     assert "is_featured" in item
     assert item["is_featured"] is False
+
+
+async def test_list_recipes_cursor_pagination(client: AsyncClient):
+    created = {(await _create_recipe(client))["id"] for _ in range(3)}
+
+    seen: list[str] = []
+    params: dict = {"limit": 2}
+    while True:
+        resp = await client.get("/api/v1/recipes", params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        seen.extend(item["id"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": data["next_cursor"]}
+
+    assert len(seen) == len(set(seen))
+    assert created <= set(seen)
+
+
+async def test_list_recipes_invalid_cursor(client: AsyncClient):
+    resp = await client.get("/api/v1/recipes", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
+async def _walk_random(client: AsyncClient, seed: int, limit: int = 2) -> list[str]:
+    seen: list[str] = []
+    params: dict = {"random": "true", "seed": seed, "limit": limit}
+    while True:
+        resp = await client.get("/api/v1/recipes", params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        seen.extend(item["id"] for item in data["items"])
+        if data["next_cursor"] is None:
+            return seen
+        params = {"random": "true", "limit": limit, "cursor": data["next_cursor"]}
+
+
+async def test_list_recipes_random_is_stable_and_never_repeats(client: AsyncClient):
+    created = {(await _create_recipe(client))["id"] for _ in range(5)}
+
+    first = await _walk_random(client, seed=7)
+    assert len(first) == len(set(first))
+    assert created <= set(first)
+    assert await _walk_random(client, seed=7) == first
+
+
+async def test_list_recipes_exclude_cooked_recently(client: AsyncClient):
+    cooked = await _create_recipe(client)
+    other = await _create_recipe(client)
+    await client.post(f"/api/v1/recipes/{cooked['id']}/history")
+
+    resp = await client.get("/api/v1/recipes", params={"exclude_cooked_days": 7, "limit": 100})
+    assert resp.status_code == 200
+    ids = [item["id"] for item in resp.json()["items"]]
+    assert other["id"] in ids
+    assert cooked["id"] not in ids
+
+
+async def test_list_recipes_fulltext_search_stems_russian(client: AsyncClient):
+    borscht = _recipe_payload()
+    borscht["title"] = f"Борщ {uuid.uuid4().hex[:6]}"
+    borscht["description"] = "Наваристый суп с говядиной и свёклой"
+    resp = await client.post("/api/v1/recipes/admin", json=borscht)
+    assert resp.status_code == 201
+    borscht_id = resp.json()["id"]
+    other = await _create_recipe(client)
+
+    resp = await client.get(
+        "/api/v1/recipes", params={"search": "борщи с говядиной", "search_mode": "fulltext"},
+    )
+    assert resp.status_code == 200
+    ids = [item["id"] for item in resp.json()["items"]]
+    assert ids == [borscht_id]
+    assert other["id"] not in ids
+
+
+async def test_list_recipes_invalid_search_mode(client: AsyncClient):
+    resp = await client.get("/api/v1/recipes", params={"search": "x", "search_mode": "regex"})
+    assert resp.status_code == 422
+
+
+async def test_list_recipes_window_total(client: AsyncClient):
+    for _ in range(3):
+        await _create_recipe(client)
+
+    first = (await client.get("/api/v1/recipes", params={"limit": 2})).json()
+    assert first["total"] >= 3
+    assert first["has_more"] is True
+
+    past_end = (await client.get("/api/v1/recipes", params={"offset": first["total"]})).json()
+    assert past_end["items"] == []
+    assert past_end["total"] == first["total"]
+    assert past_end["has_more"] is False
+
+    admin = (await client.get("/api/v1/recipes/admin", params={"offset": first["total"]})).json()
+    assert admin["items"] == []
+    assert admin["total"] == first["total"]
+
+
+async def test_list_recipes_without_total(client: AsyncClient):
+    for _ in range(3):
+        await _create_recipe(client)
+
+    for path in ("/api/v1/recipes", "/api/v1/recipes/admin"):
+        resp = await client.get(path, params={"limit": 2, "include_total": "false"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] is None
+        assert data["has_more"] is True
+        assert len(data["items"]) == 2
+
+
+async def test_list_and_detail_flags(client: AsyncClient):
+    recipe = await _create_recipe(client)
+    await client.post(f"/api/v1/recipes/{recipe['id']}/favorite")
+    await client.post(f"/api/v1/recipes/{recipe['id']}/history")
+
+    resp = await client.get("/api/v1/recipes", params={"slug": recipe["slug"]})
+    item = resp.json()["items"][0]
+    assert (item["is_favorited"], item["is_in_history"]) == (True, True)
+
+    detail = (await client.get(f"/api/v1/recipes/{recipe['id']}")).json()
+    assert (detail["is_favorited"], detail["is_in_history"]) == (True, True)
+
+
+async def test_detail_document_follows_steps_and_ingredients(client: AsyncClient):
+    suffix = uuid.uuid4().hex[:8]
+    ingredient = (await client.post(
+        "/api/v1/ingredients/admin",
+        json={"title": f"Salt {suffix}", "slug": f"salt-{suffix}", "unit_of_measurement": "g"},
+    )).json()
+    payload = _recipe_payload()
+    payload["ingredient_ids"] = [{"ingredient_id": ingredient["id"], "amount": 5}]
+    recipe = (await client.post("/api/v1/recipes/admin", json=payload)).json()
+
+    detail = (await client.get(f"/api/v1/recipes/{recipe['id']}")).json()
+    assert detail["title"] == payload["title"]
+    assert detail["steps"] == []
+
+    step = (await client.post(
+        "/api/v1/steps/admin",
+        json={"recipe_id": recipe["id"], "step_number": 1, "title": "Boil water"},
+    )).json()
+    await client.patch(
+        f"/api/v1/ingredients/{ingredient['id']}/admin", json={"title": f"Sea salt {suffix}"},
+    )
+
+    detail = (await client.get(f"/api/v1/recipes/{recipe['id']}")).json()
+    assert [s["title"] for s in detail["steps"]] == ["Boil water"]
+    assert detail["recipe_ingredients"][0]["ingredient"]["title"] == f"Sea salt {suffix}"
+
+    await client.delete(f"/api/v1/steps/{step['id']}/admin")
+    detail = (await client.get(f"/api/v1/recipes/{recipe['id']}")).json()
+    assert detail["steps"] == []
+
+
+async def test_detail_document_built_on_first_read(client: AsyncClient, db_session: AsyncSession):
+    recipe = await _create_recipe(client)
+    await db_session.execute(delete(RecipeDocument).where(RecipeDocument.recipe_id == recipe["id"]))
+
+    resp = await client.get(f"/api/v1/recipes/{recipe['id']}")
+    assert resp.status_code == 200
+    assert resp.json()["slug"] == recipe["slug"]
+
+    missing = await client.get(f"/api/v1/recipes/{uuid.uuid4()}")
+    assert missing.status_code == 404
+
+
+async def test_get_recipes_batch(client: AsyncClient):
+    first = await _create_recipe(client)
+    second = await _create_recipe(client)
+    await client.post(f"/api/v1/recipes/{second['id']}/favorite")
+    unknown = str(uuid.uuid4())
+
+    resp = await client.get(
+        "/api/v1/recipes/batch", params=[("ids", second["id"]), ("ids", unknown), ("ids", first["id"])],
+    )
+    assert resp.status_code == 200
+    items = resp.json()["items"]
+    assert [item["id"] for item in items] == [second["id"], unknown, first["id"]]
+    assert [item["status"] for item in items] == [200, 404, 200]
+    assert items[0]["recipe"]["is_favorited"] is True
+    assert items[1]["recipe"] is None
+    assert items[2]["recipe"]["slug"] == first["slug"]
+
+
+async def test_get_recipes_batch_is_capped(client: AsyncClient):
+    ids = [("ids", str(uuid.uuid4())) for _ in range(51)]
+    resp = await client.get("/api/v1/recipes/batch", params=ids)
+    assert resp.status_code == 422
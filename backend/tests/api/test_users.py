@@ -1,9 +1,14 @@
 """Tests for /api/v1/users endpoints."""
 
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.user import User
+from app.core.database import run_after_commit
+from app.core.security import create_access_token
+from app.models.user import Admin, User
+from app.services.admin_cache import admin_cache
+from app.services.user_cache import user_cache
 from tests.factories.user import UserFactory
 
 
@@ -34,6 +39,16 @@ async def test_patch_me(client: AsyncClient, test_user: User):
     assert data["username"] == "new_name"
 
 
+async def test_patch_me_timezone(client: AsyncClient):
+    response = await client.patch("/api/v1/users/me", json={"timezone": "Asia/Tokyo"})
+    assert response.status_code == 200
+    assert response.json()["timezone"] == "Asia/Tokyo"
+
+    for invalid in ("Mars/Olympus", None):
+        response = await client.patch("/api/v1/users/me", json={"timezone": invalid})
+        assert response.status_code == 422
+
+
 async def test_list_users_admin(client: AsyncClient):
     response = await client.get("/api/v1/users/admin")
     assert response.status_code == 200
@@ -78,3 +93,67 @@ async def test_delete_user_admin(
     data = response.json()
     assert data["is_deleted"] is True
     assert data["id"] == str(user.id)
+
+
+async def test_me_principal_is_cached_until_update(
+    unauthed_client: AsyncClient, test_user: User, db_session: AsyncSession,
+):
+    user_cache.clear()
+    headers = {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+    response = await unauthed_client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 200
+    assert user_cache.get(test_user.id) is not None
+
+    response = await unauthed_client.patch(
+        "/api/v1/users/me", json={"first_name": "Renamed"}, headers=headers,
+    )
+    assert response.status_code == 200
+    # Dropped only once the change commits, which the test session stands in for here
+    assert user_cache.get(test_user.id) is not None
+    await run_after_commit(db_session)
+    assert user_cache.get(test_user.id) is None
+    response = await unauthed_client.get("/api/v1/users/me", headers=headers)
+    assert response.json()["first_name"] == "Renamed"
+
+    await db_session.delete(test_user)
+    await db_session.flush()
+    user_cache.clear()
+    response = await unauthed_client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 401
+
+
+async def test_admin_requires_role_claim_and_current_admin_row(
+    unauthed_client: AsyncClient, test_admin: User, db_session: AsyncSession,
+):
+    admin_cache.clear()
+    admin_headers = {
+        "Authorization": f"Bearer {create_access_token(test_admin.id, role='admin')}",
+    }
+    response = await unauthed_client.get("/api/v1/users/admin", headers=admin_headers)
+    assert response.status_code == 200
+    assert test_admin.id in admin_cache.get()
+
+    user_headers = {"Authorization": f"Bearer {create_access_token(test_admin.id)}"}
+    response = await unauthed_client.get("/api/v1/users/admin", headers=user_headers)
+    assert response.status_code == 403
+
+    # Issued before the role claim existed: authorized by the admin set alone
+    legacy_headers = {
+        "Authorization": f"Bearer {create_access_token(test_admin.id, role=None)}",
+    }
+    response = await unauthed_client.get("/api/v1/users/admin", headers=legacy_headers)
+    assert response.status_code == 200
+
+    admin = (await db_session.execute(
+        select(Admin).where(Admin.user_id == test_admin.id)
+    )).scalar_one()
+    await db_session.delete(admin)
+    await db_session.flush()
+    response = await unauthed_client.get("/api/v1/users/admin", headers=admin_headers)
+    assert response.status_code == 200
+
+    admin_cache.clear()
+    response = await unauthed_client.get("/api/v1/users/admin", headers=admin_headers)
+    assert response.status_code == 403
+    response = await unauthed_client.get("/api/v1/users/admin", headers=legacy_headers)
+    assert response.status_code == 403
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import (
 
 from app.core.database import Base
 from app.core.dependencies import get_current_admin, get_current_user, get_db_session
+from app.core.rate_limit import rate_limiter
 from app.main import app
 from app.models.user import Admin, User
 from tests.factories.user import UserFactory
@@ -49,6 +50,12 @@ async def async_session_maker(test_engine):
     )
 
 
+@pytest.fixture(autouse=True)
+def fresh_rate_limits():
+    """Every test starts with full buckets; the suite shares one client IP."""
+    rate_limiter.reset()
+
+
 @pytest.fixture
 async def db_session(async_session_maker) -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
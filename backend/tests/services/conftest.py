@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import fnmatch
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
 from typing import Any, Sequence
 from uuid import UUID, uuid4
 
 import pytest
 from sqlalchemy import Row
 
+from app.core.database import discard_after_commit, run_after_commit
 from app.core.dependencies import PaginationParams
 from app.core.exceptions import NotFoundException
 from app.models.category import Category, RecipeCategory
+from app.models.cooking_history import CookingHistory
+from app.models.favorite import FavoriteRecipe
 from app.models.ingredient import RecipeIngredient
 from app.models.recipe import Recipe
 from app.models.user import Admin, User
+from app.repositories.recipe import build_detail_document
 from app.schemas.pagination import PaginatedResponse
+from app.services.catalog_cache import CatalogCache
+from app.services.membership import MembershipService
 
 
 class FakeRepository:
@@ -54,7 +64,7 @@ class FakeRepository:
 
     async def list(
         self, pagination: PaginationParams, *,
-        base_query: Any = None, count_query: Any = None, order_by: Any = None,
+        base_query: Any = None, order_by: Any = None,
     ) -> PaginatedResponse:
         items = list(self._store.values())
         return PaginatedResponse(
@@ -68,7 +78,16 @@ class FakeRepository:
 class FakeRecipeRepository(FakeRepository):
     def __init__(self) -> None:
         super().__init__()
-        self._user_flags: dict[tuple[UUID, UUID], tuple[bool, bool]] = {}
+        self._client_rows: list[Any] = []
+        self._documents: dict[UUID, dict[str, Any]] = {}
+        self.list_client_calls = 0
+
+    async def create(self, entity: Any) -> Any:
+        # Stand-in for the created_at/updated_at server defaults
+        now = datetime.now(timezone.utc)
+        entity.created_at = entity.created_at or now
+        entity.updated_at = entity.updated_at or now
+        return await super().create(entity)
 
     async def get_with_relations(self, recipe_id: UUID) -> Recipe | None:
         return self._store.get(recipe_id)
@@ -86,11 +105,10 @@ class FakeRecipeRepository(FakeRepository):
 
     async def list_client(
         self, limit: int, offset: int, user_id: UUID, **kwargs: Any,
-    ) -> tuple[Sequence[Row[Any]], int]:
-        return [], 0
-
-    async def get_user_flags(self, recipe_id: UUID, user_id: UUID) -> tuple[bool, bool]:
-        return self._user_flags.get((recipe_id, user_id), (False, False))
+    ) -> tuple[Sequence[Row[Any]], int | None]:
+        self.list_client_calls += 1
+        rows = self._client_rows[offset : offset + limit + 1]
+        return rows, len(self._client_rows)
 
     async def replace_categories(self, recipe_id: UUID, category_ids: list[UUID]) -> None:
         pass
@@ -98,8 +116,29 @@ class FakeRecipeRepository(FakeRepository):
     async def replace_ingredients(self, recipe_id: UUID, ingredients: list[dict]) -> None:
         pass
 
+    async def refresh_search_documents(self, recipe_ids: Any = None) -> None:
+        pass
+
+    async def refresh_detail_documents(self, recipe_ids: Sequence[UUID]) -> dict[UUID, dict[str, Any]]:
+        documents = {
+            rid: build_detail_document(self._store[rid]) for rid in recipe_ids if rid in self._store
+        }
+        self._documents.update(documents)
+        return documents
+
+    async def get_detail_documents(self, recipe_ids: Sequence[UUID]) -> dict[UUID, dict[str, Any]]:
+        return {rid: self._documents[rid] for rid in recipe_ids if rid in self._documents}
+
+
+class LinkedRecipesMixin:
+    async def linked_recipe_ids(self, entity_id: UUID) -> list[UUID]:
+        return []
+
+    async def refresh_recipe_documents(self, recipe_ids: Sequence[UUID], *, search: bool = True) -> None:
+        pass
+
 
-class FakeCategoryRepository(FakeRepository):
+class FakeCategoryRepository(LinkedRecipesMixin, FakeRepository):
     async def find_by_title_or_slug(self, title: str, slug: str) -> Category | None:
         for cat in self._store.values():
             if cat.title == title or cat.slug == slug:
@@ -122,8 +161,9 @@ class FakeCategoryRepository(FakeRepository):
 
 
 class FakeUserRepository(FakeRepository):
-    def __init__(self) -> None:
+    def __init__(self, db: FakeSession) -> None:
         super().__init__()
+        self.db = db
         self._admins: dict[str, Admin] = {}
         self._admins_by_user_id: dict[UUID, Admin] = {}
         self._by_tg_id: dict[int, User] = {}
@@ -163,7 +203,7 @@ class FakeUserRepository(FakeRepository):
         self._admins_by_user_id[admin.user_id] = admin
 
 
-class FakeIngredientRepository(FakeRepository):
+class FakeIngredientRepository(LinkedRecipesMixin, FakeRepository):
     async def find_by_title_or_slug(self, title: str, slug: str) -> Any | None:
         for item in self._store.values():
             if item.title == title or item.slug == slug:
@@ -183,6 +223,10 @@ class FakeIngredientRepository(FakeRepository):
 
 
 class FakeStepRepository(FakeRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.refreshed_recipe_ids: list[set[UUID]] = []
+
     async def list_admin(
         self, pagination: PaginationParams, **kwargs: Any,
     ) -> PaginatedResponse:
@@ -194,6 +238,9 @@ class FakeStepRepository(FakeRepository):
             offset=pagination.offset,
         )
 
+    async def refresh_recipe_documents(self, recipe_ids: Any) -> None:
+        self.refreshed_recipe_ids.append(set(recipe_ids))
+
 
 class FakeImageRepository(FakeRepository):
     pass
@@ -206,31 +253,223 @@ class FakeFavoriteRepository(FakeRepository):
                 return item
         return None
 
+    async def is_virtual_favorite(self, user_id: UUID, recipe_id: UUID) -> bool:
+        return False
+
+    async def add(self, user_id: UUID, recipe_ids: list[UUID]) -> list[UUID]:
+        added = []
+        for recipe_id in dict.fromkeys(recipe_ids):
+            if await self.find(user_id, recipe_id) is None:
+                await self.create(FavoriteRecipe(user_id=user_id, recipe_id=recipe_id))
+                added.append(recipe_id)
+        return added
+
+    async def remove(self, user_id: UUID, recipe_ids: list[UUID]) -> list[UUID]:
+        removed = []
+        for recipe_id in dict.fromkeys(recipe_ids):
+            favorite = await self.find(user_id, recipe_id)
+            if favorite is not None:
+                await self.delete(favorite)
+                removed.append(recipe_id)
+        return removed
+
     async def list_by_user(self, user_id: UUID) -> list:
         return [item for item in self._store.values() if item.user_id == user_id]
 
+    async def recipe_ids_by_user(self, user_id: UUID) -> set[UUID]:
+        return {item.recipe_id for item in self._store.values() if item.user_id == user_id}
+
 
 class FakeCookingHistoryRepository(FakeRepository):
+    async def record(
+        self, user_id: UUID, recipe_id: UUID, cooked_at: datetime | None = None,
+    ) -> CookingHistory | None:
+        cooked_at = cooked_at or datetime.now(timezone.utc)
+        if any(
+            item.user_id == user_id and item.cooked_at.date() == cooked_at.date()
+            for item in self._store.values()
+        ):
+            return None
+        return await self.create(
+            CookingHistory(id=uuid4(), user_id=user_id, recipe_id=recipe_id, cooked_at=cooked_at)
+        )
+
     async def list_by_user(self, user_id: UUID) -> list:
         return [item for item in self._store.values() if item.user_id == user_id]
 
+    async def recipe_ids_by_user(self, user_id: UUID) -> set[UUID]:
+        return {item.recipe_id for item in self._store.values() if item.user_id == user_id}
+
+
+class FakeCookingStatsRepository:
+    """Keeps the rollups as plain dicts; today is pinned so streaks are deterministic."""
+
+    def __init__(self, today: date) -> None:
+        self.today_value = today
+        self.applied: list[CookingHistory] = []
+        self.daily: dict[tuple[UUID, date], int] = {}
+        self.retracted: list[dict[str, UUID | None]] = []
+        self.recounted: list[tuple[str, UUID]] = []
+
+    async def apply(self, history: CookingHistory) -> None:
+        self.applied.append(history)
+        key = (history.user_id, history.cooked_at.date())
+        self.daily[key] = self.daily.get(key, 0) + 1
+
+    async def retract(self, *, recipe_id: UUID | None = None, user_id: UUID | None = None) -> int:
+        self.retracted.append({"recipe_id": recipe_id, "user_id": user_id})
+        return 0
+
+    async def uncount_categories(self, recipe_id: UUID) -> None:
+        self.recounted.append(("uncount", recipe_id))
+
+    async def count_categories(self, recipe_id: UUID) -> None:
+        self.recounted.append(("count", recipe_id))
+
+    async def today(self, user_id: UUID) -> date:
+        return self.today_value
+
+    async def list_days(self, user_id: UUID, since: date) -> list[Any]:
+        return [
+            SimpleNamespace(day=day, dishes=dishes)
+            for (owner, day), dishes in sorted(self.daily.items())
+            if owner == user_id and day >= since
+        ]
+
+    async def list_weeks(self, user_id: UUID, since: date) -> list[Any]:
+        return []
+
+    async def list_streaks(self, user_id: UUID) -> list[Any]:
+        streaks: list[SimpleNamespace] = []
+        for day in sorted(day for owner, day in self.daily if owner == user_id):
+            if streaks and streaks[-1].last_day == day - timedelta(days=1):
+                streaks[-1].days += 1
+                streaks[-1].dishes += self.daily[(user_id, day)]
+                streaks[-1].last_day = day
+            else:
+                dishes = self.daily[(user_id, day)]
+                streaks.append(SimpleNamespace(days=1, dishes=dishes, last_day=day))
+        return streaks
+
+    async def list_top_categories(self, user_id: UUID, limit: int) -> list[Any]:
+        return []
+
+    async def list_activity(self, since: date) -> list[Any]:
+        return []
+
+
+class FakeSession:
+    """Stands in for the request's AsyncSession: only holds the after_commit callbacks."""
+
+    def __init__(self) -> None:
+        self.info: dict[str, Any] = {}
+
+    async def commit(self) -> None:
+        await run_after_commit(self)  # type: ignore[arg-type]
+
+    async def rollback(self) -> None:
+        discard_after_commit(self)  # type: ignore[arg-type]
+
+
+class FakePipeline:
+    """Queues FakeRedis calls and runs them on execute(), like redis.asyncio pipelines."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._calls: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self._calls.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any) -> FakePipeline:
+            self._calls.append((name, args))
+            return self
+        return queue
+
+    async def execute(self) -> list[Any]:
+        calls, self._calls = self._calls, []
+        return [await getattr(self._redis, name)(*args) for name, args in calls]
+
 
 class FakeRedis:
-    """Minimal Redis stub for auth service tests."""
+    """Minimal Redis stub for auth and membership service tests."""
 
     def __init__(self) -> None:
         self._store: dict[str, tuple[str, int | None]] = {}
+        self._sets: dict[str, set[str]] = {}
+        self.published: list[tuple[str, str]] = []
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def sadd(self, key: str, *members: str) -> int:
+        target = self._sets.setdefault(key, set())
+        before = len(target)
+        target.update(members)
+        return len(target) - before
+
+    async def srem(self, key: str, *members: str) -> int:
+        target = self._sets.get(key, set())
+        before = len(target)
+        target.difference_update(members)
+        return before - len(target)
+
+    async def smismember(self, key: str, members: list[str]) -> list[int]:
+        target = self._sets.get(key, set())
+        return [1 if member in target else 0 for member in members]
+
+    async def incr(self, key: str) -> int:
+        value = int(self._store.get(key, ("0", None))[0]) + 1
+        self._store[key] = (str(value), None)
+        return value
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        return key in self._store or key in self._sets
+
+    async def delete(self, *keys: str) -> int:
+        return sum(
+            (self._store.pop(key, None) is not None) + (self._sets.pop(key, None) is not None)
+            for key in keys
+        )
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool | None:
+        if nx and key in self._store:
+            return None
+        self._store[key] = (value, ex)
+        return True
 
     async def setex(self, key: str, ttl: int, value: str) -> None:
         self._store[key] = (value, ttl)
 
     async def exists(self, key: str) -> int:
-        return 1 if key in self._store else 0
+        return 1 if key in self._store or key in self._sets else 0
+
+    async def ttl(self, key: str) -> int:
+        pair = self._store.get(key)
+        if pair is None:
+            return -2
+        return -1 if pair[1] is None else pair[1]
+
+    async def scan_iter(self, match: str, count: int | None = None) -> AsyncIterator[str]:
+        for key in list(self._store):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
 
     async def get(self, key: str) -> str | None:
         pair = self._store.get(key)
         return pair[0] if pair else None
 
+    async def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        return 0
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [await self.get(key) for key in keys]
+
 
 @pytest.fixture
 def fake_recipe_repo() -> FakeRecipeRepository:
@@ -243,8 +482,8 @@ def fake_category_repo() -> FakeCategoryRepository:
 
 
 @pytest.fixture
-def fake_user_repo() -> FakeUserRepository:
-    return FakeUserRepository()
+def fake_user_repo(fake_session: FakeSession) -> FakeUserRepository:
+    return FakeUserRepository(fake_session)
 
 
 @pytest.fixture
@@ -272,6 +511,33 @@ def fake_cooking_history_repo() -> FakeCookingHistoryRepository:
     return FakeCookingHistoryRepository()
 
 
+@pytest.fixture
+def fake_cooking_stats_repo() -> FakeCookingStatsRepository:
+    return FakeCookingStatsRepository(today=date(2026, 3, 10))
+
+
 @pytest.fixture
 def fake_redis() -> FakeRedis:
     return FakeRedis()
+
+
+@pytest.fixture
+def fake_session() -> FakeSession:
+    return FakeSession()
+
+
+@pytest.fixture
+def membership(
+    fake_redis: FakeRedis,
+    fake_session: FakeSession,
+    fake_favorite_repo: FakeFavoriteRepository,
+    fake_cooking_history_repo: FakeCookingHistoryRepository,
+) -> MembershipService:
+    return MembershipService(  # type: ignore[arg-type]
+        fake_redis, fake_session, fake_favorite_repo, fake_cooking_history_repo,
+    )
+
+
+@pytest.fixture
+def catalog_cache(fake_redis: FakeRedis, fake_session: FakeSession) -> CatalogCache:
+    return CatalogCache(fake_redis, fake_session)  # type: ignore[arg-type]
@@ -0,0 +1,52 @@
+"""Unit tests for the per-worker admin set and its pub/sub invalidation."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.core import events
+from app.services import admin_cache as admin_cache_module
+from app.services.admin_cache import ADMIN_CACHE_CHANNEL, AdminCache, invalidate_admins
+from tests.services.conftest import FakeRedis
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> AdminCache:
+    cache = AdminCache(ttl=10)
+    monkeypatch.setattr(admin_cache_module, "admin_cache", cache)
+    return cache
+
+
+class TestAdminCache:
+    def test_set_expires_after_ttl(
+        self, cache: AdminCache, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr(admin_cache_module.time, "monotonic", lambda: clock[0])
+        user_id = uuid4()
+        cache.put([user_id], cache.version)
+        assert cache.get() == {user_id}
+        clock[0] += 11
+        assert cache.get() is None
+
+    def test_load_racing_an_invalidation_is_not_stored(self, cache: AdminCache) -> None:
+        user_id = uuid4()
+        version = cache.version
+        cache.clear()
+        assert cache.put([user_id], version) == {user_id}
+        assert cache.get() is None
+
+
+class TestInvalidation:
+    async def test_invalidate_clears_locally_and_broadcasts(
+        self, cache: AdminCache, fake_redis: FakeRedis,
+    ) -> None:
+        cache.put([uuid4()], cache.version)
+        await invalidate_admins(fake_redis)  # type: ignore[arg-type]
+        assert cache.get() is None
+        assert fake_redis.published == [(ADMIN_CACHE_CHANNEL, "")]
+
+    def test_message_from_another_worker_clears_set(self, cache: AdminCache) -> None:
+        cache.put([uuid4()], cache.version)
+        events.dispatch(ADMIN_CACHE_CHANNEL, "")
+        assert cache.get() is None
@@ -6,7 +6,7 @@ import bcrypt
 import pytest
 
 from app.core.exceptions import UnauthorizedException
-from app.core.security import create_access_token, create_refresh_token
+from app.core.security import create_access_token, create_refresh_token, decode_claims
 from app.models.user import Admin, User
 from app.services.auth import AuthService
 from tests.services.conftest import FakeRedis, FakeUserRepository
@@ -46,8 +46,8 @@ class TestAuthenticateAdmin:
 
         result = await service.authenticate_admin(admin.username, "secret123")
         assert result.user_id == user.id
-        assert result.access_token
-        assert result.refresh_token
+        assert decode_claims(result.access_token)["role"] == "admin"
+        assert decode_claims(result.refresh_token, expected_type="refresh")["role"] == "admin"
 
     async def test_wrong_password_raises(
         self, service: AuthService, fake_user_repo: FakeUserRepository,
@@ -93,6 +93,31 @@ class TestRefreshTokens:
         with pytest.raises(UnauthorizedException):
             await service.refresh_tokens(refresh)
 
+    async def test_refresh_keeps_admin_role_only_while_admin(
+        self, service: AuthService, fake_user_repo: FakeUserRepository,
+    ) -> None:
+        user = _make_user()
+        await fake_user_repo.create(user)
+        fake_user_repo.add_admin(_make_admin(user, "secret123"))
+        refresh = create_refresh_token(user.id, role="admin")
+
+        result = await service.refresh_tokens(refresh)
+        assert decode_claims(result.access_token)["role"] == "admin"
+
+        fake_user_repo._admins_by_user_id.clear()
+        result = await service.refresh_tokens(refresh)
+        assert decode_claims(result.access_token)["role"] == "user"
+
+    async def test_refresh_of_token_without_role_claim_issues_none(
+        self, service: AuthService, fake_user_repo: FakeUserRepository,
+    ) -> None:
+        user = _make_user()
+        await fake_user_repo.create(user)
+        refresh = create_refresh_token(user.id, role=None)
+
+        result = await service.refresh_tokens(refresh)
+        assert "role" not in decode_claims(result.access_token)
+
 
 class TestLogout:
     async def test_logout_without_token(self, service: AuthService) -> None:
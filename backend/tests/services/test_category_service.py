@@ -8,13 +8,14 @@ from app.core.dependencies import PaginationParams
 from app.core.exceptions import ConflictException, NotFoundException
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate
+from app.services.catalog_cache import CatalogCache
 from app.services.category import CategoryService
 from tests.services.conftest import FakeCategoryRepository
 
 
 @pytest.fixture
-def service(fake_category_repo: FakeCategoryRepository) -> CategoryService:
-    return CategoryService(fake_category_repo)  # type: ignore[arg-type]
+def service(fake_category_repo: FakeCategoryRepository, catalog_cache: CatalogCache) -> CategoryService:
+    return CategoryService(fake_category_repo, catalog_cache)  # type: ignore[arg-type]
 
 
 @pytest.fixture
@@ -4,15 +4,23 @@ from uuid import uuid4
 
 import pytest
 
+from app.core.exceptions import ConflictException
 from app.models.cooking_history import CookingHistory
 from app.schemas.cooking_history import CookingHistoryCreate
 from app.services.cooking_history import CookingHistoryService
-from tests.services.conftest import FakeCookingHistoryRepository
+from app.services.cooking_stats import CookingStatsService
+from app.services.membership import MembershipService
+from tests.services.conftest import FakeCookingHistoryRepository, FakeCookingStatsRepository
 
 
 @pytest.fixture
-def service(fake_cooking_history_repo: FakeCookingHistoryRepository) -> CookingHistoryService:
-    return CookingHistoryService(fake_cooking_history_repo)  # type: ignore[arg-type]
+def service(
+    fake_cooking_history_repo: FakeCookingHistoryRepository,
+    fake_cooking_stats_repo: FakeCookingStatsRepository,
+    membership: MembershipService,
+) -> CookingHistoryService:
+    stats = CookingStatsService(fake_cooking_stats_repo)  # type: ignore[arg-type]
+    return CookingHistoryService(fake_cooking_history_repo, membership, stats)  # type: ignore[arg-type]
 
 
 class TestRecord:
@@ -28,6 +36,16 @@ class TestRecord:
         result = await service.record(user_id, CookingHistoryCreate(recipe_id=uuid4()))
         assert result.user_id == user_id
 
+    async def test_second_record_same_day_conflicts(
+        self, service: CookingHistoryService, fake_cooking_stats_repo: FakeCookingStatsRepository,
+    ) -> None:
+        user_id = uuid4()
+        first = await service.record(user_id, CookingHistoryCreate(recipe_id=uuid4()))
+        with pytest.raises(ConflictException):
+            await service.record(user_id, CookingHistoryCreate(recipe_id=uuid4()))
+        # Only the record that was written is counted into the rollups
+        assert fake_cooking_stats_repo.applied == [first]
+
 
 class TestListByUser:
     async def test_returns_only_user_records(
@@ -0,0 +1,56 @@
+"""Unit tests for CookingStatsService with an in-memory fake rollup repository."""
+
+from datetime import date, datetime, time, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.models.cooking_history import CookingHistory
+from app.services.cooking_stats import CookingStatsService
+from tests.services.conftest import FakeCookingStatsRepository
+
+
+@pytest.fixture
+def service(fake_cooking_stats_repo: FakeCookingStatsRepository) -> CookingStatsService:
+    return CookingStatsService(fake_cooking_stats_repo)  # type: ignore[arg-type]
+
+
+async def _cook_on(service: CookingStatsService, user_id, *days: date) -> None:
+    for day in days:
+        cooked_at = datetime.combine(day, time(12), tzinfo=timezone.utc)
+        history = CookingHistory(user_id=user_id, recipe_id=uuid4(), cooked_at=cooked_at)
+        await service.record(history)
+
+
+class TestUserStats:
+    async def test_streaks_and_totals(self, service: CookingStatsService) -> None:
+        user_id = uuid4()
+        # Today is 2026-03-10: a 3-day run long ago, and a 2-day run ending yesterday
+        await _cook_on(
+            service, user_id,
+            date(2026, 2, 1), date(2026, 2, 2), date(2026, 2, 3),
+            date(2026, 3, 8), date(2026, 3, 9),
+        )
+        stats = await service.user_stats(user_id, days=7)
+        assert stats.total_dishes == 5
+        assert stats.longest_streak == 3
+        assert stats.current_streak == 2
+
+    async def test_streak_broken_before_yesterday(self, service: CookingStatsService) -> None:
+        user_id = uuid4()
+        await _cook_on(service, user_id, date(2026, 3, 7), date(2026, 3, 8))
+        stats = await service.user_stats(user_id, days=7)
+        assert (stats.current_streak, stats.longest_streak) == (0, 2)
+
+    async def test_daily_window_is_dense(self, service: CookingStatsService) -> None:
+        user_id = uuid4()
+        await _cook_on(service, user_id, date(2026, 3, 1), date(2026, 3, 9))
+        stats = await service.user_stats(user_id, days=3)
+        assert [(d.day, d.dishes) for d in stats.daily] == [
+            (date(2026, 3, 8), 0), (date(2026, 3, 9), 1), (date(2026, 3, 10), 0),
+        ]
+
+    async def test_empty_for_new_user(self, service: CookingStatsService) -> None:
+        stats = await service.user_stats(uuid4(), days=1)
+        assert (stats.total_dishes, stats.current_streak, stats.longest_streak) == (0, 0, 0)
+        assert [d.dishes for d in stats.daily] == [0]
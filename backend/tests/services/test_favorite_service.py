@@ -4,34 +4,51 @@ from uuid import uuid4
 
 import pytest
 
-from app.core.exceptions import ConflictException, NotFoundException
+from app.core.exceptions import NotFoundException
 from app.models.favorite import FavoriteRecipe
 from app.services.favorite import FavoriteService
+from app.services.membership import MembershipService
 from tests.services.conftest import FakeFavoriteRepository
 
 
 @pytest.fixture
-def service(fake_favorite_repo: FakeFavoriteRepository) -> FavoriteService:
-    return FavoriteService(fake_favorite_repo)  # type: ignore[arg-type]
+def service(fake_favorite_repo: FakeFavoriteRepository, membership: MembershipService) -> FavoriteService:
+    return FavoriteService(fake_favorite_repo, membership)  # type: ignore[arg-type]
 
 
 class TestAdd:
-    async def test_add_success(self, service: FavoriteService) -> None:
+    async def test_add_success(
+        self, service: FavoriteService, fake_favorite_repo: FakeFavoriteRepository,
+    ) -> None:
         user_id = uuid4()
         recipe_id = uuid4()
-        result = await service.add(user_id, recipe_id)
-        assert result.user_id == user_id
-        assert result.recipe_id == recipe_id
+        assert await service.add(user_id, recipe_id) is True
+        result = await fake_favorite_repo.find(user_id, recipe_id)
+        assert result is not None
 
-    async def test_add_duplicate_raises_conflict(
+    async def test_add_duplicate_is_idempotent(
         self, service: FavoriteService, fake_favorite_repo: FakeFavoriteRepository,
     ) -> None:
         user_id = uuid4()
         recipe_id = uuid4()
         fav = FavoriteRecipe(id=uuid4(), user_id=user_id, recipe_id=recipe_id)
         await fake_favorite_repo.create(fav)
-        with pytest.raises(ConflictException):
-            await service.add(user_id, recipe_id)
+        assert await service.add(user_id, recipe_id) is False
+        assert len(await fake_favorite_repo.list_by_user(user_id)) == 1
+
+
+class TestBulk:
+    async def test_add_and_remove_many(
+        self, service: FavoriteService, fake_favorite_repo: FakeFavoriteRepository,
+    ) -> None:
+        user_id = uuid4()
+        existing, new = uuid4(), uuid4()
+        await fake_favorite_repo.create(FavoriteRecipe(id=uuid4(), user_id=user_id, recipe_id=existing))
+
+        assert await service.add_many(user_id, [existing, new, new]) == [new]
+        assert await service.remove_many(user_id, [existing, uuid4()]) == [existing]
+        assert await service.is_favorite(user_id, new)
+        assert not await service.is_favorite(user_id, existing)
 
 
 class TestRemove:
@@ -0,0 +1,44 @@
+"""Unit tests for the featured sync worker lock."""
+
+import asyncio
+
+import pytest
+
+from app.services.featured_sync import FEATURED_SYNC_LOCK_KEY, FeaturedSyncService
+from tests.services.conftest import FakeRedis
+
+
+@pytest.fixture
+def service(fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch) -> FeaturedSyncService:
+    monkeypatch.setattr("app.services.featured_sync.FEATURED_SYNC_LOCK_TTL", 0.2)
+    monkeypatch.setattr("app.services.featured_sync.FEATURED_SYNC_LOCK_RETRY", 0.01)
+    return FeaturedSyncService(None, fake_redis)  # type: ignore[arg-type]
+
+
+class TestWaitForLock:
+    async def test_free_lock_is_taken(self, service: FeaturedSyncService, fake_redis: FakeRedis) -> None:
+        token = await service._wait_for_lock()
+        assert token is not None
+        assert await fake_redis.get(FEATURED_SYNC_LOCK_KEY) == token
+
+    async def test_waits_out_lock_of_dead_worker(
+        self, service: FeaturedSyncService, fake_redis: FakeRedis,
+    ) -> None:
+        await fake_redis.set(FEATURED_SYNC_LOCK_KEY, "dead-worker", ex=60)
+
+        async def expire() -> None:
+            await asyncio.sleep(0.05)
+            await fake_redis.delete(FEATURED_SYNC_LOCK_KEY)
+
+        expiry = asyncio.create_task(expire())
+        token = await service._wait_for_lock()
+        await expiry
+        assert token is not None
+        assert await fake_redis.get(FEATURED_SYNC_LOCK_KEY) == token
+
+    async def test_gives_up_on_lock_held_past_ttl(
+        self, service: FeaturedSyncService, fake_redis: FakeRedis,
+    ) -> None:
+        await fake_redis.set(FEATURED_SYNC_LOCK_KEY, "live-worker", ex=60)
+        assert await service._wait_for_lock() is None
+        assert await fake_redis.get(FEATURED_SYNC_LOCK_KEY) == "live-worker"
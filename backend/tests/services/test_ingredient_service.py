@@ -8,13 +8,14 @@ from app.core.dependencies import PaginationParams
 from app.core.exceptions import ConflictException, NotFoundException
 from app.models.ingredient import Ingredient
 from app.schemas.ingredient import IngredientCreate, IngredientUpdate
+from app.services.catalog_cache import CatalogCache
 from app.services.ingredient import IngredientService
 from tests.services.conftest import FakeIngredientRepository
 
 
 @pytest.fixture
-def service(fake_ingredient_repo: FakeIngredientRepository) -> IngredientService:
-    return IngredientService(fake_ingredient_repo)  # type: ignore[arg-type]
+def service(fake_ingredient_repo: FakeIngredientRepository, catalog_cache: CatalogCache) -> IngredientService:
+    return IngredientService(fake_ingredient_repo, catalog_cache)  # type: ignore[arg-type]
 
 
 def _make_ingredient(title: str = "Salt", slug: str = "salt") -> Ingredient:
@@ -0,0 +1,117 @@
+"""Unit tests for MembershipService with in-memory fakes."""
+
+from uuid import uuid4
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.models.cooking_history import CookingHistory
+from app.models.favorite import FavoriteRecipe
+from app.services.membership import FAVORITES, HISTORY, MembershipService
+from tests.services.conftest import (
+    FakeCookingHistoryRepository,
+    FakeFavoriteRepository,
+    FakeRedis,
+    FakeSession,
+)
+
+
+class TestFlags:
+    async def test_cold_sets_load_from_repositories(
+        self, membership: MembershipService,
+        fake_favorite_repo: FakeFavoriteRepository,
+        fake_cooking_history_repo: FakeCookingHistoryRepository,
+    ) -> None:
+        user_id, favorite, cooked, other = uuid4(), uuid4(), uuid4(), uuid4()
+        await fake_favorite_repo.create(FavoriteRecipe(id=uuid4(), user_id=user_id, recipe_id=favorite))
+        await fake_cooking_history_repo.create(CookingHistory(id=uuid4(), user_id=user_id, recipe_id=cooked))
+
+        flags = await membership.flags(user_id, [favorite, cooked, other])
+        assert flags == {favorite: (True, False), cooked: (False, True), other: (False, False)}
+
+    async def test_warm_sets_are_not_reloaded(
+        self, membership: MembershipService, fake_favorite_repo: FakeFavoriteRepository,
+    ) -> None:
+        user_id, recipe_id = uuid4(), uuid4()
+        await membership.flags(user_id, [recipe_id])
+        # Written straight to the table, bypassing the service: the cached set wins
+        await fake_favorite_repo.create(FavoriteRecipe(id=uuid4(), user_id=user_id, recipe_id=recipe_id))
+
+        assert (await membership.flags(user_id, [recipe_id]))[recipe_id] == (False, False)
+
+    async def test_invalidate_takes_effect_on_commit(
+        self, membership: MembershipService, fake_session: FakeSession,
+        fake_favorite_repo: FakeFavoriteRepository,
+    ) -> None:
+        user_id, recipe_id = uuid4(), uuid4()
+        await membership.flags(user_id, [recipe_id])
+        await fake_favorite_repo.create(FavoriteRecipe(id=uuid4(), user_id=user_id, recipe_id=recipe_id))
+
+        membership.invalidate(FAVORITES, [user_id])
+        assert (await membership.flags(user_id, [recipe_id]))[recipe_id] == (False, False)
+
+        await fake_session.commit()
+        assert (await membership.flags(user_id, [recipe_id]))[recipe_id] == (True, False)
+
+    async def test_rollback_drops_invalidation(
+        self, membership: MembershipService, fake_session: FakeSession, fake_redis: FakeRedis,
+    ) -> None:
+        user_id, recipe_id = uuid4(), uuid4()
+        await membership.flags(user_id, [recipe_id])
+        sets = dict(fake_redis._sets)
+
+        membership.invalidate(HISTORY, [user_id])
+        await fake_session.rollback()
+        await fake_session.commit()
+        assert fake_redis._sets == sets
+
+    async def test_reload_racing_a_commit_is_not_served(
+        self, membership: MembershipService, fake_session: FakeSession,
+        fake_favorite_repo: FakeFavoriteRepository,
+    ) -> None:
+        user_id, recipe_id = uuid4(), uuid4()
+        load = membership.loaders[FAVORITES]
+
+        async def load_then_writer_commits(uid):
+            loaded = await load(uid)
+            # Another request favorites the recipe and commits before this load is stored
+            await fake_favorite_repo.create(FavoriteRecipe(id=uuid4(), user_id=uid, recipe_id=recipe_id))
+            membership.invalidate(FAVORITES, [uid])
+            await fake_session.commit()
+            return loaded
+
+        membership.loaders[FAVORITES] = load_then_writer_commits
+        assert (await membership.flags(user_id, [recipe_id]))[recipe_id] == (False, False)
+
+        membership.loaders[FAVORITES] = load
+        assert (await membership.flags(user_id, [recipe_id]))[recipe_id] == (True, False)
+
+    async def test_invalidate_all_reloads_every_user(
+        self, membership: MembershipService, fake_session: FakeSession,
+        fake_favorite_repo: FakeFavoriteRepository,
+    ) -> None:
+        users, recipe_id = [uuid4(), uuid4()], uuid4()
+        for user_id in users:
+            await membership.flags(user_id, [recipe_id])
+            # Bulk insert that bypasses per-user write-through
+            await fake_favorite_repo.create(FavoriteRecipe(id=uuid4(), user_id=user_id, recipe_id=recipe_id))
+
+        membership.invalidate_all(FAVORITES)
+        await fake_session.commit()
+        for user_id in users:
+            assert (await membership.flags(user_id, [recipe_id]))[recipe_id] == (True, False)
+
+    async def test_falls_back_to_repositories_without_redis(
+        self, fake_redis: FakeRedis, fake_favorite_repo: FakeFavoriteRepository,
+        fake_cooking_history_repo: FakeCookingHistoryRepository,
+    ) -> None:
+        async def unavailable(*args):
+            raise RedisConnectionError("down")
+
+        fake_redis.smismember = unavailable  # type: ignore[method-assign]
+        membership = MembershipService(  # type: ignore[arg-type]
+            fake_redis, FakeSession(), fake_favorite_repo, fake_cooking_history_repo,
+        )
+        user_id, recipe_id = uuid4(), uuid4()
+        await fake_favorite_repo.create(FavoriteRecipe(id=uuid4(), user_id=user_id, recipe_id=recipe_id))
+
+        assert (await membership.flags(user_id, [recipe_id]))[recipe_id] == (True, False)
@@ -6,11 +6,20 @@ from uuid import uuid4
 import pytest
 
 from app.core.dependencies import PaginationParams
-from app.core.exceptions import NotFoundException
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.models.favorite import FavoriteRecipe
 from app.models.recipe import Recipe
 from app.schemas.recipe import RecipeCreate, RecipeUpdate
+from app.services.catalog_cache import CatalogCache, CatalogRow
+from app.services.cooking_stats import CookingStatsService
+from app.services.membership import MembershipService
 from app.services.recipe import RecipeService
-from tests.services.conftest import FakeRecipeRepository
+from tests.services.conftest import (
+    FakeCookingStatsRepository,
+    FakeFavoriteRepository,
+    FakeRecipeRepository,
+    FakeSession,
+)
 
 
 def _make_recipe(**overrides) -> Recipe:
@@ -27,8 +36,12 @@ def _make_recipe(**overrides) -> Recipe:
 
 
 @pytest.fixture
-def service(fake_recipe_repo: FakeRecipeRepository) -> RecipeService:
-    return RecipeService(fake_recipe_repo)  # type: ignore[arg-type]
+def service(
+    fake_recipe_repo: FakeRecipeRepository, membership: MembershipService, catalog_cache: CatalogCache,
+    fake_cooking_stats_repo: FakeCookingStatsRepository,
+) -> RecipeService:
+    stats = CookingStatsService(fake_cooking_stats_repo)  # type: ignore[arg-type]
+    return RecipeService(fake_recipe_repo, membership, catalog_cache, stats)  # type: ignore[arg-type]
 
 
 class TestCreate:
@@ -94,15 +107,37 @@ class TestUpdate:
         result = await service.update(recipe.id, data)
         assert result.title == "Updated Recipe"
 
+    async def test_update_categories_moves_stats(
+        self, service: RecipeService, fake_recipe_repo: FakeRecipeRepository,
+        fake_cooking_stats_repo: FakeCookingStatsRepository,
+    ) -> None:
+        recipe = _make_recipe()
+        fake_recipe_repo._store[recipe.id] = recipe
+
+        await service.update(recipe.id, RecipeUpdate(categories=[uuid4()]))
+        assert fake_cooking_stats_repo.recounted == [("uncount", recipe.id), ("count", recipe.id)]
+
+    async def test_update_without_categories_keeps_stats(
+        self, service: RecipeService, fake_recipe_repo: FakeRecipeRepository,
+        fake_cooking_stats_repo: FakeCookingStatsRepository,
+    ) -> None:
+        recipe = _make_recipe()
+        fake_recipe_repo._store[recipe.id] = recipe
+
+        await service.update(recipe.id, RecipeUpdate(title="Updated Recipe"))
+        assert fake_cooking_stats_repo.recounted == []
+
 
 class TestDelete:
     async def test_delete_existing(
         self, service: RecipeService, fake_recipe_repo: FakeRecipeRepository,
+        fake_cooking_stats_repo: FakeCookingStatsRepository,
     ) -> None:
         recipe = _make_recipe()
         fake_recipe_repo._store[recipe.id] = recipe
 
         await service.delete(recipe.id)
+        assert fake_cooking_stats_repo.retracted == [{"recipe_id": recipe.id, "user_id": None}]
         with pytest.raises(NotFoundException):
             await service.get_by_id(recipe.id)
 
@@ -114,14 +149,99 @@ class TestDelete:
 class TestGetClient:
     async def test_get_client_returns_detail(
         self, service: RecipeService, fake_recipe_repo: FakeRecipeRepository,
+        fake_favorite_repo: FakeFavoriteRepository,
     ) -> None:
         recipe = _make_recipe()
         fake_recipe_repo._store[recipe.id] = recipe
 
         user_id = uuid4()
-        fake_recipe_repo._user_flags[(recipe.id, user_id)] = (True, False)
+        await fake_favorite_repo.create(FavoriteRecipe(id=uuid4(), user_id=user_id, recipe_id=recipe.id))
 
         result = await service.get_client(recipe.id, user_id)
         assert result.id == recipe.id
         assert result.is_favorited is True
         assert result.is_in_history is False
+
+
+class TestListClient:
+    async def test_malformed_random_cursor_rejected(self, service: RecipeService) -> None:
+        pagination = PaginationParams(limit=20, offset=0, cursor="abc")
+        with pytest.raises(BadRequestException):
+            await service.list_client(pagination, uuid4(), random=True)
+
+    def test_sample_start_is_stable_per_user_and_seed(self) -> None:
+        user_id = uuid4()
+        start = RecipeService._sample_start(user_id, 42)
+        assert 0 <= start < 1
+        assert RecipeService._sample_start(user_id, 42) == start
+        assert RecipeService._sample_start(uuid4(), 42) != start
+
+    async def test_empty_page_has_no_cursor(self, service: RecipeService) -> None:
+        result = await service.list_client(PaginationParams(limit=20, offset=0), uuid4())
+        assert result.items == []
+        assert result.next_cursor is None
+
+
+class TestToggleFeatured:
+    async def test_refreshes_detail_document(
+        self, service: RecipeService, fake_recipe_repo: FakeRecipeRepository,
+    ) -> None:
+        recipe = _make_recipe()
+        fake_recipe_repo._store[recipe.id] = recipe
+
+        result = await service.toggle_featured(recipe.id)
+        assert result.is_featured is True
+        assert recipe.id in fake_recipe_repo._documents
+
+
+def _catalog_row(recipe: Recipe) -> CatalogRow:
+    return CatalogRow(
+        recipe.id, recipe.slug, recipe.title, recipe.photo_url, recipe.prep_time,
+        recipe.cook_time, recipe.difficulty, recipe.servings, recipe.created_at, 0.5,
+    )
+
+
+class TestCatalogCache:
+    async def test_page_is_shared_and_flags_are_per_user(
+        self, service: RecipeService, fake_recipe_repo: FakeRecipeRepository,
+        fake_favorite_repo: FakeFavoriteRepository,
+    ) -> None:
+        recipe = _make_recipe()
+        fake_recipe_repo._client_rows = [_catalog_row(recipe)]
+        fan, other = uuid4(), uuid4()
+        await fake_favorite_repo.create(FavoriteRecipe(id=uuid4(), user_id=fan, recipe_id=recipe.id))
+
+        pagination = PaginationParams(limit=20, offset=0)
+        fan_page = await service.list_client(pagination, fan)
+        other_page = await service.list_client(pagination, other)
+
+        assert fake_recipe_repo.list_client_calls == 1
+        assert fan_page.items[0].is_favorited is True
+        assert other_page.items[0].is_favorited is False
+        assert other_page.items[0].title == recipe.title
+
+    async def test_update_invalidates_on_commit(
+        self, service: RecipeService, fake_recipe_repo: FakeRecipeRepository,
+        fake_session: FakeSession,
+    ) -> None:
+        recipe = _make_recipe()
+        fake_recipe_repo._store[recipe.id] = recipe
+        pagination = PaginationParams(limit=20, offset=0)
+        await service.list_client(pagination, uuid4())
+
+        await service.update(recipe.id, RecipeUpdate(title="Renamed"))
+        await service.list_client(pagination, uuid4())
+        assert fake_recipe_repo.list_client_calls == 1
+
+        await fake_session.commit()
+        await service.list_client(pagination, uuid4())
+        assert fake_recipe_repo.list_client_calls == 2
+
+    async def test_user_filters_bypass_cache(
+        self, service: RecipeService, fake_recipe_repo: FakeRecipeRepository,
+    ) -> None:
+        pagination = PaginationParams(limit=20, offset=0)
+        user_id = uuid4()
+        await service.list_client(pagination, user_id, is_favorited=True)
+        await service.list_client(pagination, user_id, is_favorited=True)
+        assert fake_recipe_repo.list_client_calls == 2
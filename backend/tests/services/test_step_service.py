@@ -78,6 +78,7 @@ class TestUpdate:
         result = await service.update(step.id, StepUpdate(title="New title"))
         assert result.title == "New title"
         assert result.step_number == step.step_number
+        assert fake_step_repo.refreshed_recipe_ids == [{step.recipe_id}]
 
 
 class TestDelete:
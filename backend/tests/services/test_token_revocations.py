@@ -0,0 +1,143 @@
+"""Unit tests for the per-worker revocation set and its pub/sub sync."""
+
+import asyncio
+import time
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core import events
+from app.services import token_revocations as revocations_module
+from app.services.token_revocations import (
+    REVOCATION_CHANNEL,
+    RevocationSet,
+    is_revoked,
+    revoke,
+)
+from tests.services.conftest import FakeRedis
+
+
+class CountingRedis(FakeRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+        self.down = False
+
+    async def exists(self, key: str) -> int:
+        self.lookups += 1
+        if self.down:
+            raise RedisConnectionError("down")
+        return await super().exists(key)
+
+
+@pytest.fixture
+def revoked(monkeypatch: pytest.MonkeyPatch) -> RevocationSet:
+    revoked = RevocationSet()
+    monkeypatch.setattr(revocations_module, "revoked_tokens", revoked)
+    return revoked
+
+
+@pytest.fixture
+def redis() -> CountingRedis:
+    return CountingRedis()
+
+
+class TestSeed:
+    async def test_scan_loads_existing_entries_and_marks_ready(
+        self, revoked: RevocationSet, redis: CountingRedis,
+    ) -> None:
+        await redis.setex("bl:old", 3600, "1")
+        await redis.setex("user_cache:other", 3600, "1")
+        await revoked.seed(redis)  # type: ignore[arg-type]
+        assert revoked.ready
+        assert "old" in revoked
+        assert len(revoked) == 1
+
+    async def test_reset_during_scan_leaves_set_unready(
+        self, revoked: RevocationSet, redis: CountingRedis,
+    ) -> None:
+        scan_iter = redis.scan_iter
+
+        async def racing_scan(*args, **kwargs):
+            revoked.reset()
+            async for key in scan_iter(*args, **kwargs):
+                yield key
+
+        redis.scan_iter = racing_scan  # type: ignore[method-assign]
+        await revoked.seed(redis)  # type: ignore[arg-type]
+        assert not revoked.ready
+
+
+class TestIsRevoked:
+    async def test_asks_redis_until_seeded(
+        self, revoked: RevocationSet, redis: CountingRedis,
+    ) -> None:
+        assert not await is_revoked(redis, "jti")  # type: ignore[arg-type]
+        assert redis.lookups == 1
+
+    async def test_local_miss_skips_redis_even_when_it_is_down(
+        self, revoked: RevocationSet, redis: CountingRedis,
+    ) -> None:
+        await revoked.seed(redis)  # type: ignore[arg-type]
+        redis.down = True
+        assert not await is_revoked(redis, "jti")  # type: ignore[arg-type]
+        assert redis.lookups == 0
+
+    async def test_local_hit_is_confirmed_by_redis(
+        self, revoked: RevocationSet, redis: CountingRedis,
+    ) -> None:
+        await revoked.seed(redis)  # type: ignore[arg-type]
+        await revoke(redis, "jti", time.time() + 3600)  # type: ignore[arg-type]
+        assert await is_revoked(redis, "jti")  # type: ignore[arg-type]
+        assert redis.lookups == 1
+
+        redis.down = True
+        assert await is_revoked(redis, "jti")  # type: ignore[arg-type]
+
+
+class FailingPubSub:
+    async def subscribe(self, *channels: str) -> None:
+        raise RedisConnectionError("connection reset")
+
+    async def aclose(self) -> None:
+        pass
+
+
+class TestSync:
+    async def test_listener_disconnect_falls_back_to_redis(
+        self, revoked: RevocationSet, redis: CountingRedis, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        await revoked.seed(redis)  # type: ignore[arg-type]
+        await redis.setex("bl:jti", 3600, "1")  # revoked by a worker whose message was lost
+        redis.pubsub = lambda **kwargs: FailingPubSub()  # type: ignore[attr-defined]
+        monkeypatch.setattr(events, "LISTENER_RETRY_SECONDS", 3600)
+
+        listener = asyncio.create_task(events._listen(redis))  # type: ignore[arg-type]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        listener.cancel()
+        assert not revoked.ready
+
+        assert await is_revoked(redis, "jti")  # type: ignore[arg-type]
+        assert redis.lookups == 1
+
+    async def test_revoke_broadcasts_to_other_workers(
+        self, revoked: RevocationSet, redis: CountingRedis,
+    ) -> None:
+        expires_at = time.time() + 3600
+        await revoke(redis, "jti", expires_at)  # type: ignore[arg-type]
+        assert await redis.exists("bl:jti") == 1
+        assert redis.published == [(REVOCATION_CHANNEL, f"jti {expires_at}")]
+
+    def test_message_from_another_worker_adds_entry(self, revoked: RevocationSet) -> None:
+        events.dispatch(REVOCATION_CHANNEL, f"jti {time.time() + 3600}")
+        assert "jti" in revoked
+
+    def test_expired_entries_are_pruned(
+        self, revoked: RevocationSet, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        revoked.add("gone", time.time() - 1)
+        assert "gone" not in revoked
+        monkeypatch.setattr(revocations_module, "REVOCATION_PRUNE_INTERVAL", 0)
+        revoked.add("kept", time.time() + 3600)
+        assert len(revoked) == 1
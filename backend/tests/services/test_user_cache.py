@@ -0,0 +1,72 @@
+"""Unit tests for the per-worker user cache and its pub/sub invalidation."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.core import events
+from app.services import user_cache as user_cache_module
+from app.services.user_cache import USER_CACHE_CHANNEL, UserCache, UserPrincipal, invalidate_user
+from tests.services.conftest import FakeRedis
+
+
+def _principal() -> UserPrincipal:
+    now = datetime.now(timezone.utc)
+    return UserPrincipal(
+        id=uuid4(), tg_id=1, tg_username=None, username=None, phone_number=None,
+        first_name=None, last_name=None, timezone="Europe/Moscow", created_at=now, updated_at=now,
+    )
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> UserCache:
+    cache = UserCache(ttl=60, max_size=2)
+    monkeypatch.setattr(user_cache_module, "user_cache", cache)
+    return cache
+
+
+class TestUserCache:
+    def test_entries_expire_after_ttl(
+        self, cache: UserCache, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr(user_cache_module.time, "monotonic", lambda: clock[0])
+        principal = _principal()
+        cache.put(principal, cache.version)
+        assert cache.get(principal.id) is principal
+        clock[0] += 61
+        assert cache.get(principal.id) is None
+
+    def test_least_recently_used_is_evicted(self, cache: UserCache) -> None:
+        first, second, third = _principal(), _principal(), _principal()
+        cache.put(first, cache.version)
+        cache.put(second, cache.version)
+        cache.get(first.id)
+        cache.put(third, cache.version)
+        assert cache.get(second.id) is None
+        assert cache.get(first.id) is first
+
+    def test_load_racing_an_invalidation_is_not_stored(self, cache: UserCache) -> None:
+        principal = _principal()
+        version = cache.version
+        cache.discard(uuid4())
+        cache.put(principal, version)
+        assert cache.get(principal.id) is None
+
+
+class TestInvalidation:
+    async def test_invalidate_drops_locally_and_broadcasts(
+        self, cache: UserCache, fake_redis: FakeRedis,
+    ) -> None:
+        principal = _principal()
+        cache.put(principal, cache.version)
+        await invalidate_user(fake_redis, principal.id)  # type: ignore[arg-type]
+        assert cache.get(principal.id) is None
+        assert fake_redis.published == [(USER_CACHE_CHANNEL, str(principal.id))]
+
+    def test_message_from_another_worker_drops_entry(self, cache: UserCache) -> None:
+        principal = _principal()
+        cache.put(principal, cache.version)
+        events.dispatch(USER_CACHE_CHANNEL, str(principal.id))
+        assert cache.get(principal.id) is None
@@ -6,15 +6,27 @@ import pytest
 
 from app.core.dependencies import PaginationParams
 from app.core.exceptions import ConflictException, NotFoundException
-from app.models.user import User
+from app.models.user import Admin, User
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.admin_cache import ADMIN_CACHE_CHANNEL
+from app.services.cooking_stats import CookingStatsService
 from app.services.user import UserService
-from tests.services.conftest import FakeUserRepository
+from app.services.user_cache import USER_CACHE_CHANNEL
+from tests.services.conftest import (
+    FakeCookingStatsRepository,
+    FakeRedis,
+    FakeSession,
+    FakeUserRepository,
+)
 
 
 @pytest.fixture
-def service(fake_user_repo: FakeUserRepository) -> UserService:
-    return UserService(fake_user_repo)  # type: ignore[arg-type]
+def service(
+    fake_user_repo: FakeUserRepository, fake_redis: FakeRedis,
+    fake_cooking_stats_repo: FakeCookingStatsRepository,
+) -> UserService:
+    stats = CookingStatsService(fake_cooking_stats_repo)  # type: ignore[arg-type]
+    return UserService(fake_user_repo, fake_redis, stats)  # type: ignore[arg-type]
 
 
 def _make_user(tg_id: int = 123456) -> User:
@@ -84,17 +96,55 @@ class TestUpdate:
         result = await service.update(user.id, UserUpdate(username="newname"))
         assert result.username == "newname"
 
+    async def test_update_broadcasts_cache_invalidation_after_commit(
+        self, service: UserService, fake_user_repo: FakeUserRepository, fake_redis: FakeRedis,
+        fake_session: FakeSession,
+    ) -> None:
+        user = _make_user()
+        await fake_user_repo.create(user)
+        await service.update(user.id, UserUpdate(first_name="Ann"))
+        assert fake_redis.published == []
+        await fake_session.commit()
+        assert fake_redis.published == [(USER_CACHE_CHANNEL, str(user.id))]
+
+    async def test_rolled_back_update_broadcasts_nothing(
+        self, service: UserService, fake_user_repo: FakeUserRepository, fake_redis: FakeRedis,
+        fake_session: FakeSession,
+    ) -> None:
+        user = _make_user()
+        await fake_user_repo.create(user)
+        await service.update(user.id, UserUpdate(first_name="Ann"))
+        await fake_session.rollback()
+        await fake_session.commit()
+        assert fake_redis.published == []
+
 
 class TestDelete:
     async def test_delete_existing(
         self, service: UserService, fake_user_repo: FakeUserRepository,
+        fake_cooking_stats_repo: FakeCookingStatsRepository,
     ) -> None:
         user = _make_user()
         await fake_user_repo.create(user)
         await service.delete(user.id)
+        assert fake_cooking_stats_repo.retracted == [{"recipe_id": None, "user_id": user.id}]
         with pytest.raises(NotFoundException):
             await service.get_by_id(user.id)
 
+    async def test_delete_admin_reloads_admin_set_after_commit(
+        self, service: UserService, fake_user_repo: FakeUserRepository, fake_redis: FakeRedis,
+        fake_session: FakeSession,
+    ) -> None:
+        user = _make_user()
+        await fake_user_repo.create(user)
+        fake_user_repo.add_admin(Admin(id=uuid4(), user_id=user.id, username="admin"))
+        await service.delete(user.id)
+        assert fake_redis.published == []
+        await fake_session.commit()
+        assert fake_redis.published == [
+            (USER_CACHE_CHANNEL, str(user.id)), (ADMIN_CACHE_CHANNEL, ""),
+        ]
+
     async def test_delete_nonexistent_raises(self, service: UserService) -> None:
         with pytest.raises(NotFoundException):
             await service.delete(uuid4())
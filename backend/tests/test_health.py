@@ -8,3 +8,4 @@ async def test_health_returns_ok(client: AsyncClient):
     assert response.status_code == 200
     data = response.json()
     assert data["app"] == "ok"
+    assert data["password_pool"]["rejected"] == 0
@@ -0,0 +1,23 @@
+"""Tests for application startup and shutdown."""
+
+import pytest
+
+from app import main
+from app.services.featured_sync import FeaturedSyncService
+
+
+async def test_startup_survives_failed_featured_sync_resume(monkeypatch: pytest.MonkeyPatch):
+    started = []
+
+    async def no_admin() -> None:
+        pass
+
+    async def broken_resume(self: FeaturedSyncService) -> None:
+        raise ConnectionError("database unavailable")
+
+    monkeypatch.setattr(main, "_seed_admin", no_admin)
+    monkeypatch.setattr(FeaturedSyncService, "resume", broken_resume)
+    monkeypatch.setattr(main, "start_event_listener", started.append)
+
+    async with main.lifespan(main.app):
+        assert len(started) == 1
@@ -0,0 +1,43 @@
+"""Tests for the bounded bcrypt thread pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.exceptions import TooManyRequestsException
+from app.core.passwords import PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(workers=1, max_queue=1)
+    yield hasher
+    hasher.shutdown()
+
+
+async def test_hash_and_check_run_in_pool(hasher: PasswordHasher):
+    hashed = await hasher.hash("secret123")
+    assert await hasher.check("secret123", hashed)
+    assert not await hasher.check("wrong", hashed)
+
+    stats = hasher.stats.snapshot()
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0
+    assert stats["max_wait"] >= stats["avg_wait"] >= 0
+
+
+async def test_full_queue_fails_fast_with_429(hasher: PasswordHasher):
+    release = threading.Event()
+    running = [asyncio.create_task(hasher._run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(TooManyRequestsException) as exc_info:
+        await hasher.check("secret123", "$2b$12$invalid")
+    assert exc_info.value.status == 429
+    assert exc_info.value.headers == {"Retry-After": "1"}
+    assert hasher.stats.rejected == 1
+
+    release.set()
+    await asyncio.gather(*running)
+    assert hasher.stats.in_flight == 0
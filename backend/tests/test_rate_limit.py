@@ -0,0 +1,159 @@
+"""Tests for the token-bucket rate limiting middleware."""
+
+import asyncio
+import math
+import os
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
+
+from app.core import rate_limit
+from app.core.config import get_settings
+from app.core.rate_limit import LocalBuckets, RateLimiter
+from app.core.security import create_access_token
+from app.main import app
+from app.models.user import User
+
+
+@pytest.fixture
+def redis_down(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def unavailable(*args, **kwargs):
+        raise RedisConnectionError("down")
+
+    monkeypatch.setattr(RateLimiter, "_take_redis", unavailable)
+
+
+@pytest.fixture
+async def live_redis(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[Redis]:
+    """A Redis server to run TOKEN_BUCKET_LUA on.
+
+    TEST_REDIS_URL names a server the test must reach; without it the app's
+    REDIS_URL is tried and the test is skipped if nothing answers there.
+    """
+    url = os.getenv("TEST_REDIS_URL")
+    client = Redis.from_url(
+        url or get_settings().redis_url, decode_responses=True, socket_connect_timeout=0.5,
+    )
+    try:
+        await client.ping()
+    except RedisError:
+        await client.aclose()
+        if url:
+            raise
+        pytest.skip("Redis is not available")
+
+    async def redis() -> Redis:
+        return client
+
+    monkeypatch.setattr(rate_limit, "get_redis", redis)
+    yield client
+    await client.aclose()
+
+
+async def test_redis_bucket_allows_denies_refills_and_expires(live_redis: Redis):
+    limiter = RateLimiter()
+    key = f"test:rate_limit:{uuid.uuid4().hex}"
+    capacity, rate = 2, 5.0
+    try:
+        assert await limiter._take_redis(key, capacity, rate) == (True, pytest.approx(1, abs=0.1))
+        assert (await limiter._take_redis(key, capacity, rate))[0] is True
+        allowed, tokens = await limiter._take_redis(key, capacity, rate)
+        assert allowed is False
+        assert tokens < 1
+
+        # The bucket only lives until it would be full again, plus a second
+        ttl = await live_redis.pttl(key)
+        assert 0 < ttl <= math.ceil((capacity - tokens) / rate * 1000) + 1000
+
+        await asyncio.sleep(1 / rate * 1.5)
+        assert (await limiter._take_redis(key, capacity, rate))[0] is True
+    finally:
+        await live_redis.delete(key)
+
+
+def test_local_bucket_refills_over_time(monkeypatch: pytest.MonkeyPatch):
+    clock = [100.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: clock[0])
+    buckets = LocalBuckets(max_size=10)
+    assert buckets.take("k", 2, 1.0) == (True, 1.0)
+    assert buckets.take("k", 2, 1.0) == (True, 0.0)
+    assert buckets.take("k", 2, 1.0) == (False, 0.0)
+    clock[0] += 1
+    assert buckets.take("k", 2, 1.0) == (True, 0.0)
+
+
+async def test_auth_is_limited_per_ip_with_standard_headers(
+    unauthed_client: AsyncClient, redis_down: None, monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(get_settings(), "rate_limit_auth_per_minute", 2)
+    for remaining in ("1", "0"):
+        response = await unauthed_client.post("/api/v1/auth/refresh", json={"refresh_token": "x"})
+        assert response.status_code == 401
+        assert response.headers["RateLimit-Limit"] == "2"
+        assert response.headers["RateLimit-Remaining"] == remaining
+
+    response = await unauthed_client.post(
+        "/api/v1/auth/login/admin", json={"username": "nobody", "password": "secret"},
+    )
+    assert response.status_code == 429
+    assert response.json()["type"] == "errors/too_many_requests"
+    assert response.headers["Retry-After"] == "30"
+    assert response.headers["RateLimit-Policy"] == "2;w=60"
+
+
+async def test_forwarded_clients_behind_one_proxy_are_limited_apart(
+    unauthed_client: AsyncClient, redis_down: None, monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(get_settings(), "rate_limit_auth_per_minute", 1)
+    # Both requests arrive from the test transport's peer, 127.0.0.1, a trusted proxy
+    for client_ip in ("198.51.100.1", "198.51.100.2"):
+        response = await unauthed_client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": "x"},
+            headers={"X-Forwarded-For": client_ip},
+        )
+        assert response.status_code == 401
+
+    response = await unauthed_client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": "x"},
+        headers={"X-Forwarded-For": "198.51.100.1"},
+    )
+    assert response.status_code == 429
+
+
+async def test_forwarded_for_from_untrusted_peer_is_ignored(
+    redis_down: None, monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(get_settings(), "rate_limit_auth_per_minute", 1)
+    transport = ASGITransport(app=app, client=("203.0.113.7", 40000))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for client_ip, status in (("198.51.100.3", 401), ("198.51.100.4", 429)):
+            response = await client.post(
+                "/api/v1/auth/refresh", json={"refresh_token": "x"},
+                headers={"X-Forwarded-For": client_ip},
+            )
+            assert response.status_code == status
+
+
+async def test_toggles_are_limited_per_user(
+    unauthed_client: AsyncClient, test_user: User, redis_down: None,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(get_settings(), "rate_limit_toggle_per_minute", 1)
+    path = "/api/v1/recipes/00000000-0000-0000-0000-000000000000/favorite"
+    first = {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+    other = {"Authorization": f"Bearer {create_access_token(test_user.id)}x"}
+
+    assert (await unauthed_client.post(path, headers=first)).status_code == 404
+    assert (await unauthed_client.post(path, headers=first)).status_code == 429
+    # An invalid token is limited by IP, in a separate bucket
+    assert (await unauthed_client.post(path, headers=other)).status_code == 401
+
+
+async def test_unlimited_routes_have_no_headers(client: AsyncClient):
+    response = await client.get("/health")
+    assert "RateLimit-Limit" not in response.headers
@@ -0,0 +1,66 @@
+"""Tests for the shared repository search helpers."""
+
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.dependencies import PaginationParams
+from app.models.recipe import Recipe
+from app.models.user import User
+from app.repositories.base import build_search_filter, build_search_rank
+from app.repositories.user import UserRepository
+from app.utils.translit import transliterate_sql
+from tests.factories.user import UserFactory
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_search_filter_matches_any_column():
+    sql = _sql(build_search_filter((User.username, User.first_name), "ann"))
+    assert "users.username ILIKE '%%ann%%'" in sql
+    assert "users.first_name ILIKE '%%ann%%'" in sql
+    assert " OR " in sql
+
+
+def test_search_rank_single_column_uses_similarity():
+    sql = _sql(build_search_rank((Recipe.title,), "борщ"))
+    assert sql.startswith("similarity(")
+    assert "greatest" not in sql
+
+
+def test_search_rank_takes_best_column():
+    sql = _sql(build_search_rank((User.username, User.last_name), "ann"))
+    assert sql.startswith("greatest(")
+    assert sql.count("similarity(") == 2
+
+
+def test_transliterate_sql_matches_slugify_mapping():
+    sql = _sql(transliterate_sql(Recipe.title))
+    assert "'щ', 'shch'" in sql
+    assert "'ь', ''" in sql
+    assert sql.startswith("translate(")
+
+
+async def test_search_matches_substrings_best_first(db_session: AsyncSession):
+    has_pg_trgm = await db_session.scalar(
+        text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+    )
+    if not has_pg_trgm:
+        pytest.skip("pg_trgm is not installed; similarity() is unavailable")
+
+    term = f"ann{uuid.uuid4().hex[:8]}"
+    exact, partial, other = (
+        UserFactory.build(username=username) for username in (term, f"jo{term}elle", "bob")
+    )
+    db_session.add_all([exact, partial, other])
+    await db_session.flush()
+
+    page = await UserRepository(db_session).list_admin(
+        PaginationParams(limit=20, offset=0), search=term,
+    )
+    assert [user.id for user in page.items] == [exact.id, partial.id]
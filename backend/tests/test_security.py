@@ -0,0 +1,78 @@
+"""Tests for the verified-token cache behind JWT decoding."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.core import security
+from app.core.exceptions import UnauthorizedException
+from app.core.security import (
+    create_access_token,
+    decode_claims,
+    decode_token,
+    decode_token_payload,
+    verified_tokens,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    verified_tokens.clear()
+    yield
+    verified_tokens.clear()
+
+
+@pytest.fixture
+def decodes(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    decode = security.jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_token_is_verified_once_for_all_decoders(decodes: list[str]):
+    user_id = uuid4()
+    token = create_access_token(user_id)
+    assert decode_token(token) == user_id
+    assert decode_token_payload(token)["sub"] == str(user_id)
+    assert decode_claims(token)["type"] == "access"
+    assert decodes == [token]
+
+
+def test_callers_cannot_alter_cached_claims():
+    token = create_access_token(uuid4())
+    decode_claims(token)["type"] = "refresh"
+    assert decode_claims(token)["type"] == "access"
+
+
+def test_entry_is_evicted_at_exp(decodes: list[str], monkeypatch: pytest.MonkeyPatch):
+    token = create_access_token(uuid4())
+    exp = decode_token_payload(token)["exp"]
+    assert len(verified_tokens) == 1
+
+    # At exp the token goes back through jwt.decode, which rejects expired tokens
+    monkeypatch.setattr(security.time, "time", lambda: exp)
+    assert verified_tokens.get(next(iter(verified_tokens._entries))) is None
+    assert len(verified_tokens) == 0
+    decode_token(token)
+    assert decodes == [token, token]
+
+
+def test_cache_is_bounded(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(verified_tokens, "max_size", 2)
+    tokens = [create_access_token(uuid4()) for _ in range(3)]
+    for token in tokens:
+        decode_token(token)
+    assert len(verified_tokens) == 2
+
+
+def test_tampered_token_is_not_served_from_cache():
+    token = create_access_token(uuid4())
+    decode_token(token)
+    with pytest.raises(UnauthorizedException):
+        decode_token(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))